@@ -0,0 +1,242 @@
+"""HTTP/1.1 vs HTTP/2 multiplexing benchmark for the httpx client.
+
+Starts a local server speaking both HTTP/1.1 and cleartext HTTP/2 (h2c with
+prior knowledge), fires the same concurrent workload through
+`HTTPXAsyncClient` with each protocol and reports throughput together with
+the number of sockets the server accepted.
+
+Requires `httpx` and `h2` (`pip install "unihttp[httpx,http2]"`).
+
+Usage:
+    python benchmarks/http2.py --requests 5000 --concurrency 500 --delay 0.005
+"""
+
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+from h2.config import H2Configuration
+from h2.connection import H2Connection
+from h2.events import ConnectionTerminated, RequestReceived
+from h2.settings import SettingCodes
+from unihttp.clients.connections import ConnectionStats
+from unihttp.clients.httpx import HTTPXAsyncClient
+from unihttp.method import BaseMethod
+
+PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+BODY = b'{"ok": true}'
+
+
+class _ServerProtocol(asyncio.Protocol):
+    """Minimal keep-alive HTTP/1.1 + h2c server answering every GET with BODY."""
+
+    def __init__(self, server: "LocalServer") -> None:
+        self.server = server
+        self.buffer = b""
+        self.h2: H2Connection | None = None
+        self.is_h1 = False
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport: Any = transport
+        self.server.connections += 1
+
+    def data_received(self, data: bytes) -> None:
+        if self.h2 is not None:
+            self._h2_received(data)
+            return
+        if self.is_h1:
+            self._h1_received(data)
+            return
+
+        self.buffer += data
+        if self.buffer.startswith(PREFACE):
+            self.h2 = H2Connection(H2Configuration(client_side=False))
+            self.h2.initiate_connection()
+            self.h2.update_settings(
+                {SettingCodes.MAX_CONCURRENT_STREAMS: self.server.max_streams},
+            )
+            data, self.buffer = self.buffer, b""
+            self._h2_received(data)
+        elif not PREFACE.startswith(self.buffer):
+            self.is_h1 = True
+            data, self.buffer = self.buffer, b""
+            self._h1_received(data)
+
+    def _h1_received(self, data: bytes) -> None:
+        self.buffer += data
+        while b"\r\n\r\n" in self.buffer:
+            _, self.buffer = self.buffer.split(b"\r\n\r\n", 1)
+            self._later(self._h1_respond)
+
+    def _h1_respond(self) -> None:
+        self.transport.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: application/json\r\n"
+            b"Content-Length: " + str(len(BODY)).encode() + b"\r\n\r\n" + BODY,
+        )
+
+    def _h2_received(self, data: bytes) -> None:
+        if self.h2 is None:
+            raise RuntimeError("HTTP/2 preface was not received")
+        for event in self.h2.receive_data(data):
+            if isinstance(event, RequestReceived):
+                self._later(self._h2_respond, event.stream_id)
+            elif isinstance(event, ConnectionTerminated):
+                self.transport.close()
+        self.transport.write(self.h2.data_to_send())
+
+    def _h2_respond(self, stream_id: int) -> None:
+        if self.h2 is None:
+            raise RuntimeError("HTTP/2 preface was not received")
+        self.h2.send_headers(
+            stream_id,
+            [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(BODY))),
+            ],
+        )
+        self.h2.send_data(stream_id, BODY, end_stream=True)
+        self.transport.write(self.h2.data_to_send())
+
+    def _later(self, callback: Any, *args: Any) -> None:
+        if self.server.delay:
+            asyncio.get_running_loop().call_later(self.server.delay, callback, *args)
+        else:
+            callback(*args)
+
+
+class LocalServer:
+    def __init__(self, delay: float, max_streams: int) -> None:
+        self.delay = delay
+        self.max_streams = max_streams
+        self.connections = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> str:
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(
+            lambda: _ServerProtocol(self),
+            "127.0.0.1",
+            0,
+            backlog=4096,
+        )
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+
+
+class Ping(BaseMethod[dict]):
+    __url__ = "/ping"
+    __method__ = "GET"
+
+
+class _Dumper:
+    def dump(self, obj: Any) -> Any:
+        return {}
+
+
+class _Loader:
+    def load(self, data: Any, tp: Any) -> Any:
+        return data
+
+
+@dataclass
+class Result:
+    protocol: str
+    requests: int
+    elapsed: float
+    sockets: int
+    streams_per_connection: float
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed
+
+
+async def run(
+    protocol: str,
+    requests: int,
+    concurrency: int,
+    delay: float,
+    max_streams: int,
+) -> Result:
+    server = LocalServer(delay=delay, max_streams=max_streams)
+    base_url = await server.start()
+
+    http2 = protocol == "HTTP/2"
+    session = httpx.AsyncClient(
+        http1=not http2,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=concurrency,
+            max_keepalive_connections=concurrency,
+        ),
+    )
+    client = HTTPXAsyncClient(base_url, _Dumper(), _Loader(), session=session)
+    client.connection_stats = stats = ConnectionStats()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            await client.call_method(Ping())
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    await client.close()
+    await server.stop()
+
+    return Result(
+        protocol=protocol,
+        requests=requests,
+        elapsed=elapsed,
+        sockets=server.connections,
+        streams_per_connection=stats.requests / max(stats.connections, 1),
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument(
+        "--delay",
+        type=float,
+        default=0.005,
+        help="simulated server latency in seconds",
+    )
+    parser.add_argument(
+        "--max-streams",
+        type=int,
+        default=1000,
+        help="SETTINGS_MAX_CONCURRENT_STREAMS advertised by the server",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'protocol':<10}{'req/s':>12}{'elapsed s':>12}{'sockets':>10}{'req/conn':>12}",
+    )
+    for protocol in ("HTTP/1.1", "HTTP/2"):
+        result = await run(
+            protocol,
+            requests=args.requests,
+            concurrency=args.concurrency,
+            delay=args.delay,
+            max_streams=args.max_streams,
+        )
+        print(
+            f"{result.protocol:<10}{result.throughput:>12.0f}{result.elapsed:>12.2f}"
+            f"{result.sockets:>10}{result.streams_per_connection:>12.1f}",
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+"""Import-time benchmark.
+
+Imports each module in a fresh interpreter under `python -X importtime` and
+reports the median cumulative import time of the module itself, followed by
+its slowest dependencies. `suite.py run` records these numbers alongside the
+throughput results so `suite.py compare` catches cold-start regressions.
+
+Usage:
+    python benchmarks/imports.py
+    python benchmarks/imports.py --modules unihttp,unihttp.clients.httpx --top 10
+"""
+
+import argparse
+import statistics
+import subprocess  # noqa: S404, runs the current interpreter only
+import sys
+
+MODULES = (
+    "unihttp",
+    "unihttp.middlewares",
+    "unihttp.serializers.adaptix",
+    "unihttp.clients.requests",
+    "unihttp.clients.httpx",
+    "unihttp.clients.aiohttp",
+)
+
+
+def importtime(module: str | None) -> list[tuple[str, int, int]]:
+    """Import `module` in a new interpreter, or only start it if None.
+
+    Returns:
+        `(module, self_us, cumulative_us)` for every module imported, in
+        the order reported by `-X importtime`.
+    """
+    code = "pass" if module is None else f"import {module}"
+    # The command is sys.executable with fixed module names.
+    stderr = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue  # header line
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def import_time_us(module: str, repeat: int = 5) -> int:
+    """Median cumulative import time of `module`, in microseconds."""
+    samples = []
+    for _ in range(repeat):
+        entries = importtime(module)
+        samples.append(next(cum for name, _, cum in entries if name == module))
+    return int(statistics.median(samples))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", default=",".join(MODULES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="slowest dependencies shown")
+    args = parser.parse_args()
+
+    startup = {name for name, _, _ in importtime(None)}
+    for module in args.modules.split(","):
+        total = import_time_us(module, args.repeat)
+        print(f"{module:<34}{total / 1000:>9.1f} ms")
+        slowest = sorted(
+            (entry for entry in importtime(module) if entry[0] not in startup),
+            key=lambda entry: -entry[1],
+        )
+        for name, self_us, _ in slowest[: args.top]:
+            print(f"    {name:<30}{self_us / 1000:>9.1f} ms self")
+
+
+if __name__ == "__main__":
+    main()
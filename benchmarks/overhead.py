@@ -0,0 +1,285 @@
+"""Framework overhead micro-benchmarks.
+
+Measures what unihttp itself costs per call, isolated from the network:
+every request dumper, `build_http_request`, response loaders,
+`MethodBinder` binding, middleware dispatch and the full `call_method`
+pipeline over an in-memory transport that answers with canned JSON bytes.
+The methods use every marker type (`Path`, `Query`, `Header`, `Body`,
+`Form`, `File`).
+
+For each operation the best of several timed rounds is reported in ns per
+operation, together with the `tracemalloc` peak of a single operation, i.e.
+the memory it allocates at most at once.
+
+Usage:
+    python benchmarks/overhead.py
+    python benchmarks/overhead.py --filter msgspec --rounds 7 --json overhead.json
+"""
+
+import argparse
+import gc
+import json
+import pathlib
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import msgspec
+import pydantic
+from unihttp.bind_method import bind_method
+from unihttp.clients.base import BaseSyncClient
+from unihttp.http import UploadFile
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+from unihttp.markers import Body, File, Form, Header, Path, Query
+from unihttp.method import BaseMethod
+from unihttp.middlewares.base import Handler, Middleware
+from unihttp.serializers.adaptix import DEFAULT_RETORT
+from unihttp.serializers.msgspec import MsgspecDumper, MsgspecLoader
+from unihttp.serializers.pydantic import PydanticDumper, PydanticLoader
+
+USER_JSON = (
+    b'{"id": 42, "name": "Alice", "email": "alice@example.com",'
+    b' "address": {"street": "1 Main St", "city": "Springfield", "zip": "12345"},'
+    b' "tags": ["admin", "beta", "staff"]}'
+)
+
+
+@dataclass
+class AdaptixAddress:
+    street: str
+    city: str
+    zip: str
+
+
+@dataclass
+class AdaptixUser:
+    id: int
+    name: str
+    email: str
+    address: AdaptixAddress
+    tags: list[str]
+
+
+class PydanticAddress(pydantic.BaseModel):
+    street: str
+    city: str
+    zip: str
+
+
+class PydanticUser(pydantic.BaseModel):
+    id: int
+    name: str
+    email: str
+    address: PydanticAddress
+    tags: list[str]
+
+
+class MsgspecAddress(msgspec.Struct):
+    street: str
+    city: str
+    zip: str
+
+
+class MsgspecUser(msgspec.Struct):
+    id: int
+    name: str
+    email: str
+    address: MsgspecAddress
+    tags: list[str]
+
+
+@dataclass(frozen=True)
+class Flavor:
+    """Models and serializers of one serialization backend."""
+
+    address: type
+    user: type
+    dumper: Any
+    loader: Any
+
+
+FLAVORS = {
+    "adaptix": Flavor(AdaptixAddress, AdaptixUser, DEFAULT_RETORT, DEFAULT_RETORT),
+    "pydantic": Flavor(PydanticAddress, PydanticUser, PydanticDumper(), PydanticLoader()),
+    "msgspec": Flavor(MsgspecAddress, MsgspecUser, MsgspecDumper(), MsgspecLoader()),
+}
+
+
+def make_methods(flavor: Flavor) -> tuple[type[BaseMethod[Any]], type[BaseMethod[Any]]]:
+    address_tp, user_tp = flavor.address, flavor.user
+
+    @dataclass
+    class UpdateUser(BaseMethod[user_tp]):  # type: ignore[valid-type]
+        __url__ = "/orgs/{org}/users/{user_id}"
+        __method__ = "PUT"
+
+        org: Path[str]
+        user_id: Path[int]
+        name: Body[str]
+        email: Body[str]
+        address: Body[address_tp]  # type: ignore[valid-type]
+        tags: Body[list[str]]
+        notify: Query[bool] = False
+        fields: Query[str] = "id,name"
+        idempotency_key: Header[str] = "3f2b9c"
+
+    @dataclass
+    class UploadAvatar(BaseMethod[user_tp]):  # type: ignore[valid-type]
+        __url__ = "/users/{user_id}/avatar"
+        __method__ = "POST"
+
+        user_id: Path[int]
+        avatar: File[UploadFile]
+        caption: Form[str] = ""
+
+    return UpdateUser, UploadAvatar
+
+
+def make_update(flavor: Flavor, method_tp: type[BaseMethod[Any]]) -> BaseMethod[Any]:
+    return method_tp(
+        org="acme",
+        user_id=42,
+        name="Alice",
+        email="alice@example.com",
+        address=flavor.address(street="1 Main St", city="Springfield", zip="12345"),
+        tags=["admin", "beta", "staff"],
+        notify=True,
+    )
+
+
+class InMemoryClient(BaseSyncClient):
+    """Answers every request with canned JSON, decoded like a real backend."""
+
+    def make_request(self, request: HTTPRequest) -> HTTPResponse:
+        request = self.encode_request(request)
+        return HTTPResponse(
+            status_code=200,
+            headers={"Content-Type": "application/json"},
+            data=self.decode_content(request, USER_JSON),
+            cookies={},
+            raw_response=None,
+            content=USER_JSON,
+        )
+
+
+class PassThrough(Middleware):
+    def handle(self, request: HTTPRequest, next_handler: Handler) -> HTTPResponse:
+        return next_handler(request)
+
+
+@dataclass
+class Measurement:
+    name: str
+    ns_per_op: float
+    peak_bytes: int
+
+
+def measure(
+    name: str, op: Callable[[], Any], rounds: int, min_time: float
+) -> Measurement:
+    op()  # warm caches
+
+    number = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            op()
+        if time.perf_counter_ns() - start >= min_time * 1e9 / 10:
+            break
+        number *= 2
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        best = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter_ns()
+            for _ in range(number):
+                op()
+            best = min(best, (time.perf_counter_ns() - start) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    op()
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+
+    return Measurement(name, best, peak)
+
+
+def operations() -> dict[str, Callable[[], Any]]:
+    ops: dict[str, Callable[[], Any]] = {}
+    user_data = json.loads(USER_JSON)
+
+    for name, flavor in FLAVORS.items():
+        update_tp, upload_tp = make_methods(flavor)
+        update = make_update(flavor, update_tp)
+        upload = upload_tp(user_id=42, avatar=UploadFile(b"\x89PNG" * 64, "a.png"))
+
+        class Client(InMemoryClient):
+            update_user = bind_method(update_tp)
+
+        client = Client("http://test", flavor.dumper, flavor.loader)
+
+        ops[f"dump/{name}/update"] = lambda f=flavor, m=update: f.dumper.dump(m)
+        ops[f"dump/{name}/upload"] = lambda f=flavor, m=upload: f.dumper.dump(m)
+        ops[f"build_http_request/{name}"] = (
+            lambda f=flavor, m=update: m.build_http_request(f.dumper)
+        )
+        ops[f"load/{name}"] = lambda f=flavor, t=flavor.user: f.loader.load(user_data, t)
+        ops[f"call_method/{name}"] = lambda c=client, m=update: c.call_method(m)
+
+        if name == "adaptix":
+            ops["bind_method/get"] = lambda c=client: c.update_user
+            ops["bind_method/call"] = lambda c=client, f=flavor: c.update_user(
+                org="acme",
+                user_id=42,
+                name="Alice",
+                email="alice@example.com",
+                address=f.address(street="1 Main St", city="Springfield", zip="12345"),
+                tags=["admin"],
+            )
+            for depth in (0, 3, 10):
+                chained = InMemoryClient(
+                    "http://test",
+                    flavor.dumper,
+                    flavor.loader,
+                    middleware=[PassThrough() for _ in range(depth)],
+                )
+                ops[f"middleware/{depth}"] = lambda c=chained, m=update: c.call_method(m)
+
+    return ops
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="only run matching operations")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per round")
+    parser.add_argument("--json", help="write results to this JSON file")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'operation':<34}{'ns/op':>12}{'peak B/op':>12}")
+    for name, op in operations().items():
+        if args.filter not in name:
+            continue
+        result = measure(name, op, args.rounds, args.min_time)
+        results.append(result)
+        print(f"{result.name:<34}{result.ns_per_op:>12.0f}{result.peak_bytes:>12}")
+
+    if args.json:
+        # `Path` is the unihttp marker here.
+        with pathlib.Path(args.json).open("w", encoding="utf-8") as f:
+            json.dump([vars(r) for r in results], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark server.
+
+A minimal aiohttp app echoing JSON item lists back to the client. It runs
+in a separate process so that client CPU measurements are not mixed with
+server work.
+
+Usage:
+    python benchmarks/server.py --port 8080
+"""
+
+import argparse
+import multiprocessing
+import socket
+import time
+
+from aiohttp import web
+
+
+async def echo_items(request: web.Request) -> web.Response:
+    body = await request.read()
+    return web.Response(body=body, content_type="application/json")
+
+
+def make_app() -> web.Application:
+    app = web.Application()
+    app.router.add_post("/items", echo_items)
+    return app
+
+
+def serve(port: int) -> None:
+    web.run_app(make_app(), host="127.0.0.1", port=port, print=None, access_log=None)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def start_in_background(port: int | None = None) -> tuple[str, multiprocessing.Process]:
+    """Start the server in a child process and wait until it accepts connections.
+
+    Returns:
+        The base URL and the server process; terminate it when done.
+    """
+    port = port or free_port()
+    process = multiprocessing.get_context("spawn").Process(
+        target=serve,
+        args=(port,),
+        daemon=True,
+    )
+    process.start()
+
+    deadline = time.monotonic() + 10
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            break
+        except OSError:
+            if time.monotonic() > deadline or not process.is_alive():
+                process.terminate()
+                raise RuntimeError("Benchmark server did not start") from None
+            time.sleep(0.05)
+
+    return f"http://127.0.0.1:{port}", process
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8080)
+    serve(parser.parse_args().port)
@@ -0,0 +1,386 @@
+r"""Backend and serializer benchmark suite.
+
+Runs the same closed-loop workload through every combination of async
+backend, serializer, payload size and concurrency against the local
+benchmark server (`benchmarks/server.py`, started in a child process), and
+writes the results as JSON. Each call POSTs a list of items which the
+server echoes back, so request dumping, transport, JSON decoding and
+response loading are all exercised.
+
+Measured per scenario: throughput, latency percentiles, client CPU time
+per request (`time.process_time`) and peak traced memory of a short
+`tracemalloc` pass. The import time of the main modules is recorded as
+well (see `benchmarks/imports.py`).
+
+Usage:
+    python benchmarks/suite.py run --output results.json
+    python benchmarks/suite.py run --backends httpx,aiohttp --serializers msgspec \
+        --payloads large --concurrency 1,50 --requests 5000 --output new.json
+    python benchmarks/suite.py compare results.json new.json --threshold 0.1
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import importlib
+import json
+import platform
+import subprocess  # noqa: S404, only runs git to record the commit
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import msgspec
+import pydantic
+from imports import MODULES, import_time_us
+from server import start_in_background
+from unihttp.clients.base import BaseAsyncClient
+from unihttp.clients.pool import PoolConfig
+from unihttp.markers import Body
+from unihttp.method import BaseMethod
+from unihttp.serializers.adaptix import DEFAULT_RETORT
+from unihttp.serializers.msgspec import MsgspecDumper, MsgspecLoader
+from unihttp.serializers.pydantic import PydanticDumper, PydanticLoader
+
+BACKENDS = {
+    "httpx": ("unihttp.clients.httpx", "HTTPXAsyncClient"),
+    "aiohttp": ("unihttp.clients.aiohttp", "AiohttpAsyncClient"),
+    "niquests": ("unihttp.clients.niquests", "NiquestsAsyncClient"),
+    "zapros": ("unihttp.clients.zapros", "ZaprosAsyncClient"),
+}
+PAYLOADS = {"small": 1, "large": 500}
+MEMORY_REQUESTS = 200
+
+
+@dataclass
+class AdaptixItem:
+    id: int
+    name: str
+    price: float
+    tags: list[str]
+
+
+class PydanticItem(pydantic.BaseModel):
+    id: int
+    name: str
+    price: float
+    tags: list[str]
+
+
+class MsgspecItem(msgspec.Struct):
+    id: int
+    name: str
+    price: float
+    tags: list[str]
+
+
+def make_method(item_type: type) -> type[BaseMethod[Any]]:
+    @dataclass
+    class EchoItems(BaseMethod[dict[str, list[item_type]]]):  # type: ignore[valid-type]
+        __url__ = "/items"
+        __method__ = "POST"
+
+        items: Body[list[item_type]]  # type: ignore[valid-type]
+
+    return EchoItems
+
+
+@dataclass(frozen=True)
+class Serializer:
+    item_type: type
+    dumper: Callable[[], Any]
+    loader: Callable[[], Any]
+
+
+SERIALIZERS = {
+    "adaptix": Serializer(AdaptixItem, lambda: DEFAULT_RETORT, lambda: DEFAULT_RETORT),
+    "pydantic": Serializer(PydanticItem, PydanticDumper, PydanticLoader),
+    "msgspec": Serializer(MsgspecItem, MsgspecDumper, MsgspecLoader),
+}
+
+
+@dataclass
+class Result:
+    backend: str
+    serializer: str
+    payload: str
+    concurrency: int
+    requests: int
+    errors: int
+    throughput: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+    cpu_us_per_request: float
+    peak_memory_kib: float
+
+    @property
+    def key(self) -> tuple[str, str, str, int]:
+        return self.backend, self.serializer, self.payload, self.concurrency
+
+
+def percentile(sorted_values: list[int], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * percent / 100))
+    return sorted_values[index] / 1e6
+
+
+async def drive(
+    client: BaseAsyncClient,
+    method: BaseMethod[Any],
+    requests: int,
+    concurrency: int,
+) -> tuple[list[int], int]:
+    """Send `requests` calls from `concurrency` closed-loop workers."""
+    latencies: list[int] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter_ns()
+            try:
+                await client.call_method(method)
+            except Exception as e:
+                if not errors:
+                    print(f"first error: {e!r}", file=sys.stderr)
+                errors += 1
+            else:
+                latencies.append(time.perf_counter_ns() - start)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors
+
+
+async def run_scenario(
+    base_url: str,
+    backend: str,
+    serializer_name: str,
+    payload: str,
+    concurrency: int,
+    requests: int,
+) -> Result:
+    module, class_name = BACKENDS[backend]
+    client_cls = getattr(importlib.import_module(module), class_name)
+    serializer = SERIALIZERS[serializer_name]
+
+    client = client_cls(
+        base_url,
+        serializer.dumper(),
+        serializer.loader(),
+        pool=PoolConfig(max_connections=concurrency),
+    )
+    item = serializer.item_type(id=1, name="benchmark item", price=9.99, tags=["a", "b"])
+    method = make_method(serializer.item_type)(items=[item] * PAYLOADS[payload])
+
+    try:
+        await drive(client, method, concurrency * 2, concurrency)
+
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        latencies, errors = await drive(client, method, requests, concurrency)
+        elapsed = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+
+        tracemalloc.start()
+        await drive(client, method, min(requests, MEMORY_REQUESTS), concurrency)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    finally:
+        await client.close()
+
+    latencies.sort()
+    return Result(
+        backend=backend,
+        serializer=serializer_name,
+        payload=payload,
+        concurrency=concurrency,
+        requests=requests,
+        errors=errors,
+        throughput=len(latencies) / elapsed,
+        p50_ms=percentile(latencies, 50),
+        p90_ms=percentile(latencies, 90),
+        p99_ms=percentile(latencies, 99),
+        max_ms=latencies[-1] / 1e6 if latencies else 0.0,
+        cpu_us_per_request=cpu / requests * 1e6,
+        peak_memory_kib=peak / 1024,
+    )
+
+
+def metadata() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607, git from PATH
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def print_table(results: list[Result]) -> None:
+    print(
+        f"{'backend':<10}{'serializer':<11}{'payload':<8}{'conc':>5}{'req/s':>10}"
+        f"{'p50 ms':>9}{'p99 ms':>9}{'cpu us':>9}{'mem KiB':>10}{'err':>5}",
+    )
+    for r in results:
+        print(
+            f"{r.backend:<10}{r.serializer:<11}{r.payload:<8}{r.concurrency:>5}"
+            f"{r.throughput:>10.0f}{r.p50_ms:>9.2f}{r.p99_ms:>9.2f}"
+            f"{r.cpu_us_per_request:>9.0f}{r.peak_memory_kib:>10.0f}{r.errors:>5}",
+        )
+
+
+async def run(args: argparse.Namespace) -> None:
+    if args.url is None:
+        base_url, server = start_in_background()
+    else:
+        base_url, server = args.url, None
+
+    results = []
+    try:
+        for backend in args.backends.split(","):
+            for serializer in args.serializers.split(","):
+                for payload in args.payloads.split(","):
+                    for concurrency in map(int, args.concurrency.split(",")):
+                        result = await run_scenario(
+                            base_url,
+                            backend,
+                            serializer,
+                            payload,
+                            concurrency,
+                            args.requests,
+                        )
+                        results.append(result)
+                        print_table([result])
+    finally:
+        if server is not None:
+            server.terminate()
+
+    imports = {}
+    if not args.skip_imports:
+        for module in MODULES:
+            imports[module] = import_time_us(module)
+            print(f"import {module:<34}{imports[module] / 1000:>9.1f} ms")
+
+    if args.output:
+        with Path(args.output).open("w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "meta": metadata(),
+                    "results": [dataclasses.asdict(r) for r in results],
+                    "imports_us": imports,
+                },
+                f,
+                indent=2,
+            )
+
+
+def load_results(path: str) -> dict[tuple[str, str, str, int], Result]:
+    with Path(path).open(encoding="utf-8") as f:
+        data = json.load(f)
+    results = (Result(**raw) for raw in data["results"])
+    return {result.key: result for result in results}
+
+
+def load_imports(path: str) -> dict[str, int]:
+    with Path(path).open(encoding="utf-8") as f:
+        return json.load(f).get("imports_us", {})
+
+
+def change(old: float, new: float) -> float:
+    return (new - old) / old if old else 0.0
+
+
+def compare(args: argparse.Namespace) -> int:
+    """Print relative changes; return 1 if any scenario regressed."""
+    base = load_results(args.base)
+    new = load_results(args.new)
+
+    print(
+        f"{'backend':<10}{'serializer':<11}{'payload':<8}{'conc':>5}"
+        f"{'req/s':>9}{'p99':>9}{'cpu':>9}",
+    )
+    regressed = False
+    for key in sorted(base.keys() & new.keys()):
+        old, cur = base[key], new[key]
+        throughput = change(old.throughput, cur.throughput)
+        p99 = change(old.p99_ms, cur.p99_ms)
+        cpu = change(old.cpu_us_per_request, cur.cpu_us_per_request)
+        worse = (
+            throughput < -args.threshold or p99 > args.threshold or cpu > args.threshold
+        )
+        regressed |= worse
+        backend, serializer, payload, concurrency = key
+        print(
+            f"{backend:<10}{serializer:<11}{payload:<8}{concurrency:>5}"
+            f"{throughput:>+9.1%}{p99:>+9.1%}{cpu:>+9.1%}"
+            f"{'  REGRESSION' if worse else ''}",
+        )
+
+    for key in sorted(base.keys() ^ new.keys()):
+        print(f"only in {'base' if key in base else 'new'}: {key}")
+
+    base_imports, new_imports = load_imports(args.base), load_imports(args.new)
+    for module in sorted(base_imports.keys() & new_imports.keys()):
+        slower = change(base_imports[module], new_imports[module])
+        worse = slower > args.threshold
+        regressed |= worse
+        print(
+            f"import {module:<34}{slower:>+9.1%}{'  REGRESSION' if worse else ''}",
+        )
+    return int(regressed)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--backends", default=",".join(BACKENDS))
+    run_parser.add_argument("--serializers", default=",".join(SERIALIZERS))
+    run_parser.add_argument("--payloads", default=",".join(PAYLOADS))
+    run_parser.add_argument("--concurrency", default="1,10,100")
+    run_parser.add_argument("--requests", type=int, default=2000)
+    run_parser.add_argument("--url", help="use a running benchmark server")
+    run_parser.add_argument("--output", help="write results to this JSON file")
+    run_parser.add_argument(
+        "--skip-imports", action="store_true", help="do not measure import times"
+    )
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative change counted as a regression",
+    )
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        return compare(args)
+
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
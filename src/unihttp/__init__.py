@@ -0,0 +1,68 @@
+from typing import TYPE_CHECKING
+
+from unihttp.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from unihttp.bind_method import bind_method
+    from unihttp.exceptions import (
+        ClientError,
+        HTTPStatusError,
+        NetworkError,
+        RequestTimeoutError,
+        ServerError,
+        UniHTTPError,
+    )
+    from unihttp.http import HTTPRequest, HTTPResponse, UploadFile
+    from unihttp.markers import Body, File, Form, Header, Path, Query
+    from unihttp.method import BaseMethod
+    from unihttp.omitted import Omittable, Omitted
+    from unihttp.timeouts import timeout
+
+__all__ = [
+    "BaseMethod",
+    "Body",
+    "ClientError",
+    "File",
+    "Form",
+    "HTTPRequest",
+    "HTTPResponse",
+    "HTTPStatusError",
+    "Header",
+    "NetworkError",
+    "Omittable",
+    "Omitted",
+    "Path",
+    "Query",
+    "RequestTimeoutError",
+    "ServerError",
+    "UniHTTPError",
+    "UploadFile",
+    "bind_method",
+    "timeout",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaseMethod": ".method",
+        "Body": ".markers",
+        "ClientError": ".exceptions",
+        "File": ".markers",
+        "Form": ".markers",
+        "HTTPRequest": ".http",
+        "HTTPResponse": ".http",
+        "HTTPStatusError": ".exceptions",
+        "Header": ".markers",
+        "NetworkError": ".exceptions",
+        "Omittable": ".omitted",
+        "Omitted": ".omitted",
+        "Path": ".markers",
+        "Query": ".markers",
+        "RequestTimeoutError": ".exceptions",
+        "ServerError": ".exceptions",
+        "UniHTTPError": ".exceptions",
+        "UploadFile": ".http",
+        "bind_method": ".bind_method",
+        "timeout": ".timeouts",
+    },
+)
@@ -22,6 +22,11 @@ class MethodBinder(Generic[MethodParamSpec, MethodResultT]):  # noqa: UP046
     ) -> None:
         self._method_tp = method_tp
 
+    @property
+    def method_type(self) -> Callable[MethodParamSpec, BaseMethod[MethodResultT]]:
+        """The method class (or factory) called by the bound function."""
+        return self._method_tp
+
     @overload
     def __get__(
         self,
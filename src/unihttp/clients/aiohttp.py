@@ -1,18 +1,77 @@
 import json
 from collections.abc import Callable
+from time import perf_counter_ns
 from typing import Any
 from urllib.parse import urljoin
 
 import aiohttp
-from aiohttp import ClientSession, FormData
+from aiohttp import (
+    ClientSession,
+    FormData,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionReuseconnParams,
+    TraceRequestEndParams,
+)
 
 from unihttp.clients.base import BaseAsyncClient
+from unihttp.clients.pool import PoolConfig, check_session_and_pool, session_property
 from unihttp.exceptions import NetworkError, RequestTimeoutError
 from unihttp.http import UploadFile
 from unihttp.http.request import HTTPRequest
 from unihttp.http.response import HTTPResponse
 from unihttp.middlewares.base import AsyncMiddleware
 from unihttp.serialize import RequestDumper, ResponseLoader
+from unihttp.timeouts import remaining
+from unihttp.tracing.tracer import Tracer
+
+
+def _make_connector(pool: PoolConfig) -> TCPConnector:
+    """Translate a `PoolConfig` into an `aiohttp` connector."""
+    return TCPConnector(
+        limit=pool.max_connections,
+        limit_per_host=pool.max_connections_per_host or 0,
+        keepalive_timeout=pool.keepalive_expiry,
+    )
+
+
+async def _on_connection_created(  # noqa: RUF029, aiohttp requires coroutines
+    session: ClientSession, context: Any, params: TraceConnectionCreateEndParams
+) -> None:
+    if context.trace_request_ctx is not None:
+        tracer, request = context.trace_request_ctx
+        tracer.on_connection_acquired(request, False)
+
+
+async def _on_connection_reused(  # noqa: RUF029, aiohttp requires coroutines
+    session: ClientSession, context: Any, params: TraceConnectionReuseconnParams
+) -> None:
+    if context.trace_request_ctx is not None:
+        tracer, request = context.trace_request_ctx
+        tracer.on_connection_acquired(request, True)
+
+
+async def _on_request_end(  # noqa: RUF029, aiohttp requires coroutines
+    session: ClientSession, context: Any, params: TraceRequestEndParams
+) -> None:
+    if context.trace_request_ctx is not None:
+        tracer, request = context.trace_request_ctx
+        tracer.on_headers_received(request)
+
+
+def trace_config() -> TraceConfig:
+    """Return a `TraceConfig` forwarding aiohttp events to the client `tracer`.
+
+    Sessions created by `AiohttpAsyncClient` include it. Pass it to your own
+    session, `ClientSession(trace_configs=[trace_config()])`, to receive
+    connection and header events for it as well.
+    """
+    config = TraceConfig()
+    config.on_connection_create_end.append(_on_connection_created)
+    config.on_connection_reuseconn.append(_on_connection_reused)
+    config.on_request_end.append(_on_request_end)
+    return config
 
 
 class AiohttpAsyncClient(BaseAsyncClient):
@@ -25,6 +84,8 @@ class AiohttpAsyncClient(BaseAsyncClient):
         session: ClientSession | None = None,
         json_dumps: Callable[[Any], str] = json.dumps,
         json_loads: Callable[[str | bytes | bytearray], Any] = json.loads,
+        *,
+        pool: PoolConfig | None = None,
     ):
         super().__init__(
             base_url=base_url,
@@ -35,10 +96,24 @@ class AiohttpAsyncClient(BaseAsyncClient):
             json_loads=json_loads,
         )
 
-        if session is None:
-            session = ClientSession()
+        check_session_and_pool(session, pool)
+        self._pool = pool
+        if session is not None:
+            self._session = session
+
+    @session_property
+    def _session(self) -> ClientSession:
+        """Session created on first use when none was passed."""
+        return ClientSession(
+            connector=None if self._pool is None else _make_connector(self._pool),
+            trace_configs=[trace_config()],
+        )
 
-        self._session = session
+    def _trace_context(self, request: HTTPRequest) -> tuple[Tracer, HTTPRequest] | None:
+        """Context handed to the `trace_config` callbacks of this request."""
+        if self.tracer is None:
+            return None
+        return self.tracer, request
 
     def _build_form_data(self, request: HTTPRequest) -> FormData:
         """Build FormData from request form and files."""
@@ -71,37 +146,35 @@ class AiohttpAsyncClient(BaseAsyncClient):
         return form_data
 
     async def make_request(self, request: HTTPRequest) -> HTTPResponse:
-        data: FormData | str | None = None
+        request = self.encode_request(request)
+        timeout = remaining(request.deadline)
+
+        data: FormData | bytes | None = request.content
 
         if request.form or request.file:
             data = self._build_form_data(request)
 
-        if request.body:
-            if request.form or request.file:
-                raise ValueError(
-                    "Cannot use Body with Form or File. "
-                    "Use Form for fields in multipart requests."
-                )
-
-            data = self.json_dumps(request.body)
-            if "Content-Type" not in request.header:
-                request.header["Content-Type"] = "application/json"
-
         try:
             async with self._session.request(
                 method=request.method,
                 url=urljoin(self.base_url, request.url),
-                headers=request.header,
+                headers=self.build_headers(request),
                 params=request.query,
                 data=data,
+                timeout=(
+                    self._session.timeout
+                    if timeout is None
+                    else aiohttp.ClientTimeout(total=timeout)
+                ),
+                trace_request_ctx=self._trace_context(request),
             ) as response:
-                response_data: Any = None
+                timings = request.timings
+                read_start = perf_counter_ns() if timings is not None else 0
                 content = await response.read()
-                if content:
-                    try:
-                        response_data = self.json_loads(content)
-                    except (ValueError, TypeError):
-                        response_data = content
+                if timings is not None:
+                    timings.body_read_ns += perf_counter_ns() - read_start
+
+                response_data = self.decode_content(request, content)
 
                 return HTTPResponse(
                     status_code=response.status,
@@ -109,6 +182,7 @@ class AiohttpAsyncClient(BaseAsyncClient):
                     cookies=response.cookies,
                     data=response_data,
                     raw_response=response,
+                    content=content,
                 )
         except aiohttp.ClientConnectionError as e:
             raise NetworkError(str(e)) from e
@@ -116,4 +190,5 @@ class AiohttpAsyncClient(BaseAsyncClient):
             raise RequestTimeoutError(str(e)) from e
 
     async def close(self) -> None:
-        await self._session.close()
+        if "_session" in self.__dict__:
+            await self._session.close()
@@ -0,0 +1,157 @@
+import asyncio
+import json
+from collections.abc import Awaitable, Callable, MutableMapping
+from typing import Any
+
+from unihttp.clients.base import BaseAsyncClient
+from unihttp.clients.inprocess import build_target, encode_body, parse_headers
+from unihttp.exceptions import RequestTimeoutError
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+from unihttp.middlewares.base import AsyncMiddleware
+from unihttp.serialize import RequestDumper, ResponseLoader
+from unihttp.timeouts import remaining
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+class ASGIAsyncClient(BaseAsyncClient):
+    """Asynchronous client calling an ASGI application in-process.
+
+    Requests are passed straight to `app` without opening sockets. Bodies,
+    query strings and uploads are encoded and responses decoded exactly as
+    by the network backends, which makes the client a drop-in replacement
+    in tests and benchmarks. Lifespan events are not sent to the app.
+
+    Example:
+        >>> client = ASGIAsyncClient(
+        ...     "http://testserver", dumper, loader, app=starlette_app
+        ... )
+
+    Attributes:
+        app: The ASGI application requests are dispatched to.
+        raise_app_exceptions: Re-raise exceptions escaping the app. When
+                              disabled they are turned into an empty 500
+                              response, as a server would do.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        request_dumper: RequestDumper,
+        response_loader: ResponseLoader,
+        middleware: list[AsyncMiddleware] | None = None,
+        *,
+        app: ASGIApp,
+        raise_app_exceptions: bool = True,
+        json_dumps: Callable[[Any], str] = json.dumps,
+        json_loads: Callable[[str | bytes | bytearray], Any] = json.loads,
+    ):
+        super().__init__(
+            base_url=base_url,
+            request_dumper=request_dumper,
+            response_loader=response_loader,
+            middleware=middleware,
+            json_dumps=json_dumps,
+            json_loads=json_loads,
+        )
+        self.app = app
+        self.raise_app_exceptions = raise_app_exceptions
+
+    def _build_scope(
+        self, request: HTTPRequest, body: bytes, content_type: str | None
+    ) -> Scope:
+        target = build_target(self.base_url, request)
+        headers = self.build_headers(request)
+        if content_type is not None and "Content-Type" not in headers:
+            headers = {**headers, "Content-Type": content_type}
+
+        raw_headers = [(b"host", target.host.encode())]
+        raw_headers += [(k.lower().encode(), str(v).encode()) for k, v in headers.items()]
+        if body:
+            raw_headers.append((b"content-length", str(len(body)).encode()))
+
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": request.method.upper(),
+            "scheme": target.scheme,
+            "path": target.path,
+            "raw_path": target.raw_path.encode(),
+            "query_string": target.query_string.encode(),
+            "root_path": "",
+            "headers": raw_headers,
+            "client": ("127.0.0.1", 0),
+            "server": (target.host, target.port),
+        }
+
+    async def _dispatch(self, request: HTTPRequest) -> tuple[int, list[Any], bytes]:
+        body, content_type = encode_body(request)
+        scope = self._build_scope(request, body, content_type)
+
+        request_sent = False
+        response_complete = asyncio.Event()
+        status = 500
+        raw_headers: list[Any] = []
+        chunks: list[bytes] = []
+
+        async def receive() -> Message:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await response_complete.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Message) -> None:  # noqa: RUF029, ASGI requires a coroutine
+            nonlocal status, raw_headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                raw_headers = list(message.get("headers", []))
+                if self.tracer is not None:
+                    self.tracer.on_headers_received(request)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response_complete.set()
+
+        try:
+            await self.app(scope, receive, send)
+        except Exception:
+            if self.raise_app_exceptions:
+                raise
+            status, raw_headers, chunks = 500, [], []
+        finally:
+            response_complete.set()
+
+        return status, raw_headers, b"".join(chunks)
+
+    async def make_request(self, request: HTTPRequest) -> HTTPResponse:
+        request = self.encode_request(request)
+        timeout = remaining(request.deadline)
+
+        try:
+            async with asyncio.timeout(timeout):
+                status, raw_headers, content = await self._dispatch(request)
+        except TimeoutError as e:
+            raise RequestTimeoutError(str(e)) from e
+
+        headers, cookies = parse_headers(
+            (name.decode("latin-1"), value.decode("latin-1"))
+            for name, value in raw_headers
+        )
+        response_data = self.decode_content(request, content)
+
+        return HTTPResponse(
+            status_code=status,
+            headers=headers,
+            cookies=cookies,
+            data=response_data,
+            raw_response=None,
+            content=content,
+        )
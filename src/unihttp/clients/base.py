@@ -1,13 +1,80 @@
 import functools
 import json
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, replace
 from typing import Any
 
+from unihttp.bind_method import MethodBinder
 from unihttp.http.request import HTTPRequest
 from unihttp.http.response import HTTPResponse
 from unihttp.method import BaseMethod, ResponseType
 from unihttp.middlewares.base import AsyncMiddleware, Middleware
 from unihttp.serialize import RequestDumper, ResponseLoader
+from unihttp.timings import CallTimings
+from unihttp.tracing.tracer import Tracer
+
+
+@dataclass(frozen=True, slots=True)
+class WarmupResult:
+    """Outcome of `warmup`.
+
+    Attributes:
+        established: Number of connections that completed a request.
+        failed: Number of connection attempts that raised.
+        elapsed: Wall time of the warmup in seconds.
+    """
+
+    established: int
+    failed: int
+    elapsed: float
+
+
+@dataclass(frozen=True, slots=True)
+class PrecompileResult:
+    """Outcome of `precompile`.
+
+    Attributes:
+        timings: Seconds spent compiling each method class, slowest first.
+        elapsed: Wall time of the whole precompilation in seconds.
+    """
+
+    timings: dict[type[BaseMethod[Any]], float]
+    elapsed: float
+
+
+def _warmup_requests(
+    base_url: str,
+    connections: int,
+    urls: Sequence[str] | None,
+) -> list[HTTPRequest]:
+    return [
+        HTTPRequest(
+            url=url,
+            method="HEAD",
+            header={},
+            path={},
+            query={},
+            body=None,
+            file={},
+            form={},
+        )
+        for url in (urls or [base_url])
+        for _ in range(connections)
+    ]
+
+
+def bound_method_types(client_type: type) -> list[type[BaseMethod[Any]]]:
+    """Return the method classes bound with `bind_method` on `client_type`."""
+    method_types: dict[type[BaseMethod[Any]], None] = {}
+    for cls in reversed(client_type.__mro__):
+        for attribute in vars(cls).values():
+            if not isinstance(attribute, MethodBinder):
+                continue
+            method_type = attribute.method_type
+            if isinstance(method_type, type) and issubclass(method_type, BaseMethod):
+                method_types[method_type] = None
+    return list(method_types)
 
 
 class BaseClient:
@@ -19,8 +86,15 @@ class BaseClient:
         response_loader: Component to deserialize HTTP responses into method return types.
         json_dumps: Function to serialize objects to JSON strings.
         json_loads: Function to deserialize JSON strings to objects.
+        record_timings: Measure every call phase and pass a `CallTimings`
+                        to `on_timings`. Disabled by default.
+        tracer: Receives request lifecycle events, see `Tracer`.
     """
 
+    record_timings: bool = False
+    tracer: Tracer | None = None
+    middleware: list[Any]
+
     def __init__(
         self,
         base_url: str,
@@ -35,6 +109,220 @@ class BaseClient:
         self.json_dumps = json_dumps
         self.json_loads = json_loads
 
+    def encode_request(self, request: HTTPRequest) -> HTTPRequest:
+        """Encode the request body into bytes.
+
+        Called by `call_method` right after `build_http_request`, and again
+        by the backends before sending. Requests whose `content` was encoded
+        from their current `body`, or was set without one, are returned
+        unchanged, so retries and middleware passes reuse the same encoded
+        payload. A middleware that assigns a new `body` gets it encoded
+        again; one changing the body in place must assign it anew, e.g. with
+        `dataclasses.replace`.
+
+        Args:
+            request: The HTTP request to encode.
+
+        Returns:
+            HTTPRequest: A copy of the request with `content` and `content_type` set.
+
+        Raises:
+            ValueError: if the request combines Body with Form or File.
+        """
+        encoded_body = request.encoded_body
+        if request.content is not None and (
+            encoded_body is None or encoded_body is request.body
+        ):
+            return request
+        if not request.body:
+            if encoded_body is None:
+                return request
+            # The body the content was encoded from has been removed.
+            return replace(request, content=None, content_type=None, encoded_body=None)
+
+        if request.form or request.file:
+            raise ValueError(
+                "Cannot use Body with Form or File. "
+                "Use Form for fields in multipart requests."
+            )
+
+        content = self.json_dumps(request.body)
+        return replace(
+            request,
+            content=content.encode("utf-8") if isinstance(content, str) else content,
+            content_type="application/json",
+            encoded_body=request.body,
+        )
+
+    def prepare_request(
+        self,
+        method: BaseMethod,
+        timings: CallTimings | None = None,
+    ) -> HTTPRequest:
+        """Build and encode the HTTP request of `method`.
+
+        Args:
+            method: The method instance to serialize.
+            timings: Timings of the call to fill in and attach to the request.
+
+        Returns:
+            HTTPRequest: The encoded request.
+        """
+        if timings is None:
+            return self.encode_request(
+                method.build_http_request(request_dumper=self.request_dumper),
+            )
+
+        start = time.perf_counter_ns()
+        request = method.build_http_request(request_dumper=self.request_dumper)
+        dumped = time.perf_counter_ns()
+        request = self.encode_request(request)
+        timings.dump_ns = dumped - start
+        timings.encode_ns = time.perf_counter_ns() - dumped
+        return replace(request, timings=timings)
+
+    def precompile(
+        self,
+        method_types: Iterable[type[BaseMethod[Any]]] | None = None,
+    ) -> PrecompileResult:
+        """Build the request dumpers and response loaders ahead of the first calls.
+
+        Serializers compile their converters lazily on the first call of each
+        method, which delays that call. This does it up front for every
+        method bound with `bind_method` on the client class, or for
+        `method_types`. Serializers expose this through
+        ``warmup(method_types)``; a bare adaptix `Retort` is also supported.
+
+        Args:
+            method_types: Method classes to compile instead of the bound ones.
+
+        Returns:
+            PrecompileResult: Compile time of each method class.
+        """
+        if method_types is None:
+            method_types = bound_method_types(type(self))
+
+        start = time.perf_counter()
+        timings = {}
+        for method_type in method_types:
+            compile_start = time.perf_counter()
+            self._precompile(method_type)
+            timings[method_type] = time.perf_counter() - compile_start
+
+        return PrecompileResult(
+            timings=dict(sorted(timings.items(), key=lambda item: -item[1])),
+            elapsed=time.perf_counter() - start,
+        )
+
+    def _precompile(self, method_type: type[BaseMethod[Any]]) -> None:
+        dumper: Any = self.request_dumper
+        loader: Any = self.response_loader
+
+        if hasattr(dumper, "warmup"):
+            dumper.warmup([method_type])
+        elif hasattr(dumper, "get_dumper"):
+            dumper.get_dumper(method_type)
+
+        if hasattr(loader, "warmup"):
+            loader.warmup([method_type])
+        elif hasattr(loader, "get_loader") and hasattr(method_type, "__returning__"):
+            loader.get_loader(method_type.__returning__)
+
+    def decode_content(
+        self,
+        request: HTTPRequest,
+        content: bytes | memoryview | None,
+    ) -> Any:
+        """Decode a response body with `json_loads`.
+
+        Decoding is deferred to `call_method` when the request carries a
+        `response_decoder` (e.g. a projection), or when the response loader
+        has a true `decodes_content` attribute and decodes the raw content
+        straight into the return type. Error handling, `validate_response`
+        overrides and middleware still receive the fully decoded `data`;
+        middleware that never reads it can set `reads_response_data = False`.
+
+        Returns:
+            The decoded JSON, the raw content if it is not valid JSON or
+            its decoding is deferred, or None for an empty body.
+        """
+        if not content:
+            return None
+        if request.response_decoder is not None or getattr(
+            self.response_loader, "decodes_content", False
+        ):
+            return content
+
+        timings = request.timings
+        start = time.perf_counter_ns() if timings is not None else 0
+        data = self._loads(content)
+        if timings is not None:
+            timings.decode_ns += time.perf_counter_ns() - start
+        return data
+
+    def _loads(self, content: bytes | memoryview) -> Any:
+        try:
+            return self.json_loads(content)  # type: ignore[arg-type]
+        except (ValueError, TypeError):
+            if isinstance(content, memoryview):
+                # json.loads and other text-based decoders reject buffers.
+                return self._loads(content.tobytes())
+            return content
+
+    def _decode_deferred(
+        self,
+        request: HTTPRequest,
+        response: HTTPResponse,
+        method: BaseMethod,
+    ) -> None:
+        """Decode a body left undecoded by `decode_content`."""
+        content = response.content
+        if response.data is not content or content is None:
+            return
+        decodes_content = getattr(self.response_loader, "decodes_content", False)
+        decoder = request.response_decoder
+        if decoder is None and not decodes_content:
+            return
+
+        timings = request.timings
+        start = time.perf_counter_ns() if timings is not None else 0
+        if (
+            not response.ok
+            or type(self).validate_response is not BaseClient.validate_response
+            or type(method).validate_response is not BaseMethod.validate_response
+            or any(
+                getattr(middleware, "reads_response_data", True)
+                for middleware in self.middleware
+            )
+        ):
+            response.data = self._loads(content)
+        elif (
+            decodes_content
+            and method.__columns__ is None
+            and getattr(method, "__returning__", None) is not HTTPResponse
+        ):
+            # The loader decodes the content itself.
+            return
+        elif decoder is not None:
+            try:
+                response.data = decoder(content)
+            except (ValueError, TypeError):
+                response.data = self._loads(content)
+        else:
+            # Columns and returned responses are built without the loader.
+            response.data = self._loads(content)
+        if timings is not None:
+            timings.decode_ns += time.perf_counter_ns() - start
+
+    def build_headers(self, request: HTTPRequest) -> dict[str, str]:
+        """Return the headers to send, including the body content type.
+
+        The request's own header dict is never modified.
+        """
+        if request.content_type is None or "Content-Type" in request.header:
+            return request.header
+        return {**request.header, "Content-Type": request.content_type}
+
     def validate_response(self, response: HTTPResponse, method: BaseMethod) -> None:
         """Validate response BODY for all methods.
 
@@ -49,6 +337,17 @@ class BaseClient:
             Exception: if response body indicates an error.
         """
 
+    def on_timings(self, method: BaseMethod, timings: CallTimings) -> None:
+        """Receive the phase timings of a successful call.
+
+        Override to export them. Called after the response is loaded,
+        only when `record_timings` is enabled.
+
+        Args:
+            method: The method instance that was executed.
+            timings: Time spent in each phase of the call.
+        """
+
     def handle_error(self, response: HTTPResponse, method: BaseMethod) -> None:
         """Handle HTTP status errors for all methods.
 
@@ -65,7 +364,14 @@ class BaseClient:
 
 
 class BaseSyncClient(BaseClient):
-    """Base class for synchronous HTTP clients."""
+    """Base class for synchronous HTTP clients.
+
+    Attributes:
+        warmup_connections: Connections to open by `warmup` on `__enter__`.
+                            0 disables automatic warmup.
+    """
+
+    warmup_connections: int = 0
 
     def __init__(
         self,
@@ -89,10 +395,11 @@ class BaseSyncClient(BaseClient):
         """Execute an API method synchronously.
 
         Pipeline:
-        1. Serialize method to HTTPRequest.
+        1. Serialize method to HTTPRequest and encode its body (prepare_request).
         2. Apply middlewares.
         3. Execute request (make_request), validate and handle errors.
         4. Deserialize response to ResponseType.
+        5. Report phase timings to on_timings if record_timings is enabled.
 
         Args:
             method: The API method instance to execute.
@@ -100,20 +407,30 @@ class BaseSyncClient(BaseClient):
         Returns:
              The deserialized response data as defined by the method's return type.
         """
-        http_request = method.build_http_request(request_dumper=self.request_dumper)
+        timings = CallTimings(type(method).__name__) if self.record_timings else None
+        start = time.perf_counter_ns() if timings is not None else 0
+        http_request = self.prepare_request(method, timings)
 
         def _send(request: HTTPRequest) -> HTTPResponse:
-            response = self.make_request(request)
-
-            # Body validation (for APIs with ok: false in 200)
-            self.validate_response(response, method)
-            method.validate_response(response)
-
-            # HTTP status error handling
-            if not response.ok:
-                method.on_error(response)
-                self.handle_error(response, method)
-
+            response = self._send_request(request)
+            self._decode_deferred(request, response, method)
+
+            try:
+                # Body validation (for APIs with ok: false in 200)
+                self.validate_response(response, method)
+                method.validate_response(response)
+
+                # HTTP status error handling
+                if not response.ok:
+                    method.on_error(response)
+                    self.handle_error(response, method)
+            except Exception:
+                response.detach()
+                raise
+
+            if self.middleware and (not response.ok or response.data is response.content):
+                # Middleware may keep error and undecoded responses.
+                response.detach()
             return response
 
         handler = _send
@@ -122,7 +439,42 @@ class BaseSyncClient(BaseClient):
 
         http_response = handler(http_request)
 
-        return method.make_response(http_response, response_loader=self.response_loader)
+        if timings is None:
+            return method.make_response(
+                http_response, response_loader=self.response_loader
+            )
+
+        loaded = time.perf_counter_ns()
+        result = method.make_response(http_response, response_loader=self.response_loader)
+        finished = time.perf_counter_ns()
+        timings.load_ns = finished - loaded
+        timings.total_ns = finished - start
+        self.on_timings(method, timings)
+        return result
+
+    def _send_request(self, request: HTTPRequest) -> HTTPResponse:
+        """Call `make_request`, reporting to the tracer and call timings."""
+        tracer = self.tracer
+        timings = request.timings
+        if tracer is None and timings is None:
+            return self.make_request(request)
+
+        start = time.perf_counter_ns()
+        if tracer is not None:
+            request = tracer.on_request_start(request) or request
+        try:
+            response = self.make_request(request)
+        except Exception as e:
+            if tracer is not None:
+                tracer.on_error(request, e)
+            raise
+        finally:
+            if timings is not None:
+                timings.transport_ns += time.perf_counter_ns() - start
+
+        if tracer is not None:
+            tracer.on_body_complete(request, response)
+        return response
 
     def make_request(self, request: HTTPRequest) -> HTTPResponse:
         """Perform the actual HTTP request.
@@ -137,10 +489,48 @@ class BaseSyncClient(BaseClient):
         """
         raise NotImplementedError
 
+    def warmup(
+        self,
+        connections: int = 1,
+        urls: Sequence[str] | None = None,
+    ) -> WarmupResult:
+        """Open keep-alive connections ahead of the first calls.
+
+        Sends `connections` concurrent HEAD requests to each URL (the base
+        URL by default), bypassing middleware, so the session parks that many
+        connections in its pool. The pool must allow at least `connections`
+        connections per host to keep them all.
+
+        Args:
+            connections: Number of connections to open per URL.
+            urls: URLs to warm up, relative to the base URL or absolute.
+
+        Returns:
+            WarmupResult: How many connections were established and how long it took.
+        """
+        from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+        requests = _warmup_requests(self.base_url, connections, urls)
+        start = time.perf_counter()
+        failed = 0
+        with ThreadPoolExecutor(max_workers=max(len(requests), 1)) as executor:
+            futures = [executor.submit(self.make_request, r) for r in requests]
+            for future in futures:
+                if future.exception() is not None:
+                    failed += 1
+
+        return WarmupResult(
+            established=len(requests) - failed,
+            failed=failed,
+            elapsed=time.perf_counter() - start,
+        )
+
     def close(self) -> None:
         """Close the client and release resources."""
 
     def __enter__(self) -> "BaseSyncClient":
+        if self.warmup_connections:
+            self.warmup(self.warmup_connections)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -148,7 +538,14 @@ class BaseSyncClient(BaseClient):
 
 
 class BaseAsyncClient(BaseClient):
-    """Base class for asynchronous HTTP clients."""
+    """Base class for asynchronous HTTP clients.
+
+    Attributes:
+        warmup_connections: Connections to open by `warmup` on `__aenter__`.
+                            0 disables automatic warmup.
+    """
+
+    warmup_connections: int = 0
 
     def __init__(
         self,
@@ -172,10 +569,11 @@ class BaseAsyncClient(BaseClient):
         """Execute an API method asynchronously.
 
         Pipeline:
-        1. Serialize method to HTTPRequest.
+        1. Serialize method to HTTPRequest and encode its body (prepare_request).
         2. Apply middlewares.
         3. Execute request (make_request), validate and handle errors.
         4. Deserialize response to ResponseType.
+        5. Report phase timings to on_timings if record_timings is enabled.
 
         Args:
             method: The API method instance to execute.
@@ -183,20 +581,30 @@ class BaseAsyncClient(BaseClient):
         Returns:
              The deserialized response data as defined by the method's return type.
         """
-        http_request = method.build_http_request(request_dumper=self.request_dumper)
+        timings = CallTimings(type(method).__name__) if self.record_timings else None
+        start = time.perf_counter_ns() if timings is not None else 0
+        http_request = self.prepare_request(method, timings)
 
         async def _send(request: HTTPRequest) -> HTTPResponse:
-            response = await self.make_request(request)
-
-            # Body validation (for APIs with ok: false in 200)
-            self.validate_response(response, method)
-            method.validate_response(response)
-
-            # HTTP status error handling
-            if not response.ok:
-                method.on_error(response)
-                self.handle_error(response, method)
-
+            response = await self._send_request(request)
+            self._decode_deferred(request, response, method)
+
+            try:
+                # Body validation (for APIs with ok: false in 200)
+                self.validate_response(response, method)
+                method.validate_response(response)
+
+                # HTTP status error handling
+                if not response.ok:
+                    method.on_error(response)
+                    self.handle_error(response, method)
+            except Exception:
+                response.detach()
+                raise
+
+            if self.middleware and (not response.ok or response.data is response.content):
+                # Middleware may keep error and undecoded responses.
+                response.detach()
             return response
 
         handler = _send
@@ -205,7 +613,42 @@ class BaseAsyncClient(BaseClient):
 
         http_response = await handler(http_request)
 
-        return method.make_response(http_response, response_loader=self.response_loader)
+        if timings is None:
+            return method.make_response(
+                http_response, response_loader=self.response_loader
+            )
+
+        loaded = time.perf_counter_ns()
+        result = method.make_response(http_response, response_loader=self.response_loader)
+        finished = time.perf_counter_ns()
+        timings.load_ns = finished - loaded
+        timings.total_ns = finished - start
+        self.on_timings(method, timings)
+        return result
+
+    async def _send_request(self, request: HTTPRequest) -> HTTPResponse:
+        """Call `make_request`, reporting to the tracer and call timings."""
+        tracer = self.tracer
+        timings = request.timings
+        if tracer is None and timings is None:
+            return await self.make_request(request)
+
+        start = time.perf_counter_ns()
+        if tracer is not None:
+            request = tracer.on_request_start(request) or request
+        try:
+            response = await self.make_request(request)
+        except Exception as e:
+            if tracer is not None:
+                tracer.on_error(request, e)
+            raise
+        finally:
+            if timings is not None:
+                timings.transport_ns += time.perf_counter_ns() - start
+
+        if tracer is not None:
+            tracer.on_body_complete(request, response)
+        return response
 
     async def make_request(self, request: HTTPRequest) -> HTTPResponse:
         """Perform the actual HTTP request asynchronously.
@@ -220,10 +663,47 @@ class BaseAsyncClient(BaseClient):
         """
         raise NotImplementedError
 
+    async def warmup(
+        self,
+        connections: int = 1,
+        urls: Sequence[str] | None = None,
+    ) -> WarmupResult:
+        """Open keep-alive connections ahead of the first calls.
+
+        Sends `connections` concurrent HEAD requests to each URL (the base
+        URL by default), bypassing middleware, so the session parks that many
+        connections in its pool. The pool must allow at least `connections`
+        connections per host to keep them all.
+
+        Args:
+            connections: Number of connections to open per URL.
+            urls: URLs to warm up, relative to the base URL or absolute.
+
+        Returns:
+            WarmupResult: How many connections were established and how long it took.
+        """
+        import asyncio  # noqa: PLC0415
+
+        requests = _warmup_requests(self.base_url, connections, urls)
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(self.make_request(r) for r in requests),
+            return_exceptions=True,
+        )
+        failed = sum(isinstance(r, BaseException) for r in results)
+
+        return WarmupResult(
+            established=len(requests) - failed,
+            failed=failed,
+            elapsed=time.perf_counter() - start,
+        )
+
     async def close(self) -> None:
         """Close the client and release resources asynchronously."""
 
     async def __aenter__(self) -> "BaseAsyncClient":
+        if self.warmup_connections:
+            await self.warmup(self.warmup_connections)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
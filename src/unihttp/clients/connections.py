@@ -0,0 +1,60 @@
+from weakref import WeakKeyDictionary
+
+
+class ConnectionStats:
+    """Counts the requests carried by the connections of a session.
+
+    With HTTP/1.1 a connection carries one request at a time, so concurrent
+    calls to one host need as many sockets. With HTTP/2 many requests are
+    multiplexed as streams over a single connection; the ratio of
+    `requests` to `connections` shows how well that works in practice.
+
+    Connections are identified by the network stream object the backend
+    reports on each response, through weak references: a connection is
+    forgotten once the backend drops it, while the totals keep counting it.
+
+    Tracking is off by default. Assign an instance to the
+    `connection_stats` attribute of an httpx or httpx2 client to enable it.
+    """
+
+    __slots__ = ("_open", "_requests", "_versions")
+
+    def __init__(self) -> None:
+        self._open: WeakKeyDictionary[object, int] = WeakKeyDictionary()
+        self._requests = 0
+        self._versions: dict[str, int] = {}
+
+    def record(self, connection: object, http_version: str) -> None:
+        """Record one response received over `connection`."""
+        self._requests += 1
+        try:
+            count = self._open.get(connection)
+        except TypeError:  # not weakly referenceable, cannot be told apart
+            return
+        if count is None:
+            self._versions[http_version] = self._versions.get(http_version, 0) + 1
+            count = 0
+        self._open[connection] = count + 1
+
+    @property
+    def connections(self) -> int:
+        """Number of distinct connections seen."""
+        return sum(self._versions.values())
+
+    @property
+    def requests(self) -> int:
+        """Number of recorded responses."""
+        return self._requests
+
+    def streams_per_connection(self) -> list[int]:
+        """Requests carried by each connection still open, busiest first."""
+        return sorted(self._open.values(), reverse=True)
+
+    def connections_by_version(self) -> dict[str, int]:
+        """Number of connections seen per negotiated HTTP version."""
+        return dict(self._versions)
+
+    def reset(self) -> None:
+        self._open.clear()
+        self._requests = 0
+        self._versions.clear()
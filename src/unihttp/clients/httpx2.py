@@ -7,16 +7,42 @@ import httpx2
 from httpx2 import AsyncClient, Client
 
 from unihttp.clients.base import BaseAsyncClient, BaseSyncClient
+from unihttp.clients.connections import ConnectionStats
+from unihttp.clients.pool import PoolConfig, check_session_and_pool, session_property
 from unihttp.exceptions import NetworkError, RequestTimeoutError
 from unihttp.http import UploadFile
 from unihttp.http.request import HTTPRequest
 from unihttp.http.response import HTTPResponse
 from unihttp.middlewares.base import AsyncMiddleware, Middleware
 from unihttp.serialize import RequestDumper, ResponseLoader
+from unihttp.timeouts import remaining
+from unihttp.tracing.httpcore import AsyncHTTPCoreTrace, HTTPCoreTrace
+
+
+def _session_options(pool: PoolConfig) -> dict[str, Any]:
+    """Translate a `PoolConfig` into `httpx2` client options."""
+    return {
+        "limits": httpx2.Limits(
+            max_connections=pool.max_connections,
+            max_keepalive_connections=pool.max_connections,
+            keepalive_expiry=pool.keepalive_expiry,
+        ),
+        "http2": pool.http2,
+    }
 
 
 class HTTPX2SyncClient(BaseSyncClient):
-    """Synchronous client implementation using the `httpx2` library."""
+    """Synchronous client implementation using the `httpx2` library.
+
+    Pass `pool=PoolConfig(http2=True)` (requires `h2`) to multiplex concurrent
+    calls to one host over a single connection.
+
+    Attributes:
+        connection_stats: Counts the requests carried by each connection of
+                          the session when set. None disables tracking.
+    """
+
+    connection_stats: ConnectionStats | None = None
 
     def __init__(
         self,
@@ -27,6 +53,8 @@ class HTTPX2SyncClient(BaseSyncClient):
         session: Client | None = None,
         json_dumps: Callable[[Any], str] = json.dumps,
         json_loads: Callable[[str | bytes | bytearray], Any] = json.loads,
+        *,
+        pool: PoolConfig | None = None,
     ):
         super().__init__(
             base_url=base_url,
@@ -37,10 +65,17 @@ class HTTPX2SyncClient(BaseSyncClient):
             json_loads=json_loads,
         )
 
-        if session is None:
-            session = Client()
+        check_session_and_pool(session, pool)
+        self._pool = pool
+        if session is not None:
+            self._session = session
 
-        self._session = session
+    @session_property
+    def _session(self) -> Client:
+        """Session created on first use when none was passed."""
+        if self._pool is None:
+            return Client()
+        return Client(**_session_options(self._pool))
 
     def _convert_files(self, files: dict[str, Any]) -> list[tuple[str, Any]]:
         """Convert files to a list of tuples for httpx2."""
@@ -59,40 +94,36 @@ class HTTPX2SyncClient(BaseSyncClient):
         return file_list
 
     def make_request(self, request: HTTPRequest) -> HTTPResponse:
-        content = None
-
-        if request.body:
-            if request.form or request.file:
-                raise ValueError(
-                    "Cannot use Body with Form or File. "
-                    "Use Form for fields in multipart requests."
-                )
-            content = self.json_dumps(request.body)
-            if "Content-Type" not in request.header:
-                request.header["Content-Type"] = "application/json"
+        request = self.encode_request(request)
+        timeout = remaining(request.deadline)
 
         try:
             files = self._convert_files(request.file) if request.file else None
             response = self._session.request(
                 method=request.method,
                 url=urljoin(self.base_url, request.url),
-                headers=request.header,
+                headers=self.build_headers(request),
                 params=request.query,
                 files=files,
-                content=content,
+                content=request.content,
                 data=request.form,
+                timeout=httpx2.USE_CLIENT_DEFAULT if timeout is None else timeout,
+                extensions=(
+                    None
+                    if self.tracer is None
+                    else {"trace": HTTPCoreTrace(self.tracer, request)}
+                ),
             )
         except httpx2.NetworkError as e:
             raise NetworkError(str(e)) from e
         except httpx2.TimeoutException as e:
             raise RequestTimeoutError(str(e)) from e
 
-        response_data: Any = None
-        if response.content:
-            try:
-                response_data = self.json_loads(response.content)
-            except (ValueError, TypeError):
-                response_data = response.content
+        stats = self.connection_stats
+        if stats is not None and (stream := response.extensions.get("network_stream")):
+            stats.record(stream, response.http_version)
+
+        response_data = self.decode_content(request, response.content)
 
         return HTTPResponse(
             status_code=response.status_code,
@@ -100,14 +131,26 @@ class HTTPX2SyncClient(BaseSyncClient):
             cookies=response.cookies,
             data=response_data,
             raw_response=response,
+            content=response.content,
         )
 
     def close(self) -> None:
-        self._session.close()
+        if "_session" in self.__dict__:
+            self._session.close()
 
 
 class HTTPX2AsyncClient(BaseAsyncClient):
-    """Asynchronous client implementation using the `httpx2` library."""
+    """Asynchronous client implementation using the `httpx2` library.
+
+    Pass `pool=PoolConfig(http2=True)` (requires `h2`) to multiplex concurrent
+    calls to one host over a single connection.
+
+    Attributes:
+        connection_stats: Counts the requests carried by each connection of
+                          the session when set. None disables tracking.
+    """
+
+    connection_stats: ConnectionStats | None = None
 
     def __init__(
         self,
@@ -118,6 +161,8 @@ class HTTPX2AsyncClient(BaseAsyncClient):
         session: AsyncClient | None = None,
         json_dumps: Callable[[Any], str] = json.dumps,
         json_loads: Callable[[str | bytes | bytearray], Any] = json.loads,
+        *,
+        pool: PoolConfig | None = None,
     ):
         super().__init__(
             base_url=base_url,
@@ -128,10 +173,17 @@ class HTTPX2AsyncClient(BaseAsyncClient):
             json_loads=json_loads,
         )
 
-        if session is None:
-            session = AsyncClient()
+        check_session_and_pool(session, pool)
+        self._pool = pool
+        if session is not None:
+            self._session = session
 
-        self._session = session
+    @session_property
+    def _session(self) -> AsyncClient:
+        """Session created on first use when none was passed."""
+        if self._pool is None:
+            return AsyncClient()
+        return AsyncClient(**_session_options(self._pool))
 
     def _convert_files(self, files: dict[str, Any]) -> list[tuple[str, Any]]:
         """Convert files to a list of tuples for httpx2."""
@@ -150,39 +202,36 @@ class HTTPX2AsyncClient(BaseAsyncClient):
         return file_list
 
     async def make_request(self, request: HTTPRequest) -> HTTPResponse:
-        content = None
-        if request.body:
-            if request.form or request.file:
-                raise ValueError(
-                    "Cannot use Body with Form or File. "
-                    "Use Form for fields in multipart requests."
-                )
-            content = self.json_dumps(request.body)
-            if "Content-Type" not in request.header:
-                request.header["Content-Type"] = "application/json"
+        request = self.encode_request(request)
+        timeout = remaining(request.deadline)
 
         try:
             files = self._convert_files(request.file) if request.file else None
             response = await self._session.request(
                 method=request.method,
                 url=urljoin(self.base_url, request.url),
-                headers=request.header,
+                headers=self.build_headers(request),
                 params=request.query,
                 files=files,
-                content=content,
+                content=request.content,
                 data=request.form,
+                timeout=httpx2.USE_CLIENT_DEFAULT if timeout is None else timeout,
+                extensions=(
+                    None
+                    if self.tracer is None
+                    else {"trace": AsyncHTTPCoreTrace(self.tracer, request)}
+                ),
             )
         except httpx2.NetworkError as e:
             raise NetworkError(str(e)) from e
         except httpx2.TimeoutException as e:
             raise RequestTimeoutError(str(e)) from e
 
-        response_data: Any = None
-        if response.content:
-            try:
-                response_data = self.json_loads(response.content)
-            except (ValueError, TypeError):
-                response_data = response.content
+        stats = self.connection_stats
+        if stats is not None and (stream := response.extensions.get("network_stream")):
+            stats.record(stream, response.http_version)
+
+        response_data = self.decode_content(request, response.content)
 
         return HTTPResponse(
             status_code=response.status_code,
@@ -190,7 +239,9 @@ class HTTPX2AsyncClient(BaseAsyncClient):
             cookies=response.cookies,
             data=response_data,
             raw_response=response,
+            content=response.content,
         )
 
     async def close(self) -> None:
-        await self._session.aclose()
+        if "_session" in self.__dict__:
+            await self._session.aclose()
@@ -0,0 +1,165 @@
+"""Wire encoding shared by the in-process ASGI and WSGI clients.
+
+Network backends leave query strings, form bodies and multipart uploads to
+their HTTP library. Clients that hand requests directly to an application
+encode them here, following the same conventions: booleans are sent as
+``true``/``false``, ``None`` as an empty value and sequences as repeated keys.
+"""
+
+import uuid
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from http.cookies import SimpleCookie
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote, unquote, urlencode, urljoin, urlsplit
+
+from unihttp.http import UploadFile
+from unihttp.http.request import HTTPRequest
+
+
+@dataclass(frozen=True, slots=True)
+class Target:
+    """Where an in-process request is addressed.
+
+    Attributes:
+        scheme: URL scheme, ``http`` or ``https``.
+        host: Host name, without the port.
+        port: Explicit port, or the default port of the scheme.
+        path: Unquoted request path.
+        raw_path: Request path as it appears in the URL.
+        query_string: Encoded query string, without the leading ``?``.
+    """
+
+    scheme: str
+    host: str
+    port: int
+    path: str
+    raw_path: str
+    query_string: str
+
+
+def _stringify(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _pairs(mapping: Mapping[str, Any]) -> list[tuple[str, str]]:
+    return [
+        (key, _stringify(item))
+        for key, value in mapping.items()
+        for item in (value if isinstance(value, (list, tuple)) else [value])
+    ]
+
+
+def build_target(base_url: str, request: HTTPRequest) -> Target:
+    """Resolve the request URL against `base_url` and encode its query."""
+    url = urlsplit(urljoin(base_url, request.url))
+    encoded = urlencode(_pairs(request.query))
+    query = "&".join(part for part in (url.query, encoded) if part)
+    raw_path = url.path or "/"
+    return Target(
+        scheme=url.scheme or "http",
+        host=url.hostname or "localhost",
+        port=url.port or (443 if url.scheme == "https" else 80),
+        path=unquote(raw_path),
+        raw_path=quote(raw_path, safe="/%:@!$&'()*+,;=-._~"),
+        query_string=query,
+    )
+
+
+def _read_file(content: Any) -> bytes:
+    if isinstance(content, bytes):
+        return content
+    if isinstance(content, (bytearray, memoryview)):
+        return bytes(content)
+    if isinstance(content, Path):
+        return content.read_bytes()
+    if hasattr(content, "read"):
+        data = content.read()
+        return data.encode() if isinstance(data, str) else bytes(data)
+    if isinstance(content, str):
+        return content.encode()
+    raise TypeError(f"Unsupported file content type: {type(content).__name__}")
+
+
+def _file_part(value: Any) -> tuple[str | None, bytes, str]:
+    if isinstance(value, UploadFile):
+        filename, content, content_type = value.to_tuple()
+    elif isinstance(value, tuple):
+        if len(value) == 2:
+            (filename, content), content_type = value, "application/octet-stream"
+        else:
+            filename, content, content_type = value
+    else:
+        filename, content, content_type = None, value, "application/octet-stream"
+    return filename, _read_file(content), content_type
+
+
+def _multipart(form: Mapping[str, Any], files: Mapping[str, Any]) -> tuple[bytes, str]:
+    boundary = uuid.uuid4().hex
+    chunks: list[bytes] = []
+
+    for key, value in _pairs(form):
+        chunks.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{key}"'
+            f"\r\n\r\n{value}\r\n".encode()
+        )
+
+    for key, value in files.items():
+        for item in value if isinstance(value, list) else [value]:
+            filename, content, content_type = _file_part(item)
+            disposition = f'form-data; name="{key}"'
+            if filename:
+                disposition += f'; filename="{filename}"'
+            header = (
+                f"--{boundary}\r\nContent-Disposition: {disposition}\r\n"
+                f"Content-Type: {content_type}\r\n\r\n"
+            )
+            chunks.extend((header.encode(), content, b"\r\n"))
+
+    chunks.append(f"--{boundary}--\r\n".encode())
+    return b"".join(chunks), f"multipart/form-data; boundary={boundary}"
+
+
+def encode_body(request: HTTPRequest) -> tuple[bytes, str | None]:
+    """Encode the body of an already encoded request.
+
+    Returns:
+        The body bytes and their content type: `content` as-is, files as
+        ``multipart/form-data``, form fields as
+        ``application/x-www-form-urlencoded``, or an empty body.
+    """
+    if request.content is not None:
+        return request.content, request.content_type
+    if request.file:
+        return _multipart(request.form or {}, request.file)
+    if request.form:
+        return (
+            urlencode(_pairs(request.form)).encode(),
+            "application/x-www-form-urlencoded",
+        )
+    return b"", None
+
+
+def parse_headers(
+    raw_headers: Iterable[tuple[str, str]],
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Collect response headers and cookies.
+
+    Repeated headers are joined with ``", "``. ``Set-Cookie`` values are
+    also parsed into the cookie mapping.
+
+    Returns:
+        The headers and the cookies set by the response.
+    """
+    headers: dict[str, str] = {}
+    cookies: SimpleCookie = SimpleCookie()
+    for name, value in raw_headers:
+        if name.lower() == "set-cookie":
+            cookies.load(value)
+        headers[name] = f"{headers[name]}, {value}" if name in headers else value
+    return headers, {name: morsel.value for name, morsel in cookies.items()}
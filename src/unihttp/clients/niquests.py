@@ -4,19 +4,65 @@ from typing import Any, cast
 from urllib.parse import urljoin
 
 import niquests
-from niquests import AsyncSession, Session
+from niquests import AsyncSession, Response, Session
+from niquests.packages.urllib3.exceptions import HTTPError, ReadTimeoutError
 
 from unihttp.clients.base import BaseAsyncClient, BaseSyncClient
+from unihttp.clients.pool import PoolConfig, check_session_and_pool, session_property
 from unihttp.exceptions import NetworkError, RequestTimeoutError
 from unihttp.http import UploadFile
+from unihttp.http.buffer import BodyBuffer, content_length
 from unihttp.http.request import HTTPRequest
 from unihttp.http.response import HTTPResponse
 from unihttp.middlewares.base import AsyncMiddleware, Middleware
 from unihttp.serialize import RequestDumper, ResponseLoader
+from unihttp.timeouts import remaining
+from unihttp.tracing.tracer import Tracer
+
+# Only passed with a body buffer, so default calls keep their arguments.
+_STREAM: dict[str, Any] = {"stream": True}
+
+
+def _trace_hooks(tracer: Tracer | None, request: HTTPRequest) -> dict[str, Any] | None:
+    """Native `niquests` hooks forwarding events to `tracer`."""
+    if tracer is None:
+        return None
+
+    def on_pre_send(prepared: Any, *args: Any, **kwargs: Any) -> None:
+        tracer.on_connection_acquired(request, None)
+
+    def on_response(response: Any, *args: Any, **kwargs: Any) -> None:
+        tracer.on_headers_received(request)
+
+    return {"pre_send": on_pre_send, "response": on_response}
+
+
+def _session_options(pool: PoolConfig) -> dict[str, Any]:
+    """Translate a `PoolConfig` into `niquests` session options."""
+    return {
+        "pool_maxsize": pool.per_host_limit,
+        "disable_http2": not pool.http2,
+    }
+
+
+def _read_body(body_buffer: BodyBuffer, response: Response) -> memoryview:
+    """Read a streamed body into `body_buffer`, decompressing it."""
+    raw: Any = response.raw
+    raw.decode_content = True
+    try:
+        return body_buffer.read(raw.readinto, content_length(response.headers))
+    except ReadTimeoutError as e:
+        raise RequestTimeoutError(str(e)) from e
+    except HTTPError as e:
+        raise NetworkError(str(e)) from e
 
 
 class NiquestsSyncClient(BaseSyncClient):
-    """Synchronous client implementation using the `niquests` library."""
+    """Synchronous client implementation using the `niquests` library.
+
+    With a `body_buffer`, response bodies are streamed into it and passed
+    on as `memoryview` objects; see `BodyBuffer`.
+    """
 
     def __init__(
         self,
@@ -27,6 +73,9 @@ class NiquestsSyncClient(BaseSyncClient):
         session: Session | None = None,
         json_dumps: Callable[[Any], str] = json.dumps,
         json_loads: Callable[[str | bytes | bytearray], Any] = json.loads,
+        body_buffer: BodyBuffer | None = None,
+        *,
+        pool: PoolConfig | None = None,
     ):
         super().__init__(
             base_url=base_url,
@@ -37,11 +86,19 @@ class NiquestsSyncClient(BaseSyncClient):
             json_loads=json_loads,
         )
 
-        if session is None:
-            self._session = Session()
-        else:
+        check_session_and_pool(session, pool)
+        self._pool = pool
+        self._body_buffer = body_buffer
+        if session is not None:
             self._session = session
 
+    @session_property
+    def _session(self) -> Session:
+        """Session created on first use when none was passed."""
+        if self._pool is None:
+            return Session()
+        return Session(**_session_options(self._pool))
+
     def _convert_files(self, files: dict[str, Any]) -> list[tuple[str, Any]]:
         """Convert files to a format suitable for niquests."""
         converted_files = {}
@@ -68,31 +125,26 @@ class NiquestsSyncClient(BaseSyncClient):
         return file_list
 
     def make_request(self, request: HTTPRequest) -> HTTPResponse:
-        content = None
+        request = self.encode_request(request)
+        timeout = remaining(request.deadline)
+
+        content = request.content
 
         if request.form:
             content = request.form
 
-        if request.body:
-            if request.form or request.file:
-                raise ValueError(
-                    "Cannot use Body with Form or File. "
-                    "Use Form for fields in multipart requests."
-                )
-
-            content = self.json_dumps(request.body)
-            if "Content-Type" not in request.header:
-                request.header["Content-Type"] = "application/json"
-
         try:
             files = self._convert_files(request.file) if request.file else None
             response = self._session.request(
                 method=request.method,
                 url=urljoin(self.base_url, request.url),
-                headers=request.header,
+                headers=self.build_headers(request),
                 params=request.query,
                 files=files,
                 data=content,
+                timeout=timeout,
+                hooks=_trace_hooks(self.tracer, request),
+                **({} if self._body_buffer is None else _STREAM),
             )
         except niquests.exceptions.ConnectionError as e:
             raise NetworkError(str(e)) from e
@@ -101,23 +153,25 @@ class NiquestsSyncClient(BaseSyncClient):
         except niquests.exceptions.RequestException as e:
             raise NetworkError(str(e)) from e
 
-        response_data: Any = None
-        if response.content:
-            try:
-                response_data = self.json_loads(response.content)
-            except (ValueError, TypeError):
-                response_data = response.content
+        body: bytes | memoryview | None
+        if self._body_buffer is None:
+            body = response.content
+        else:
+            body = _read_body(self._body_buffer, response)
+        response_data = self.decode_content(request, body)
 
         return HTTPResponse(
             status_code=response.status_code or 0,
-            headers=dict(response.headers),
+            headers=response.headers,
             cookies=cast(Mapping[str, Any], response.cookies),
             data=response_data,
             raw_response=response,
+            content=body,
         )
 
     def close(self) -> None:
-        self._session.close()
+        if "_session" in self.__dict__:
+            self._session.close()
 
 
 class NiquestsAsyncClient(BaseAsyncClient):
@@ -132,6 +186,8 @@ class NiquestsAsyncClient(BaseAsyncClient):
         session: AsyncSession | None = None,
         json_dumps: Callable[[Any], str] = json.dumps,
         json_loads: Callable[[str | bytes | bytearray], Any] = json.loads,
+        *,
+        pool: PoolConfig | None = None,
     ):
         super().__init__(
             base_url=base_url,
@@ -142,11 +198,18 @@ class NiquestsAsyncClient(BaseAsyncClient):
             json_loads=json_loads,
         )
 
-        if session is None:
-            self._session = AsyncSession()
-        else:
+        check_session_and_pool(session, pool)
+        self._pool = pool
+        if session is not None:
             self._session = session
 
+    @session_property
+    def _session(self) -> AsyncSession:
+        """Session created on first use when none was passed."""
+        if self._pool is None:
+            return AsyncSession()
+        return AsyncSession(**_session_options(self._pool))
+
     def _convert_files(self, files: dict[str, Any]) -> list[tuple[str, Any]]:
         """Convert files to a list of tuples for niquests."""
         file_list = []
@@ -164,31 +227,25 @@ class NiquestsAsyncClient(BaseAsyncClient):
         return file_list
 
     async def make_request(self, request: HTTPRequest) -> HTTPResponse:
-        content = None
+        request = self.encode_request(request)
+        timeout = remaining(request.deadline)
+
+        content = request.content
 
         if request.form:
             content = request.form
 
-        if request.body:
-            if request.form or request.file:
-                raise ValueError(
-                    "Cannot use Body with Form or File. "
-                    "Use Form for fields in multipart requests."
-                )
-
-            content = self.json_dumps(request.body)
-            if "Content-Type" not in request.header:
-                request.header["Content-Type"] = "application/json"
-
         try:
             files = self._convert_files(request.file) if request.file else None
             response = await self._session.request(
                 method=request.method,
                 url=urljoin(self.base_url, request.url),
-                headers=request.header,
+                headers=self.build_headers(request),
                 params=request.query,
                 files=files,
                 data=content,
+                timeout=timeout,
+                hooks=_trace_hooks(self.tracer, request),
             )
         except niquests.exceptions.ConnectionError as e:
             raise NetworkError(str(e)) from e
@@ -197,20 +254,17 @@ class NiquestsAsyncClient(BaseAsyncClient):
         except niquests.exceptions.RequestException as e:
             raise NetworkError(str(e)) from e
 
-        response_data: Any = None
-        if response.content:
-            try:
-                response_data = self.json_loads(response.content)
-            except (ValueError, TypeError):
-                response_data = response.content
+        response_data = self.decode_content(request, response.content)
 
         return HTTPResponse(
             status_code=response.status_code or 0,
-            headers=dict(response.headers),
+            headers=response.headers,
             cookies=cast(Mapping[str, Any], response.cookies),
             data=response_data,
             raw_response=response,
+            content=response.content,
         )
 
     async def close(self) -> None:
-        await self._session.close()
+        if "_session" in self.__dict__:
+            await self._session.close()
@@ -0,0 +1,70 @@
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Self, overload
+
+_SESSION_LOCK = threading.RLock()
+
+
+@dataclass(frozen=True, slots=True)
+class PoolConfig:
+    """Backend-agnostic connection pool settings.
+
+    Used only when the client creates its own session. Each backend
+    translates the fields it supports into its native options and ignores
+    the rest: httpx/httpx2 map them to `Limits` and `http2`, aiohttp to a
+    `TCPConnector`, requests/niquests to the per-host adapter pool and
+    zapros to its network handler.
+
+    Attributes:
+        max_connections: Maximum number of open connections. Backends without
+                         a global limit use it as the per-host limit.
+        max_connections_per_host: Maximum number of connections to a single
+                                  host. None means bounded by `max_connections`.
+        keepalive_expiry: Seconds an idle connection is kept open for reuse.
+        http2: Negotiate HTTP/2 where the backend supports it.
+    """
+
+    max_connections: int = 100
+    max_connections_per_host: int | None = None
+    keepalive_expiry: float = 5.0
+    http2: bool = False
+
+    @property
+    def per_host_limit(self) -> int:
+        """Connections allowed per host, falling back to `max_connections`."""
+        if self.max_connections_per_host is None:
+            return self.max_connections
+        return self.max_connections_per_host
+
+
+def check_session_and_pool(session: object, pool: PoolConfig | None) -> None:
+    if session is not None and pool is not None:
+        raise ValueError(
+            "`pool` configures a session created by the client "
+            "and cannot be combined with `session`."
+        )
+
+
+class session_property[T](cached_property[T]):  # noqa: N801
+    """`cached_property` creating the session once across threads.
+
+    Clients create their session on first use, which may happen from
+    several threads at once (e.g. the workers of `warmup`). Sessions
+    created by the losing threads would be dropped without being closed.
+    """
+
+    @overload
+    def __get__(self, instance: None, owner: type[Any] | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type[Any] | None = None) -> T: ...
+
+    def __get__(self, instance: Any, owner: type[Any] | None = None) -> Any:
+        if instance is None:
+            return self
+        cache = instance.__dict__
+        if self.attrname in cache:
+            return cache[self.attrname]
+        with _SESSION_LOCK:
+            return super().__get__(instance, owner)
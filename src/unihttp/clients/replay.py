@@ -0,0 +1,112 @@
+import asyncio
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from unihttp.clients.base import BaseAsyncClient, BaseClient, BaseSyncClient
+from unihttp.exceptions import NetworkError, RequestTimeoutError
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+from unihttp.middlewares.base import AsyncMiddleware, Middleware
+from unihttp.recording import Exchange, Recording
+from unihttp.serialize import RequestDumper, ResponseLoader
+
+
+def _replay(client: BaseClient, request: HTTPRequest, exchange: Exchange) -> HTTPResponse:
+    """Turn a recorded exchange back into a response or transport error."""
+    if exchange.error == RequestTimeoutError.__name__:
+        raise RequestTimeoutError(f"Recorded timeout for {request.method} {request.url}")
+    if exchange.error is not None:
+        raise NetworkError(
+            f"Recorded {exchange.error} for {request.method} {request.url}"
+        )
+
+    return HTTPResponse(
+        status_code=exchange.status_code,
+        headers=exchange.headers,
+        cookies={},
+        data=client.decode_content(request, exchange.content),
+        raw_response=exchange,
+        content=exchange.content,
+    )
+
+
+class ReplaySyncClient(BaseSyncClient):
+    """Synchronous client answering from a `Recording` instead of the network.
+
+    Attributes:
+        recording: The recorded exchanges to serve.
+        latency: Factor applied to the recorded latency before responding.
+                 0 responds immediately, 1 reproduces the recorded timing.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        request_dumper: RequestDumper,
+        response_loader: ResponseLoader,
+        middleware: list[Middleware] | None = None,
+        *,
+        recording: Recording,
+        latency: float = 0.0,
+        json_dumps: Callable[[Any], str] = json.dumps,
+        json_loads: Callable[[str | bytes | bytearray], Any] = json.loads,
+    ):
+        super().__init__(
+            base_url=base_url,
+            request_dumper=request_dumper,
+            response_loader=response_loader,
+            middleware=middleware,
+            json_dumps=json_dumps,
+            json_loads=json_loads,
+        )
+        self.recording = recording
+        self.latency = latency
+
+    def make_request(self, request: HTTPRequest) -> HTTPResponse:
+        request = self.encode_request(request)
+        exchange = self.recording.lookup(request)
+        if self.latency:
+            time.sleep(exchange.latency_ns * self.latency / 1e9)
+        return _replay(self, request, exchange)
+
+
+class ReplayAsyncClient(BaseAsyncClient):
+    """Asynchronous client answering from a `Recording` instead of the network.
+
+    Attributes:
+        recording: The recorded exchanges to serve.
+        latency: Factor applied to the recorded latency before responding.
+                 0 responds immediately, 1 reproduces the recorded timing.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        request_dumper: RequestDumper,
+        response_loader: ResponseLoader,
+        middleware: list[AsyncMiddleware] | None = None,
+        *,
+        recording: Recording,
+        latency: float = 0.0,
+        json_dumps: Callable[[Any], str] = json.dumps,
+        json_loads: Callable[[str | bytes | bytearray], Any] = json.loads,
+    ):
+        super().__init__(
+            base_url=base_url,
+            request_dumper=request_dumper,
+            response_loader=response_loader,
+            middleware=middleware,
+            json_dumps=json_dumps,
+            json_loads=json_loads,
+        )
+        self.recording = recording
+        self.latency = latency
+
+    async def make_request(self, request: HTTPRequest) -> HTTPResponse:
+        request = self.encode_request(request)
+        exchange = self.recording.lookup(request)
+        if self.latency:
+            await asyncio.sleep(exchange.latency_ns * self.latency / 1e9)
+        return _replay(self, request, exchange)
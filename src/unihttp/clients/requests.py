@@ -1,18 +1,58 @@
+import json
+from collections.abc import Callable
 from typing import Any
 from urllib.parse import urljoin
 
 import requests
-from requests import Session
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError, ReadTimeoutError
 
 from unihttp.clients.base import BaseSyncClient
+from unihttp.clients.pool import PoolConfig, check_session_and_pool, session_property
 from unihttp.exceptions import NetworkError, RequestTimeoutError
+from unihttp.http.buffer import BodyBuffer, content_length
 from unihttp.http.request import HTTPRequest
 from unihttp.http.response import HTTPResponse
 from unihttp.middlewares.base import Middleware
 from unihttp.serialize import RequestDumper, ResponseLoader
+from unihttp.timeouts import remaining
+from unihttp.tracing.tracer import Tracer
+
+# Only passed with a body buffer, so default calls keep their arguments.
+_STREAM: dict[str, Any] = {"stream": True}
+
+
+def _trace_hooks(tracer: Tracer | None, request: HTTPRequest) -> dict[str, Any] | None:
+    """Native `requests` hooks forwarding events to `tracer`."""
+    if tracer is None:
+        return None
+
+    def on_response(response: Any, *args: Any, **kwargs: Any) -> None:
+        tracer.on_headers_received(request)
+
+    return {"response": on_response}
+
+
+def _read_body(body_buffer: BodyBuffer, response: Response) -> memoryview:
+    """Read a streamed body into `body_buffer`, decompressing it."""
+    raw: Any = response.raw
+    raw.decode_content = True
+    try:
+        return body_buffer.read(raw.readinto, content_length(response.headers))
+    except ReadTimeoutError as e:
+        raise RequestTimeoutError(str(e)) from e
+    except HTTPError as e:
+        raise NetworkError(str(e)) from e
 
 
 class RequestsSyncClient(BaseSyncClient):
+    """Synchronous client implementation using the `requests` library.
+
+    With a `body_buffer`, response bodies are streamed into it and passed
+    on as `memoryview` objects; see `BodyBuffer`.
+    """
+
     def __init__(
         self,
         base_url: str,
@@ -20,56 +60,69 @@ class RequestsSyncClient(BaseSyncClient):
         response_loader: ResponseLoader,
         middleware: list[Middleware] | None = None,
         session: Session | None = None,
+        json_dumps: Callable[[Any], str] = json.dumps,
+        json_loads: Callable[[str | bytes | bytearray], Any] = json.loads,
+        body_buffer: BodyBuffer | None = None,
+        *,
+        pool: PoolConfig | None = None,
     ):
         super().__init__(
             base_url=base_url,
             request_dumper=request_dumper,
             response_loader=response_loader,
             middleware=middleware,
+            json_dumps=json_dumps,
+            json_loads=json_loads,
         )
 
-        if session is None:
-            self._session = Session()
-        else:
+        check_session_and_pool(session, pool)
+        self._pool = pool
+        self._body_buffer = body_buffer
+        if session is not None:
             self._session = session
 
+    @session_property
+    def _session(self) -> Session:
+        """Session created on first use when none was passed."""
+        session = Session()
+        if self._pool is not None:
+            adapter = HTTPAdapter(pool_maxsize=self._pool.per_host_limit)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        return session
+
     def make_request(self, request: HTTPRequest) -> HTTPResponse:
-        content = None
+        request = self.encode_request(request)
+        timeout = remaining(request.deadline)
+
+        content = request.content
 
         if request.form:
             content = request.form
 
-        if request.body:
-            if request.form or request.file:
-                raise ValueError(
-                    "Cannot use Body with Form or File. "
-                    "Use Form for fields in multipart requests."
-                )
-
-            content = self.json_dumps(request.body)
-            if "Content-Type" not in request.header:
-                request.header["Content-Type"] = "application/json"
-
         try:
             response = self._session.request(
                 method=request.method,
                 url=urljoin(self.base_url, request.url),
-                headers=request.header,
+                headers=self.build_headers(request),
                 params=request.query,
                 files=request.file,
                 data=content,
+                timeout=timeout,
+                hooks=_trace_hooks(self.tracer, request),
+                **({} if self._body_buffer is None else _STREAM),
             )
         except requests.exceptions.ConnectionError as e:
             raise NetworkError(str(e)) from e
         except requests.exceptions.Timeout as e:
             raise RequestTimeoutError(str(e)) from e
 
-        response_data: Any = None
-        if response.content:
-            try:
-                response_data = self.json_loads(response.content)
-            except (ValueError, TypeError):
-                response_data = response.content
+        body: bytes | memoryview
+        if self._body_buffer is None:
+            body = response.content
+        else:
+            body = _read_body(self._body_buffer, response)
+        response_data = self.decode_content(request, body)
 
         return HTTPResponse(
             status_code=response.status_code,
@@ -77,7 +130,9 @@ class RequestsSyncClient(BaseSyncClient):
             cookies=response.cookies,
             data=response_data,
             raw_response=response,
+            content=body,
         )
 
     def close(self) -> None:
-        self._session.close()
+        if "_session" in self.__dict__:
+            self._session.close()
@@ -0,0 +1,145 @@
+import io
+import json
+import sys
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from unihttp.clients.base import BaseSyncClient
+from unihttp.clients.inprocess import build_target, encode_body, parse_headers
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+from unihttp.middlewares.base import Middleware
+from unihttp.serialize import RequestDumper, ResponseLoader
+from unihttp.timeouts import remaining
+
+StartResponse = Callable[..., Callable[[bytes], object]]
+WSGIApp = Callable[[dict[str, Any], StartResponse], Iterable[bytes]]
+
+
+class WSGISyncClient(BaseSyncClient):
+    """Synchronous client calling a WSGI application in-process.
+
+    Requests are passed straight to `app` without opening sockets. Bodies,
+    query strings and uploads are encoded and responses decoded exactly as
+    by the network backends, which makes the client a drop-in replacement
+    in tests and benchmarks. A running app cannot be interrupted, so call
+    deadlines are only checked before dispatching.
+
+    Example:
+        >>> client = WSGISyncClient("http://testserver", dumper, loader, app=flask_app)
+
+    Attributes:
+        app: The WSGI application requests are dispatched to.
+        raise_app_exceptions: Re-raise exceptions escaping the app. When
+                              disabled they are turned into an empty 500
+                              response, as a server would do.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        request_dumper: RequestDumper,
+        response_loader: ResponseLoader,
+        middleware: list[Middleware] | None = None,
+        *,
+        app: WSGIApp,
+        raise_app_exceptions: bool = True,
+        json_dumps: Callable[[Any], str] = json.dumps,
+        json_loads: Callable[[str | bytes | bytearray], Any] = json.loads,
+    ):
+        super().__init__(
+            base_url=base_url,
+            request_dumper=request_dumper,
+            response_loader=response_loader,
+            middleware=middleware,
+            json_dumps=json_dumps,
+            json_loads=json_loads,
+        )
+        self.app = app
+        self.raise_app_exceptions = raise_app_exceptions
+
+    def _build_environ(
+        self, request: HTTPRequest, body: bytes, content_type: str | None
+    ) -> dict[str, Any]:
+        target = build_target(self.base_url, request)
+        environ: dict[str, Any] = {
+            "REQUEST_METHOD": request.method.upper(),
+            "SCRIPT_NAME": "",
+            "PATH_INFO": target.path.encode().decode("latin-1"),
+            "QUERY_STRING": target.query_string,
+            "SERVER_NAME": target.host,
+            "SERVER_PORT": str(target.port),
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "REMOTE_ADDR": "127.0.0.1",
+            "HTTP_HOST": target.host,
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": target.scheme,
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        if body:
+            environ["CONTENT_LENGTH"] = str(len(body))
+
+        for name, value in self.build_headers(request).items():
+            key = name.upper().replace("-", "_")
+            if key in {"CONTENT_TYPE", "CONTENT_LENGTH"}:
+                environ[key] = str(value)
+            else:
+                environ[f"HTTP_{key}"] = str(value)
+
+        if content_type is not None:
+            environ.setdefault("CONTENT_TYPE", content_type)
+        return environ
+
+    def _dispatch(self, request: HTTPRequest) -> tuple[int, list[Any], bytes]:
+        body, content_type = encode_body(request)
+        environ = self._build_environ(request, body, content_type)
+
+        status = 500
+        raw_headers: list[Any] = []
+        chunks: list[bytes] = []
+
+        def start_response(
+            status_line: str, headers: list[tuple[str, str]], exc_info: Any = None
+        ) -> Callable[[bytes], object]:
+            nonlocal status, raw_headers
+            status = int(status_line.split(" ", 1)[0])
+            raw_headers = list(headers)
+            if self.tracer is not None:
+                self.tracer.on_headers_received(request)
+            return chunks.append
+
+        try:
+            result = self.app(environ, start_response)
+            try:
+                chunks.extend(result)
+            finally:
+                if hasattr(result, "close"):
+                    result.close()
+        except Exception:
+            if self.raise_app_exceptions:
+                raise
+            status, raw_headers, chunks = 500, [], []
+
+        return status, raw_headers, b"".join(chunks)
+
+    def make_request(self, request: HTTPRequest) -> HTTPResponse:
+        request = self.encode_request(request)
+        remaining(request.deadline)
+
+        status, raw_headers, content = self._dispatch(request)
+
+        headers, cookies = parse_headers(raw_headers)
+        response_data = self.decode_content(request, content)
+
+        return HTTPResponse(
+            status_code=status,
+            headers=headers,
+            cookies=cookies,
+            data=response_data,
+            raw_response=None,
+            content=content,
+        )
@@ -1,19 +1,29 @@
 import json
 from collections.abc import Callable, Mapping
 from pathlib import Path
+from time import perf_counter_ns
 from typing import Any
 from urllib.parse import urljoin
 
 import zapros
-from zapros import AsyncClient, Client, Multipart, Part
+from zapros import (
+    AsyncClient,
+    AsyncStdNetworkHandler,
+    Client,
+    Multipart,
+    Part,
+    StdNetworkHandler,
+)
 
 from unihttp.clients.base import BaseAsyncClient, BaseSyncClient
+from unihttp.clients.pool import PoolConfig, check_session_and_pool, session_property
 from unihttp.exceptions import NetworkError, RequestTimeoutError
 from unihttp.http import UploadFile
 from unihttp.http.request import HTTPRequest
 from unihttp.http.response import HTTPResponse
 from unihttp.middlewares.base import AsyncMiddleware, Middleware
 from unihttp.serialize import RequestDumper, ResponseLoader
+from unihttp.timeouts import remaining
 
 
 def _stringify_pairs(mapping: Mapping[str, Any]) -> list[tuple[str, str]]:
@@ -103,6 +113,15 @@ def _build_multipart(
     return multipart
 
 
+def _handler_options(pool: PoolConfig) -> dict[str, Any]:
+    """Translate a `PoolConfig` into `zapros` network handler options."""
+    return {
+        "max_connections_per_host": pool.per_host_limit,
+        "max_idle_seconds": pool.keepalive_expiry,
+        "http2": pool.http2,
+    }
+
+
 class ZaprosSyncClient(BaseSyncClient):
     """Synchronous client implementation using the `zapros` library."""
 
@@ -115,6 +134,8 @@ class ZaprosSyncClient(BaseSyncClient):
         session: Client | None = None,
         json_dumps: Callable[[Any], str] = json.dumps,
         json_loads: Callable[[str | bytes | bytearray], Any] = json.loads,
+        *,
+        pool: PoolConfig | None = None,
     ):
         super().__init__(
             base_url=base_url,
@@ -125,53 +146,57 @@ class ZaprosSyncClient(BaseSyncClient):
             json_loads=json_loads,
         )
 
-        if session is None:
-            session = Client()
+        check_session_and_pool(session, pool)
+        self._pool = pool
+        if session is not None:
+            self._session = session
 
-        self._session = session
+    @session_property
+    def _session(self) -> Client:
+        """Session created on first use when none was passed."""
+        if self._pool is None:
+            return Client()
+        return Client(StdNetworkHandler(**_handler_options(self._pool)))
 
     def make_request(self, request: HTTPRequest) -> HTTPResponse:
-        body: bytes | None = None
+        request = self.encode_request(request)
+        timeout = remaining(request.deadline)
+
         form: Any = None
         multipart: Multipart | None = None
 
-        if request.body:
-            if request.form or request.file:
-                raise ValueError(
-                    "Cannot use Body with Form or File. "
-                    "Use Form for fields in multipart requests."
-                )
-            body = self.json_dumps(request.body).encode("utf-8")
-            if "Content-Type" not in request.header:
-                request.header["Content-Type"] = "application/json"
-        elif request.file:
-            multipart = _build_multipart(request.form, request.file)
-        elif request.form:
-            form = _stringify_pairs(request.form)
+        if request.content is None:
+            if request.file:
+                multipart = _build_multipart(request.form, request.file)
+            elif request.form:
+                form = _stringify_pairs(request.form)
 
         try:
             response = self._session.request(  # type: ignore[call-overload]
                 method=request.method,
                 url=urljoin(self.base_url, request.url),
-                headers=request.header,
+                headers=self.build_headers(request),
                 params=_stringify_pairs(request.query),
                 form=form,
-                body=body,
+                body=request.content,
                 multipart=multipart,
+                context=None if timeout is None else {"timeouts": {"total": timeout}},
             )
         except zapros.TimeoutError as e:
             raise RequestTimeoutError(str(e)) from e
         except zapros.ConnectionError as e:
             raise NetworkError(str(e)) from e
 
+        if self.tracer is not None:
+            self.tracer.on_headers_received(request)
+
+        timings = request.timings
+        read_start = perf_counter_ns() if timings is not None else 0
         content = response.read()
+        if timings is not None:
+            timings.body_read_ns += perf_counter_ns() - read_start
 
-        response_data: Any = None
-        if content:
-            try:
-                response_data = self.json_loads(content)
-            except (ValueError, TypeError):
-                response_data = content
+        response_data = self.decode_content(request, content)
 
         return HTTPResponse(
             status_code=response.status,
@@ -179,10 +204,12 @@ class ZaprosSyncClient(BaseSyncClient):
             cookies={},
             data=response_data,
             raw_response=response,
+            content=content,
         )
 
     def close(self) -> None:
-        self._session.close()
+        if "_session" in self.__dict__:
+            self._session.close()
 
 
 class ZaprosAsyncClient(BaseAsyncClient):
@@ -197,6 +224,8 @@ class ZaprosAsyncClient(BaseAsyncClient):
         session: AsyncClient | None = None,
         json_dumps: Callable[[Any], str] = json.dumps,
         json_loads: Callable[[str | bytes | bytearray], Any] = json.loads,
+        *,
+        pool: PoolConfig | None = None,
     ):
         super().__init__(
             base_url=base_url,
@@ -207,53 +236,57 @@ class ZaprosAsyncClient(BaseAsyncClient):
             json_loads=json_loads,
         )
 
-        if session is None:
-            session = AsyncClient()
+        check_session_and_pool(session, pool)
+        self._pool = pool
+        if session is not None:
+            self._session = session
 
-        self._session = session
+    @session_property
+    def _session(self) -> AsyncClient:
+        """Session created on first use when none was passed."""
+        if self._pool is None:
+            return AsyncClient()
+        return AsyncClient(AsyncStdNetworkHandler(**_handler_options(self._pool)))
 
     async def make_request(self, request: HTTPRequest) -> HTTPResponse:
-        body: bytes | None = None
+        request = self.encode_request(request)
+        timeout = remaining(request.deadline)
+
         form: Any = None
         multipart: Multipart | None = None
 
-        if request.body:
-            if request.form or request.file:
-                raise ValueError(
-                    "Cannot use Body with Form or File. "
-                    "Use Form for fields in multipart requests."
-                )
-            body = self.json_dumps(request.body).encode("utf-8")
-            if "Content-Type" not in request.header:
-                request.header["Content-Type"] = "application/json"
-        elif request.file:
-            multipart = _build_multipart(request.form, request.file)
-        elif request.form:
-            form = _stringify_pairs(request.form)
+        if request.content is None:
+            if request.file:
+                multipart = _build_multipart(request.form, request.file)
+            elif request.form:
+                form = _stringify_pairs(request.form)
 
         try:
             response = await self._session.request(  # type: ignore[call-overload]
                 method=request.method,
                 url=urljoin(self.base_url, request.url),
-                headers=request.header,
+                headers=self.build_headers(request),
                 params=_stringify_pairs(request.query),
                 form=form,
-                body=body,
+                body=request.content,
                 multipart=multipart,
+                context=None if timeout is None else {"timeouts": {"total": timeout}},
             )
         except zapros.TimeoutError as e:
             raise RequestTimeoutError(str(e)) from e
         except zapros.ConnectionError as e:
             raise NetworkError(str(e)) from e
 
+        if self.tracer is not None:
+            self.tracer.on_headers_received(request)
+
+        timings = request.timings
+        read_start = perf_counter_ns() if timings is not None else 0
         content = await response.aread()
+        if timings is not None:
+            timings.body_read_ns += perf_counter_ns() - read_start
 
-        response_data: Any = None
-        if content:
-            try:
-                response_data = self.json_loads(content)
-            except (ValueError, TypeError):
-                response_data = content
+        response_data = self.decode_content(request, content)
 
         return HTTPResponse(
             status_code=response.status,
@@ -261,7 +294,9 @@ class ZaprosAsyncClient(BaseAsyncClient):
             cookies={},
             data=response_data,
             raw_response=response,
+            content=content,
         )
 
     async def close(self) -> None:
-        await self._session.aclose()
+        if "_session" in self.__dict__:
+            await self._session.aclose()
@@ -0,0 +1,122 @@
+"""Columnar loading of list responses.
+
+Methods returning ``Columns[Row]`` receive a JSON array of flat records as
+one array per field instead of one object per record. Numeric fields are
+stored in NumPy arrays when NumPy is installed and in `array.array`
+otherwise, using a few bytes per value; other fields are kept as lists.
+
+    @dataclass
+    class Sample:
+        ts: int
+        value: float
+        host: str
+
+    @dataclass
+    class GetSamples(BaseMethod[Columns[Sample]]):
+        __url__ = "/samples"
+        __method__ = "GET"
+
+    samples = client.call_method(GetSamples())
+    samples["value"].mean()
+"""
+
+import importlib.util
+from array import array
+from collections.abc import Iterator, Mapping
+from functools import cache
+from operator import itemgetter
+from typing import Any, get_args, get_origin
+
+from unihttp.records import record_fields
+
+# array.array type codes and NumPy dtypes of the numeric field types.
+# NumPy columns are views of the checked array.array columns.
+_TYPECODES = {bool: "b", int: "q", float: "d"}
+_DTYPES = {bool: "?", int: "int64", float: "float64"}
+
+
+class Columns[RowT](Mapping[str, Any]):
+    """Columns of a list of `RowT` records, keyed by field name.
+
+    Iterating and ``len()`` follow the `Mapping` protocol and cover the
+    columns. The number of records is `row_count`.
+    """
+
+    __slots__ = ("_columns", "row_count")
+
+    def __init__(self, columns: dict[str, Any], row_count: int):
+        self._columns = columns
+        self.row_count = row_count
+
+    def __getitem__(self, name: str) -> Any:
+        return self._columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return f"<Columns {list(self._columns)} x {self.row_count} rows>"
+
+
+def columns_row_type(tp: Any) -> Any | None:
+    """Return the row type of a ``Columns[Row]`` return type, or None."""
+    if get_origin(tp) is Columns and (args := get_args(tp)):
+        return args[0]
+    return None
+
+
+@cache
+def _numpy() -> Any:
+    if importlib.util.find_spec("numpy") is None:
+        return None
+    import numpy as np  # noqa: PLC0415
+
+    return np
+
+
+def load_columns(
+    data: Any,
+    row_type: Any,
+    use_numpy: bool | None = None,
+) -> Columns[Any]:
+    """Build the columns of `row_type` from decoded records.
+
+    Args:
+        data: List of records decoded from JSON, as mappings.
+        row_type: Record type declaring the columns and their types.
+        use_numpy: Store numeric columns in NumPy arrays. Defaults to
+                   whether NumPy is installed.
+
+    Returns:
+        Columns: One column per field of `row_type`.
+
+    Raises:
+        TypeError: if `row_type` is not a record type or `data` is not a list.
+        ValueError: if a record lacks a field or has a value of another
+                    type than declared for a numeric field.
+    """
+    fields = record_fields(row_type)
+    if fields is None:
+        raise TypeError(f"Columns row type must be a record type, got {row_type!r}")
+    if not isinstance(data, list):
+        raise TypeError(f"Expected a list of records, got {type(data).__name__}")
+
+    numpy = _numpy() if use_numpy is not False else None
+    if use_numpy and numpy is None:
+        raise ValueError("NumPy is not installed")
+
+    columns = {}
+    for name, key, field_type in fields:
+        values = map(itemgetter(key), data)
+        typecode = _TYPECODES.get(field_type)
+        try:
+            column: Any = list(values) if typecode is None else array(typecode, values)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid value in column {name!r}: {e!r}") from e
+        if typecode is not None and numpy is not None:
+            column = numpy.frombuffer(column, dtype=_DTYPES[field_type])
+        columns[name] = column
+    return Columns(columns, len(data))
@@ -21,6 +21,10 @@ class RequestTimeoutError(UniHTTPError):
     """Request timed out."""
 
 
+class ReplayMissError(UniHTTPError):
+    """A replay client has no recorded response for the request."""
+
+
 # Application errors (HTTP status based)
 class HTTPStatusError(UniHTTPError):
     """Raised for HTTP error responses."""
@@ -1,8 +1,10 @@
+from .buffer import BodyBuffer
 from .files import FileType, UploadFile
 from .request import HTTPRequest
 from .response import HTTPResponse
 
 __all__ = [
+    "BodyBuffer",
     "FileType",
     "HTTPRequest",
     "HTTPResponse",
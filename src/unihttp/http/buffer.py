@@ -0,0 +1,81 @@
+"""Reusable buffers for response bodies."""
+
+import threading
+from collections.abc import Callable, Mapping
+from typing import Any
+
+_MIN_SIZE = 64 * 1024
+_MAX_RETAINED = 16 * 1024 * 1024
+
+
+class BodyBuffer(threading.local):
+    """Buffer that response bodies are read into, one per thread.
+
+    Bodies are returned as `memoryview` objects over the buffer instead of
+    new `bytes` objects, so reading a body allocates nothing once the buffer
+    has grown to the usual body size. A body is only valid until the next
+    read in the same thread; copy it with ``bytes()`` to keep it longer.
+
+    Example:
+        >>> body = BodyBuffer().read(response.raw.readinto)
+        >>> msgspec.json.decode(body)
+
+    Attributes:
+        max_retained: Largest buffer kept for reuse in bytes. Larger bodies
+                      are read into a buffer of their own.
+    """
+
+    def __init__(self, max_retained: int = _MAX_RETAINED):
+        self.max_retained = max_retained
+        self._buffer = bytearray()
+
+    def read(
+        self,
+        readinto: Callable[[memoryview], int | None],
+        size_hint: int | None = None,
+    ) -> memoryview:
+        """Read a body until EOF.
+
+        Args:
+            readinto: Function filling the given view and returning the
+                      number of bytes written, 0 or None at EOF.
+            size_hint: Expected body size, e.g. from ``Content-Length``.
+
+        Returns:
+            memoryview: The body, valid until the next read in this thread.
+        """
+        buffer = self._buffer
+        if size_hint is not None and len(buffer) <= size_hint < self.max_retained:
+            # One spare byte lets EOF be seen without growing the buffer.
+            buffer = bytearray(size_hint + 1)
+
+        view = memoryview(buffer)
+        filled = 0
+        while True:
+            if filled == len(buffer):
+                # Views of an earlier body may still be alive, so the buffer
+                # is replaced rather than resized.
+                full, buffer = buffer, bytearray(max(2 * len(buffer), _MIN_SIZE))
+                buffer[:filled] = full
+                view = memoryview(buffer)
+            read = readinto(view[filled:])
+            if not read:
+                break
+            filled += read
+
+        if len(buffer) <= self.max_retained:
+            self._buffer = buffer
+        return view[:filled]
+
+
+def content_length(headers: Mapping[str, Any]) -> int | None:
+    """Return the body size announced by case-insensitive `headers`, if known.
+
+    Compressed bodies are decoded while read, so their size is unknown.
+    """
+    if headers.get("Content-Encoding"):
+        return None
+    length = headers.get("Content-Length")
+    if isinstance(length, str) and length.isdigit():
+        return int(length)
+    return None
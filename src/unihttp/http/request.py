@@ -1,6 +1,9 @@
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
+from unihttp.timings import CallTimings
+
 
 @dataclass
 class HTTPRequest:
@@ -15,6 +18,18 @@ class HTTPRequest:
         body: Dictionary of body parameters (JSON/Form).
         file: Dictionary of files to upload.
         form: Dictionary of form_data parameters.
+        content: The encoded request body. Produced once from `body` by
+                 `BaseClient.encode_request` and sent by backends as-is.
+        content_type: The content type of `content`.
+        deadline: Absolute `time.monotonic()` deadline of the call, if any.
+        method_name: Name of the `BaseMethod` subclass that built the request.
+        attempt: Zero-based attempt number, incremented by retry middleware.
+        timings: Phase timings of the call, set only when the client records them.
+        response_decoder: Decodes successful response bodies instead of the
+                          client's `json_loads`, e.g. a projection.
+        encoded_body: The `body` that `content` was encoded from. When
+                      `body` is replaced by another object, e.g. by a
+                      middleware, `content` is encoded again.
     """
 
     url: str
@@ -26,3 +41,12 @@ class HTTPRequest:
     body: Any
     file: dict[str, Any]
     form: Any
+
+    content: bytes | None = None
+    content_type: str | None = None
+    deadline: float | None = None
+    method_name: str | None = None
+    attempt: int = 0
+    timings: CallTimings | None = None
+    response_decoder: Callable[[bytes | memoryview], Any] | None = None
+    encoded_body: Any = None
@@ -14,6 +14,9 @@ class HTTPResponse:
         cookies: Dictionary of response cookies.
         raw_response: The original response object from the underlying client
                       (e.g., httpx.Response).
+        content: The raw response body. Clients reading bodies into a
+                 `BodyBuffer` pass a `memoryview` that is only valid until
+                 the next request in the same thread.
     """
 
     status_code: int
@@ -24,6 +27,20 @@ class HTTPResponse:
 
     raw_response: Any
 
+    content: bytes | memoryview | None = None
+
+    def detach(self) -> None:
+        """Copy a `content` view of a reusable buffer into its own bytes.
+
+        Responses kept past the next request in the same thread, e.g. by
+        exceptions or middleware, must not point into a `BodyBuffer`.
+        """
+        content = self.content
+        if isinstance(content, memoryview):
+            self.content = content.tobytes()
+            if self.data is content:
+                self.data = self.content
+
     @property
     def ok(self) -> bool:
         """Check if response status code is 2xx."""
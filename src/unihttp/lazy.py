@@ -0,0 +1,67 @@
+"""Lazy package exports.
+
+Package ``__init__`` modules re-export names from their submodules. Importing
+them eagerly would pull in every backend and serializer the package knows
+about, so packages declare where each name lives and `lazy_exports` resolves
+it on first attribute access (PEP 562).
+"""
+
+import sys
+from collections.abc import Callable
+from importlib import import_module
+from types import ModuleType
+from typing import Any
+
+
+class _LazyPackage(ModuleType):
+    """Package module that keeps exports named like their own submodule.
+
+    Importing ``package.name`` binds the submodule as attribute ``name`` of
+    the package, which would hide an export of the same name (such as
+    `unihttp.bind_method`). The export defined by the submodule is bound
+    instead.
+    """
+
+    __lazy_exports__: dict[str, str]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if (
+            isinstance(value, ModuleType)
+            and value.__name__ == f"{self.__name__}.{name}"
+            and name in self.__dict__.get("__lazy_exports__", ())
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+def lazy_exports(
+    package: str,
+    exports: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level `__getattr__` and `__dir__` for `package`.
+
+    Args:
+        package: ``__name__`` of the package.
+        exports: Exported name to the module defining it, absolute or
+                 relative to `package`.
+
+    Returns:
+        The `__getattr__` and `__dir__` functions to assign in the package.
+    """
+    module = sys.modules[package]
+    module.__class__ = _LazyPackage
+    module.__lazy_exports__ = exports
+    namespace = module.__dict__
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        source = exports.get(name)
+        if source is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(source, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
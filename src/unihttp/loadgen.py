@@ -0,0 +1,310 @@
+"""Load generator driving unihttp clients.
+
+Runs the exact client code used in production against a target service
+and reports latency percentiles, throughput, errors and client CPU usage.
+The load comes from a factory given as ``module:attribute``. It returns
+a client and a zero-argument callable that builds the method to call:
+
+    # bench.py
+    def target():
+        client = UserClient("https://api.example.com", DEFAULT_RETORT, DEFAULT_RETORT)
+        return client, lambda: GetUser(id=random.randint(1, 1000))
+
+    $ python -m unihttp.loadgen bench:target --rps 200 --duration 30
+    $ python -m unihttp.loadgen bench:target --concurrency 50 --duration 30
+
+Async clients run on one event loop, sync clients on threads. The factory
+is called inside the event loop and may be a coroutine function.
+
+With ``--rps`` the load is open-loop: calls start on a fixed schedule
+whether or not earlier calls have finished, and latency is measured from
+the scheduled start. Queueing behind slow calls is therefore included,
+which avoids coordinated omission. With ``--concurrency`` the load is
+closed-loop: each worker starts a new call as soon as its previous one
+ends.
+"""
+
+import argparse
+import asyncio
+import importlib
+import inspect
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+from unihttp.clients.base import BaseAsyncClient, BaseSyncClient
+from unihttp.method import BaseMethod
+from unihttp.metrics import Histogram
+
+MethodFactory = Callable[[], BaseMethod[Any]]
+
+_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+@dataclass
+class LoadResult:
+    """Outcome of a load run.
+
+    Attributes:
+        latency: Call latencies in nanoseconds, errors included.
+        errors: Failed calls per exception class name.
+        elapsed: Wall time from the first scheduled call to the last completion.
+        cpu_time: CPU time used by the process during the run, in seconds.
+        target_rps: Requested rate for open-loop runs.
+        concurrency: Number of workers for closed-loop runs.
+    """
+
+    latency: Histogram = field(default_factory=Histogram)
+    errors: Counter[str] = field(default_factory=Counter)
+    elapsed: float = 0.0
+    cpu_time: float = 0.0
+    target_rps: float | None = None
+    concurrency: int | None = None
+
+    @property
+    def requests(self) -> int:
+        return self.latency.count
+
+    @property
+    def throughput(self) -> float:
+        """Completed calls per second."""
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def cpu_percent(self) -> float:
+        """CPU time as a percentage of one core over the run."""
+        return 100 * self.cpu_time / self.elapsed if self.elapsed else 0.0
+
+    def record(self, latency_ns: int, error: BaseException | None = None) -> None:
+        self.latency.record(latency_ns)
+        if error is not None:
+            self.errors[type(error).__name__] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": dict(self.errors),
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "target_rps": self.target_rps,
+            "concurrency": self.concurrency,
+            "cpu_time": self.cpu_time,
+            "cpu_percent": self.cpu_percent,
+            "latency_ms": {
+                **{
+                    f"p{percent:g}": self.latency.percentile(percent) / 1e6
+                    for percent in _PERCENTILES
+                },
+                "max": self.latency.max / 1e6,
+            },
+        }
+
+    def report(self, file: TextIO | None = None) -> None:
+        """Write a readable summary."""
+        file = file or sys.stdout
+        mode = (
+            f"open loop at {self.target_rps:g} rps"
+            if self.target_rps is not None
+            else f"closed loop with {self.concurrency} workers"
+        )
+        error_count = sum(self.errors.values())
+        breakdown = ", ".join(f"{name}={n}" for name, n in self.errors.most_common())
+        percentiles = "  ".join(
+            f"p{percent:g}={self.latency.percentile(percent) / 1e6:.2f}"
+            for percent in _PERCENTILES
+        )
+        cpu_per_call = 1e6 * self.cpu_time / self.requests if self.requests else 0.0
+
+        file.write(
+            f"mode        {mode}\n"
+            f"requests    {self.requests} in {self.elapsed:.2f}s "
+            f"({self.throughput:.1f}/s)\n"
+            f"errors      {error_count}{f' ({breakdown})' if breakdown else ''}\n"
+            f"latency ms  {percentiles}  max={self.latency.max / 1e6:.2f}\n"
+            f"client cpu  {self.cpu_percent:.1f}% ({cpu_per_call:.0f} us/request)\n",
+        )
+
+
+async def run_async(
+    client: BaseAsyncClient,
+    make_method: MethodFactory,
+    duration: float,
+    rps: float | None = None,
+    concurrency: int | None = None,
+    max_in_flight: int = 1000,
+) -> LoadResult:
+    """Drive an async client for `duration` seconds at `rps` or `concurrency`."""
+    result = LoadResult(target_rps=rps, concurrency=concurrency)
+
+    async def call(scheduled_ns: int) -> None:
+        error = None
+        try:
+            await client.call_method(make_method())
+        except Exception as e:
+            error = e
+        result.record(time.perf_counter_ns() - scheduled_ns, error)
+
+    cpu_start = time.process_time()
+    start_ns = time.perf_counter_ns()
+    end_ns = start_ns + int(duration * 1e9)
+
+    if rps is not None:
+        slots = asyncio.Semaphore(max_in_flight)
+        tasks: set[asyncio.Task[None]] = set()
+
+        async def scheduled(at_ns: int) -> None:
+            async with slots:
+                await call(at_ns)
+
+        interval_ns = 1e9 / rps
+        index = 0
+        while (at_ns := start_ns + int(index * interval_ns)) < end_ns:
+            delay = (at_ns - time.perf_counter_ns()) / 1e9
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(scheduled(at_ns))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            index += 1
+        if tasks:
+            await asyncio.gather(*tasks)
+    else:
+
+        async def worker() -> None:
+            while time.perf_counter_ns() < end_ns:
+                await call(time.perf_counter_ns())
+
+        await asyncio.gather(*(worker() for _ in range(concurrency or 1)))
+
+    result.elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+    result.cpu_time = time.process_time() - cpu_start
+    return result
+
+
+def run_sync(
+    client: BaseSyncClient,
+    make_method: MethodFactory,
+    duration: float,
+    rps: float | None = None,
+    concurrency: int | None = None,
+    max_in_flight: int = 1000,
+) -> LoadResult:
+    """Drive a sync client from threads for `duration` seconds."""
+    result = LoadResult(target_rps=rps, concurrency=concurrency)
+    lock = threading.Lock()
+
+    def call(scheduled_ns: int) -> None:
+        error = None
+        try:
+            client.call_method(make_method())
+        except Exception as e:
+            error = e
+        latency_ns = time.perf_counter_ns() - scheduled_ns
+        with lock:
+            result.record(latency_ns, error)
+
+    cpu_start = time.process_time()
+    start_ns = time.perf_counter_ns()
+    end_ns = start_ns + int(duration * 1e9)
+
+    if rps is not None:
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            interval_ns = 1e9 / rps
+            index = 0
+            while (at_ns := start_ns + int(index * interval_ns)) < end_ns:
+                delay = (at_ns - time.perf_counter_ns()) / 1e9
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(call, at_ns)
+                index += 1
+    else:
+
+        def worker() -> None:
+            while time.perf_counter_ns() < end_ns:
+                call(time.perf_counter_ns())
+
+        with ThreadPoolExecutor(max_workers=concurrency or 1) as executor:
+            for _ in range(concurrency or 1):
+                executor.submit(worker)
+
+    result.elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+    result.cpu_time = time.process_time() - cpu_start
+    return result
+
+
+def load_factory(path: str) -> Callable[[], Any]:
+    """Import a ``module:attribute`` factory.
+
+    Raises:
+        ValueError: if `path` has no ``:`` separator.
+    """
+    module_name, sep, attribute = path.partition(":")
+    if not sep:
+        raise ValueError(f"Expected 'module:attribute', got {path!r}")
+    target = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        target = getattr(target, name)
+    return target  # type: ignore[return-value]
+
+
+async def _run_with_factory(
+    factory: Callable[[], Any], args: argparse.Namespace
+) -> LoadResult:
+    target = factory()
+    if inspect.isawaitable(target):
+        target = await target
+    client, make_method = target
+    options = {
+        "duration": args.duration,
+        "rps": args.rps,
+        "concurrency": args.concurrency,
+        "max_in_flight": args.max_in_flight,
+    }
+
+    if isinstance(client, BaseAsyncClient):
+        async with client:
+            return await run_async(client, make_method, **options)
+
+    with client:
+        return await asyncio.to_thread(run_sync, client, make_method, **options)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m unihttp.loadgen",
+        description="Drive a unihttp client and report latency, errors and CPU.",
+    )
+    parser.add_argument(
+        "factory", help="'module:attribute' returning (client, make_method)"
+    )
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--rps", type=float, help="open-loop request rate")
+    mode.add_argument("--concurrency", type=int, help="closed-loop worker count")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=1000,
+        help="open-loop limit of concurrent calls; later calls queue",
+    )
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, "")
+    result = asyncio.run(_run_with_factory(load_factory(args.factory), args))
+    result.report()
+
+    if args.json:
+        with Path(args.json).open("w", encoding="utf-8") as f:
+            json.dump(result.as_dict(), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
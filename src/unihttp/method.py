@@ -1,13 +1,69 @@
+from collections.abc import Callable
 from dataclasses import dataclass
-from types import get_original_bases
+from types import NoneType, get_original_bases
 from typing import Any, ClassVar, TypeVar, get_args
 
+from unihttp.columns import columns_row_type, load_columns
 from unihttp.http.request import HTTPRequest
 from unihttp.http.response import HTTPResponse
-from unihttp.serialize import RequestDumper, ResponseLoader
+from unihttp.serialize import RequestDumper, ResponseLoader, TrustingLoader
+from unihttp.timeouts import get_deadline
 
 ResponseType = TypeVar("ResponseType", bound=Any)
 
+_NOT_SET = object()
+
+
+def _keep_content(content: bytes | memoryview) -> bytes | memoryview:
+    return content
+
+
+def _body(response: HTTPResponse) -> bytes | bytearray | memoryview:
+    # Custom clients may build responses with the body in `data` only.
+    if response.content is not None:
+        return response.content
+    data = response.data
+    if data is None:
+        return b""
+    if isinstance(data, str):
+        return data.encode()
+    if isinstance(data, bytes | bytearray | memoryview):
+        return data
+    raise TypeError(f"Response has no raw body, got {type(data).__name__} data")
+
+
+def _bytes(response: HTTPResponse) -> bytes:
+    return bytes(_body(response))
+
+
+def _text(response: HTTPResponse) -> str:
+    if response.content is None and isinstance(response.data, str):
+        return response.data
+    headers = response.headers
+    content_type = headers.get("Content-Type") or headers.get("content-type") or ""
+    _, _, params = content_type.partition("charset=")
+    charset = params.split(";")[0].strip().strip('"') or "utf-8"
+    try:
+        return str(_body(response), charset, errors="replace")
+    except LookupError:
+        return str(_body(response), "utf-8", errors="replace")
+
+
+def _detached(response: HTTPResponse) -> HTTPResponse:
+    # A body in a reusable buffer would be overwritten by the next request.
+    response.detach()
+    return response
+
+
+# Return types built straight from the response, without the loader.
+_RAW_RESULTS: dict[Any, Callable[[HTTPResponse], Any]] = {
+    bytes: _bytes,
+    str: _text,
+    None: lambda response: None,
+    NoneType: lambda response: None,
+    HTTPResponse: _detached,
+}
+
 
 @dataclass
 class BaseMethod[ResponseType]:
@@ -21,12 +77,33 @@ class BaseMethod[ResponseType]:
         __method__: The HTTP method (e.g., "GET").
         __returning__: The type class of the response (automatically extracted
                        from generic type).
+        __timeout__: Total time budget of a call in seconds, including retries.
+                     None means no limit beyond the session defaults.
+        __trusted__: Skip response validation with a `TrustingLoader` (True),
+                     always validate (False) or follow the loader (None).
+        __projection__: Decode only the keys declared by the return type (True)
+                        or by the given type, skipping the rest of the body.
+                        Requires msgspec. None decodes the whole body.
+        __columns__: Row type of a ``Columns[Row]`` return type, set
+                     automatically. Such responses are loaded column by
+                     column without the response loader.
+
+    Methods returning `bytes`, `str` or None skip both JSON decoding and the
+    response loader on success; `str` is decoded with the charset of the
+    response. Methods returning `HTTPResponse` get the response itself.
     """
 
     __url__: ClassVar[str]
     __method__: ClassVar[str]
+    __timeout__: ClassVar[float | None] = None
+    __trusted__: ClassVar[bool | None] = None
+    __projection__: ClassVar[Any] = None
 
     __returning__: ClassVar[type]
+    __columns__: ClassVar[Any] = None
+    # A staticmethod, so a Callable annotation would be bound to `self` by mypy.
+    _raw_result: ClassVar[Any] = None
+    _response_decoder: ClassVar[Callable[[bytes | memoryview], Any] | None]
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -39,9 +116,41 @@ class BaseMethod[ResponseType]:
                     cls.__returning__ = args[0]
                 break
 
+        returning = getattr(cls, "__returning__", _NOT_SET)
+        if returning is not _NOT_SET:
+            cls.__columns__ = columns_row_type(returning)
+            raw_result = _RAW_RESULTS.get(returning)
+            cls._raw_result = None
+            if raw_result is not None:
+                cls._raw_result = staticmethod(raw_result)
+                if returning is not HTTPResponse:
+                    cls._response_decoder = _keep_content
+
+    @classmethod
+    def response_decoder(cls) -> Callable[[bytes | memoryview], Any] | None:
+        """Return the decoder of successful response bodies, if any.
+
+        Raw return types keep the body undecoded. Otherwise the decoder is
+        built from `__projection__` on first use and cached per class.
+        """
+        decoder = cls.__dict__.get("_response_decoder")
+        if decoder is None and cls.__projection__ is not None:
+            from unihttp.projection import projection_decoder  # noqa: PLC0415
+
+            projection = cls.__projection__
+            decoder = projection_decoder(
+                cls.__returning__ if projection is True else projection
+            )
+            cls._response_decoder = decoder
+        return decoder
+
     def build_http_request(self, request_dumper: RequestDumper) -> HTTPRequest:
         """Convert this method instance into an HTTPRequest.
 
+        The dumper returns the field values grouped by marker name. It may
+        also return ``content`` and ``content_type`` when it encodes the body
+        itself, in which case the client sends that content unchanged.
+
         Args:
             request_dumper: The dumper instance to use for serialization.
 
@@ -68,6 +177,12 @@ class BaseMethod[ResponseType]:
             body=body_data,
             file=file_data,
             form=form_data,
+            content=data.get("content"),
+            content_type=data.get("content_type"),
+            encoded_body=body_data if "content" in data else None,
+            deadline=get_deadline(self.__timeout__),
+            method_name=type(self).__name__,
+            response_decoder=self.response_decoder(),
         )
 
     def make_response(
@@ -84,6 +199,16 @@ class BaseMethod[ResponseType]:
         Returns:
             ResponseType: The deserialized response object.
         """
+        if self._raw_result is not None:
+            return self._raw_result(response)
+        if self.__columns__ is not None:
+            return load_columns(response.data, self.__columns__)  # type: ignore[return-value]
+
+        trusted = self.__trusted__
+        if trusted is not None and isinstance(response_loader, TrustingLoader):
+            if trusted:
+                return response_loader.load_trusted(response.data, self.__returning__)
+            return response_loader.load_validated(response.data, self.__returning__)
         return response_loader.load(response.data, self.__returning__)
 
     def validate_response(self, response: HTTPResponse) -> None:
@@ -0,0 +1,300 @@
+"""In-process call metrics.
+
+`Histogram` is a compact log-linear histogram: values are grouped by power
+of two and every power is split into `2**precision` linear buckets, so each
+bucket is at most `1 / 2**precision` wide relative to its value. Buckets are
+kept in a sparse dict, a few dozen entries cover nanoseconds to minutes.
+
+`MetricsRegistry` aggregates latency histograms per method class and status,
+request/response byte counts, errors and retries. It is filled by
+`MetricsMiddleware` and read through `snapshot()` or `to_openmetrics()`.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+class Histogram:
+    """Log-linear histogram of non-negative integers (e.g. nanoseconds).
+
+    Args:
+        precision: Number of bits of linear resolution inside every power of
+                   two. The relative bucket width is `1 / 2**precision`.
+    """
+
+    __slots__ = ("_counts", "_linear", "_precision", "count", "max", "total")
+
+    def __init__(self, precision: int = 4) -> None:
+        self._precision = precision
+        self._linear = 1 << precision
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        if value < self._linear:
+            index = value
+        else:
+            shift = value.bit_length() - 1 - self._precision
+            index = (shift << self._precision) + (value >> shift)
+
+        counts = self._counts
+        counts[index] = counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    @property
+    def precision(self) -> int:
+        """Number of bits of linear resolution inside every power of two."""
+        return self._precision
+
+    @property
+    def counts(self) -> Mapping[int, int]:
+        """Read-only view of the counts by bucket index."""
+        return MappingProxyType(self._counts)
+
+    def _upper_bound(self, index: int) -> int:
+        """Exclusive upper bound of the values stored in bucket `index`."""
+        if index < 2 * self._linear:
+            return index + 1
+        shift = (index >> self._precision) - 1
+        mantissa = index - (shift << self._precision)
+        return (mantissa + 1) << shift
+
+    def buckets(self) -> list[tuple[int, int]]:
+        """Return `(upper_bound, count)` pairs of non-empty buckets in order."""
+        return [
+            (self._upper_bound(index), self._counts[index])
+            for index in sorted(self._counts)
+        ]
+
+    def percentile(self, percent: float) -> int:
+        """Return the upper bound of the bucket holding the given percentile."""
+        if not self.count:
+            return 0
+
+        rank = self.count * percent / 100
+        seen = 0
+        for upper, count in self.buckets():
+            seen += count
+            if seen >= rank:
+                return min(upper, self.max)
+        return self.max
+
+    def merge(self, other: "Histogram") -> None:
+        if other.precision != self._precision:
+            raise ValueError("Cannot merge histograms of different precision")
+
+        for index, count in other.counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+
+class _Series:
+    __slots__ = ("latency", "request_bytes", "response_bytes")
+
+    def __init__(self, precision: int) -> None:
+        self.latency = Histogram(precision)
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+@dataclass(frozen=True, slots=True)
+class SeriesSnapshot:
+    """Aggregated metrics of one method class and status.
+
+    Attributes:
+        method: Name of the `BaseMethod` subclass.
+        status: HTTP status code, or the exception class name for calls that
+                raised before a response was received.
+        count: Number of calls.
+        total_ns: Sum of call latencies in nanoseconds.
+        p50_ns: Median latency in nanoseconds.
+        p90_ns: 90th percentile latency in nanoseconds.
+        p99_ns: 99th percentile latency in nanoseconds.
+        max_ns: Maximum latency in nanoseconds.
+        request_bytes: Sum of encoded request body sizes.
+        response_bytes: Sum of response body sizes.
+    """
+
+    method: str
+    status: int | str
+    count: int
+    total_ns: int
+    p50_ns: int
+    p90_ns: int
+    p99_ns: int
+    max_ns: int
+    request_bytes: int
+    response_bytes: int
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsSnapshot:
+    """Point-in-time copy of a `MetricsRegistry`.
+
+    Attributes:
+        series: Per method and status aggregates.
+        errors: Calls that raised, per method and exception class name.
+        retries: Retry attempts per method.
+    """
+
+    series: list[SeriesSnapshot]
+    errors: dict[tuple[str, str], int]
+    retries: dict[str, int]
+
+
+class MetricsRegistry:
+    """Collects per-method call metrics in process.
+
+    Recording is not locked: concurrent threads may occasionally lose an
+    increment, which is acceptable for monitoring purposes.
+    """
+
+    def __init__(self, precision: int = 4) -> None:
+        self._precision = precision
+        self._series: dict[tuple[str, int | str], _Series] = {}
+        self._retries: dict[str, int] = {}
+
+    def record(
+        self,
+        method: str,
+        status: int | str,
+        latency_ns: int,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+        attempt: int = 0,
+    ) -> None:
+        """Record one call.
+
+        Args:
+            method: Name of the `BaseMethod` subclass.
+            status: HTTP status code, or the exception class name on failure.
+            latency_ns: Call latency in nanoseconds.
+            request_bytes: Encoded request body size.
+            response_bytes: Response body size.
+            attempt: Attempt number; non-zero attempts are counted as retries.
+        """
+        key = (method, status)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(self._precision)
+
+        series.latency.record(latency_ns)
+        series.request_bytes += request_bytes
+        series.response_bytes += response_bytes
+        if attempt:
+            self._retries[method] = self._retries.get(method, 0) + 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        items = list(self._series.items())
+        return MetricsSnapshot(
+            series=[
+                SeriesSnapshot(
+                    method=method,
+                    status=status,
+                    count=series.latency.count,
+                    total_ns=series.latency.total,
+                    p50_ns=series.latency.percentile(50),
+                    p90_ns=series.latency.percentile(90),
+                    p99_ns=series.latency.percentile(99),
+                    max_ns=series.latency.max,
+                    request_bytes=series.request_bytes,
+                    response_bytes=series.response_bytes,
+                )
+                for (method, status), series in items
+            ],
+            errors={
+                (method, status): series.latency.count
+                for (method, status), series in items
+                if isinstance(status, str)
+            },
+            retries=dict(self._retries),
+        )
+
+    def reset(self) -> None:
+        self._series.clear()
+        self._retries.clear()
+
+    def to_openmetrics(self, prefix: str = "unihttp") -> str:
+        """Render all metrics in the OpenMetrics text format."""
+        duration = f"{prefix}_request_duration_seconds"
+        lines = [
+            f"# TYPE {duration} histogram",
+            f"# UNIT {duration} seconds",
+            f"# HELP {duration} Latency of API method calls.",
+        ]
+        items = list(self._series.items())
+        for (method, status), series in items:
+            labels = _labels(method=method, status=status)
+            cumulative = 0
+            for upper, count in series.latency.buckets():
+                cumulative += count
+                le = _format_float(upper / _NS_PER_SECOND)
+                lines.append(f'{duration}_bucket{{{labels},le="{le}"}} {cumulative}')
+            total = _format_float(series.latency.total / _NS_PER_SECOND)
+            lines.extend((
+                f'{duration}_bucket{{{labels},le="+Inf"}} {series.latency.count}',
+                f"{duration}_count{{{labels}}} {series.latency.count}",
+                f"{duration}_sum{{{labels}}} {total}",
+            ))
+
+        for name, attr, help_text in (
+            ("request_size_bytes", "request_bytes", "Encoded request body bytes."),
+            ("response_size_bytes", "response_bytes", "Response body bytes."),
+        ):
+            metric = f"{prefix}_{name}"
+            lines.extend((
+                f"# TYPE {metric} counter",
+                f"# UNIT {metric} bytes",
+                f"# HELP {metric} {help_text}",
+            ))
+            lines.extend(
+                f"{metric}_total{{{_labels(method=method, status=status)}}} "
+                f"{getattr(series, attr)}"
+                for (method, status), series in items
+            )
+
+        errors = f"{prefix}_errors"
+        lines.extend((
+            f"# TYPE {errors} counter",
+            f"# HELP {errors} API method calls that raised an exception.",
+        ))
+        lines.extend(
+            f"{errors}_total{{{_labels(method=method, error=status)}}} "
+            f"{series.latency.count}"
+            for (method, status), series in items
+            if isinstance(status, str)
+        )
+
+        retries = f"{prefix}_retries"
+        lines.extend((
+            f"# TYPE {retries} counter",
+            f"# HELP {retries} Retry attempts of API method calls.",
+        ))
+        lines.extend(
+            f"{retries}_total{{{_labels(method=method)}}} {count}"
+            for method, count in list(self._retries.items())
+        )
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: object) -> str:
+    return ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items())
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
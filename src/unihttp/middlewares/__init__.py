@@ -1,17 +1,48 @@
-from .base import AsyncHandler, AsyncMiddleware, Handler, Middleware
-from .error_mapper import AsyncErrorMapperMiddleware, SyncErrorMapperMiddleware
-from .logging import AsyncLoggingMiddleware, LoggingMiddleware
-from .retry import AsyncRetryMiddleware, RetryMiddleware
+from typing import TYPE_CHECKING
+
+from unihttp.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import AsyncHandler, AsyncMiddleware, Handler, Middleware
+    from .error_mapper import AsyncErrorMapperMiddleware, SyncErrorMapperMiddleware
+    from .logging import AsyncLoggingMiddleware, LoggingMiddleware
+    from .metrics import AsyncMetricsMiddleware, MetricsMiddleware
+    from .retry import AsyncRetryMiddleware, RetryMiddleware
+    from .sampler import AsyncSlowCallMiddleware, SlowCallMiddleware
 
 __all__ = [
     "AsyncErrorMapperMiddleware",
     "AsyncHandler",
     "AsyncLoggingMiddleware",
+    "AsyncMetricsMiddleware",
     "AsyncMiddleware",
     "AsyncRetryMiddleware",
+    "AsyncSlowCallMiddleware",
     "Handler",
     "LoggingMiddleware",
+    "MetricsMiddleware",
     "Middleware",
     "RetryMiddleware",
+    "SlowCallMiddleware",
     "SyncErrorMapperMiddleware",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncErrorMapperMiddleware": ".error_mapper",
+        "AsyncHandler": ".base",
+        "AsyncLoggingMiddleware": ".logging",
+        "AsyncMetricsMiddleware": ".metrics",
+        "AsyncMiddleware": ".base",
+        "AsyncRetryMiddleware": ".retry",
+        "AsyncSlowCallMiddleware": ".sampler",
+        "Handler": ".base",
+        "LoggingMiddleware": ".logging",
+        "MetricsMiddleware": ".metrics",
+        "Middleware": ".base",
+        "RetryMiddleware": ".retry",
+        "SlowCallMiddleware": ".sampler",
+        "SyncErrorMapperMiddleware": ".error_mapper",
+    },
+)
@@ -6,6 +6,8 @@ from unihttp.middlewares.base import AsyncHandler, AsyncMiddleware, Handler, Mid
 
 
 class LoggingMiddleware(Middleware):
+    reads_response_data = False
+
     def __init__(self, logger: logging.Logger | None = None):
         self.logger = logger or logging.getLogger("unihttp")
 
@@ -17,6 +19,8 @@ class LoggingMiddleware(Middleware):
 
 
 class AsyncLoggingMiddleware(AsyncMiddleware):
+    reads_response_data = False
+
     def __init__(self, logger: logging.Logger | None = None):
         self.logger = logger or logging.getLogger("unihttp")
 
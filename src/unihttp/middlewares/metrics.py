@@ -0,0 +1,68 @@
+from time import perf_counter_ns
+
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+from unihttp.metrics import MetricsRegistry
+from unihttp.middlewares.base import AsyncHandler, AsyncMiddleware, Handler, Middleware
+
+
+class DefaultMetricsMiddleware:
+    """Records latency, body sizes, errors and retries per method class.
+
+    Place it after `RetryMiddleware` so that every attempt is timed and
+    retries are counted; placed before it, one sample covers all attempts.
+
+    Args:
+        registry: Registry to record into. A new one is created if omitted.
+    """
+
+    reads_response_data = False
+
+    def __init__(self, registry: MetricsRegistry | None = None):
+        self.registry = registry or MetricsRegistry()
+
+    def _record(
+        self,
+        request: HTTPRequest,
+        status: int | str,
+        latency_ns: int,
+        response: HTTPResponse | None = None,
+    ) -> None:
+        self.registry.record(
+            request.method_name or request.url,
+            status,
+            latency_ns,
+            request_bytes=len(request.content) if request.content else 0,
+            response_bytes=(
+                len(response.content) if response is not None and response.content else 0
+            ),
+            attempt=request.attempt,
+        )
+
+
+class MetricsMiddleware(DefaultMetricsMiddleware, Middleware):
+    def handle(self, request: HTTPRequest, next_handler: Handler) -> HTTPResponse:
+        start = perf_counter_ns()
+        try:
+            response = next_handler(request)
+        except Exception as e:
+            self._record(request, type(e).__name__, perf_counter_ns() - start)
+            raise
+
+        self._record(request, response.status_code, perf_counter_ns() - start, response)
+        return response
+
+
+class AsyncMetricsMiddleware(DefaultMetricsMiddleware, AsyncMiddleware):
+    async def handle(
+        self, request: HTTPRequest, next_handler: AsyncHandler
+    ) -> HTTPResponse:
+        start = perf_counter_ns()
+        try:
+            response = await next_handler(request)
+        except Exception as e:
+            self._record(request, type(e).__name__, perf_counter_ns() - start)
+            raise
+
+        self._record(request, response.status_code, perf_counter_ns() - start, response)
+        return response
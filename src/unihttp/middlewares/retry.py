@@ -1,13 +1,16 @@
 import asyncio
 import random
 import time
+from dataclasses import replace
 
 from unihttp.http.request import HTTPRequest
 from unihttp.http.response import HTTPResponse
 from unihttp.middlewares.base import AsyncHandler, AsyncMiddleware, Handler, Middleware
 
 
-class RetryMiddleware(Middleware):
+class DefaultRetryMiddleware:
+    reads_response_data = False
+
     def __init__(
         self,
         retries: int = 3,
@@ -22,51 +25,52 @@ class RetryMiddleware(Middleware):
         self.exceptions = exceptions or ()
         self.jitter = jitter
 
+    def _is_retryable(self, exc: Exception) -> bool:
+        return bool(self.exceptions) and isinstance(exc, tuple(self.exceptions))
+
+    def _retry_delay(self, request: HTTPRequest, attempt: int) -> float | None:
+        """Return the delay before the next attempt, or None to stop retrying.
+
+        Retrying stops when attempts are exhausted or when sleeping would
+        run past the request deadline.
+        """
+        if attempt >= self.retries:
+            return None
+
+        delay = self.backoff * (2**attempt)
+        if self.jitter:
+            delay += random.uniform(0, 1)
+
+        if request.deadline is not None and time.monotonic() + delay >= request.deadline:
+            return None
+        return delay
+
+
+class RetryMiddleware(DefaultRetryMiddleware, Middleware):
     def handle(self, request: HTTPRequest, next_handler: Handler) -> HTTPResponse:
         attempt = 0
         while True:
             try:
                 response = next_handler(request)
-                if response.status_code in self.status_codes and attempt < self.retries:
-                    self._sleep(attempt)
-                    attempt += 1
-                    continue
             except Exception as e:
-                # If exception is retryable
-                if (
-                    self.exceptions
-                    and isinstance(e, tuple(self.exceptions))
-                    and attempt < self.retries
-                ):
-                    self._sleep(attempt)
-                    attempt += 1
-                    continue
-                raise
-
-            return response
-
-    def _sleep(self, attempt: int) -> None:
-        sleep_time = self.backoff * (2**attempt)
-        if self.jitter:
-            sleep_time += random.uniform(0, 1)
-        time.sleep(sleep_time)
+                if not self._is_retryable(e):
+                    raise
+                delay = self._retry_delay(request, attempt)
+                if delay is None:
+                    raise
+            else:
+                if response.status_code not in self.status_codes:
+                    return response
+                delay = self._retry_delay(request, attempt)
+                if delay is None:
+                    return response
 
+            time.sleep(delay)
+            attempt += 1
+            request = replace(request, attempt=request.attempt + 1)
 
-class AsyncRetryMiddleware(AsyncMiddleware):
-    def __init__(
-        self,
-        retries: int = 3,
-        backoff: float = 1.0,
-        status_codes: list[int] | None = None,
-        exceptions: list[type[Exception]] | None = None,
-        jitter: bool = True,
-    ):
-        self.retries = retries
-        self.backoff = backoff
-        self.status_codes = status_codes or [500, 502, 503, 504]
-        self.exceptions = exceptions or ()
-        self.jitter = jitter
 
+class AsyncRetryMiddleware(DefaultRetryMiddleware, AsyncMiddleware):
     async def handle(
         self, request: HTTPRequest, next_handler: AsyncHandler
     ) -> HTTPResponse:
@@ -74,25 +78,19 @@ class AsyncRetryMiddleware(AsyncMiddleware):
         while True:
             try:
                 response = await next_handler(request)
-                if response.status_code in self.status_codes and attempt < self.retries:
-                    await self._sleep(attempt)
-                    attempt += 1
-                    continue
             except Exception as e:
-                if (
-                    self.exceptions
-                    and isinstance(e, tuple(self.exceptions))
-                    and attempt < self.retries
-                ):
-                    await self._sleep(attempt)
-                    attempt += 1
-                    continue
-                raise
-
-            return response
+                if not self._is_retryable(e):
+                    raise
+                delay = self._retry_delay(request, attempt)
+                if delay is None:
+                    raise
+            else:
+                if response.status_code not in self.status_codes:
+                    return response
+                delay = self._retry_delay(request, attempt)
+                if delay is None:
+                    return response
 
-    async def _sleep(self, attempt: int) -> None:
-        sleep_time = self.backoff * (2**attempt)
-        if self.jitter:
-            sleep_time += random.uniform(0, 1)
-        await asyncio.sleep(sleep_time)
+            await asyncio.sleep(delay)
+            attempt += 1
+            request = replace(request, attempt=request.attempt + 1)
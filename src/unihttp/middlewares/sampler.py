@@ -0,0 +1,61 @@
+from time import perf_counter_ns
+
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+from unihttp.middlewares.base import AsyncHandler, AsyncMiddleware, Handler, Middleware
+from unihttp.sampler import SlowCallSampler
+
+
+class DefaultSlowCallMiddleware:
+    """Records slow and sampled calls into a `SlowCallSampler`.
+
+    Place it first to cover the whole chain. Enable `record_timings` on the
+    client to get phase timings, including dump and load, in the records,
+    and attach the sampler to the client to profile calls.
+
+    `cProfile` measures the whole thread, so profiles of async calls also
+    include other tasks that ran on the event loop while the call awaited.
+    """
+
+    def __init__(self, sampler: SlowCallSampler):
+        self.sampler = sampler
+
+    def _finish(
+        self,
+        request: HTTPRequest,
+        status: int | str,
+        start: int,
+        response: HTTPResponse | None = None,
+    ) -> None:
+        sampled, profiler = self.sampler.current()
+        self.sampler.finish(
+            request, status, perf_counter_ns() - start, sampled, profiler, response
+        )
+
+
+class SlowCallMiddleware(DefaultSlowCallMiddleware, Middleware):
+    def handle(self, request: HTTPRequest, next_handler: Handler) -> HTTPResponse:
+        start = perf_counter_ns()
+        try:
+            response = next_handler(request)
+        except Exception as e:
+            self._finish(request, type(e).__name__, start)
+            raise
+
+        self._finish(request, response.status_code, start, response)
+        return response
+
+
+class AsyncSlowCallMiddleware(DefaultSlowCallMiddleware, AsyncMiddleware):
+    async def handle(
+        self, request: HTTPRequest, next_handler: AsyncHandler
+    ) -> HTTPResponse:
+        start = perf_counter_ns()
+        try:
+            response = await next_handler(request)
+        except Exception as e:
+            self._finish(request, type(e).__name__, start)
+            raise
+
+        self._finish(request, response.status_code, start, response)
+        return response
@@ -0,0 +1,82 @@
+"""Decode-time projection of response bodies.
+
+Wide responses often carry far more fields than the return type reads.
+A projection is a tree of ``TypedDict`` types mirroring the keys the return
+type declares; msgspec decodes the body into it and skips every other key
+without materializing it. The loader then receives a much smaller tree.
+
+Keys come from dataclass and ``TypedDict`` field names, pydantic aliases
+and msgspec encode names. Serializers renaming fields on their own (e.g.
+an adaptix `name_mapping`) need an explicit projection type declaring the
+keys as they appear in the response.
+"""
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from types import NoneType, UnionType
+from typing import (
+    Annotated,
+    Any,
+    TypedDict,
+    Union,
+    get_args,
+    get_origin,
+)
+
+import msgspec
+
+from unihttp.columns import Columns
+from unihttp.records import record_fields
+
+_SEQUENCES = (list, set, frozenset, Sequence, Iterable)
+_MAPPINGS = (dict, Mapping)
+
+
+def projection_type(tp: Any, _seen: frozenset[Any] = frozenset()) -> Any:
+    """Build the type keeping only the keys that `tp` declares.
+
+    Records become ``TypedDict`` types with all keys optional, collections
+    keep their shape and everything else decodes as-is.
+    """
+    origin = get_origin(tp)
+    if origin is Annotated:
+        return projection_type(get_args(tp)[0], _seen)
+    if origin in {Union, UnionType}:
+        args = [arg for arg in get_args(tp) if arg is not NoneType]
+        if len(args) == 1:
+            return projection_type(args[0], _seen) | None
+        return Any
+    if origin is Columns:
+        return list[projection_type(get_args(tp)[0], _seen)]  # type: ignore[misc]
+    if origin in _SEQUENCES or (origin is tuple and get_args(tp)[1:] == (...,)):
+        return list[projection_type(get_args(tp)[0], _seen)]  # type: ignore[misc]
+    if origin in _MAPPINGS and len(get_args(tp)) == 2:
+        return dict[str, projection_type(get_args(tp)[1], _seen)]  # type: ignore[misc]
+    if tp in _seen:
+        return Any  # recursive model
+
+    fields = record_fields(tp)
+    if fields is None:
+        return Any
+    seen = _seen | {tp}
+    return TypedDict(  # type: ignore[operator]
+        f"{tp.__name__}Projection",
+        {key: projection_type(field_type, seen) for _, key, field_type in fields},
+        total=False,
+    )
+
+
+def projection_decoder(tp: Any) -> Callable[[bytes | memoryview], Any]:
+    """Return a JSON decoder keeping only the keys that `tp` declares.
+
+    The decoder raises `ValueError` when the body does not match the shape
+    of the projection or is not valid JSON.
+    """
+    decoder = msgspec.json.Decoder(projection_type(tp))
+
+    def decode(content: bytes | memoryview) -> Any:
+        try:
+            return decoder.decode(content)
+        except msgspec.MsgspecError as e:
+            raise ValueError(str(e)) from e
+
+    return decode
@@ -0,0 +1,286 @@
+"""Recording of real traffic for offline replay.
+
+`Recorder.attach` wraps a client's `make_request` and stores every request
+and response it sees, with the observed latency, as an `Exchange`. A
+`Recording` is saved as gzip-compressed JSON lines and served back by
+`ReplaySyncClient`/`ReplayAsyncClient`, so serializers and middleware can
+be benchmarked and profiled on production payloads without a network.
+"""
+
+import base64
+import gzip
+import hashlib
+import inspect
+import json
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from unihttp.clients.base import BaseAsyncClient, BaseSyncClient
+from unihttp.exceptions import ReplayMissError
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+
+FORMAT = "unihttp-recording"
+VERSION = 1
+
+REDACTED = "[redacted]"
+DEFAULT_REDACTED_HEADERS = frozenset({"authorization", "cookie", "proxy-authorization"})
+
+ExchangeKey = tuple[str, str, str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class Exchange:
+    """A recorded request/response pair.
+
+    Attributes:
+        method: HTTP method.
+        url: Request URL, relative to the client base URL.
+        query: Query parameters as sent.
+        request_headers: Request headers, with secrets redacted.
+        request_content: Encoded request body.
+        form: Form fields of the request, as strings.
+        status_code: Response status code, 0 if the request failed.
+        headers: Response headers.
+        content: Raw response body.
+        latency_ns: Time `make_request` took, in nanoseconds.
+        method_name: Name of the `BaseMethod` subclass that built the request.
+        error: Name of the exception raised by the transport, if any.
+    """
+
+    method: str
+    url: str
+    query: dict[str, Any]
+    request_headers: dict[str, str]
+    request_content: bytes | None
+    form: dict[str, str]
+    status_code: int
+    headers: dict[str, str]
+    content: bytes | None
+    latency_ns: int
+    method_name: str | None = None
+    error: str | None = None
+
+    def key(self, match_body: bool = True) -> ExchangeKey:
+        return _key(self.method, self.url, self.query, self.request_content, match_body)
+
+
+def _key(
+    method: str,
+    url: str,
+    query: dict[str, Any],
+    content: bytes | None,
+    match_body: bool,
+) -> ExchangeKey:
+    body = ""
+    if match_body and content:
+        body = hashlib.sha1(content, usedforsecurity=False).hexdigest()
+    return method.upper(), url, json.dumps(query, sort_keys=True, default=str), body
+
+
+def request_key(request: HTTPRequest, match_body: bool = True) -> ExchangeKey:
+    """Key under which a replay looks up the recorded exchange of `request`."""
+    return _key(request.method, request.url, request.query, request.content, match_body)
+
+
+def _copy_content(response: HTTPResponse | None) -> bytes | None:
+    # Bodies read into a reusable buffer are overwritten by the next request.
+    if response is None or response.content is None:
+        return None
+    return bytes(response.content)
+
+
+def _encode_bytes(value: bytes | None) -> str | None:
+    return None if value is None else base64.b64encode(value).decode("ascii")
+
+
+def _decode_bytes(value: str | None) -> bytes | None:
+    return None if value is None else base64.b64decode(value)
+
+
+class Recording:
+    """An ordered collection of exchanges.
+
+    Replays serve the exchanges recorded for the same request in their
+    recorded order and start over once all of them were served.
+
+    Args:
+        exchanges: The recorded exchanges.
+        match_body: Tell requests apart by their body as well as by method,
+                    URL and query.
+    """
+
+    def __init__(self, exchanges: Iterable[Exchange] = (), match_body: bool = True):
+        self.exchanges = list(exchanges)
+        self.match_body = match_body
+        self._index: dict[ExchangeKey, list[Exchange]] = {}
+        for exchange in self.exchanges:
+            self._index.setdefault(exchange.key(match_body), []).append(exchange)
+        self._cursors: dict[ExchangeKey, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.exchanges)
+
+    def __iter__(self) -> Iterator[Exchange]:
+        return iter(self.exchanges)
+
+    def lookup(self, request: HTTPRequest) -> Exchange:
+        """Return the next recorded exchange for `request`.
+
+        Raises:
+            ReplayMissError: if nothing was recorded for the request.
+        """
+        key = request_key(request, self.match_body)
+        candidates = self._index.get(key)
+        if not candidates:
+            raise ReplayMissError(
+                f"No recorded exchange for {request.method} {request.url}"
+            )
+        with self._lock:
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+        return candidates[cursor % len(candidates)]
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the exchanges as gzip-compressed JSON lines."""
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"format": FORMAT, "version": VERSION}) + "\n")
+            for exchange in self.exchanges:
+                record = asdict(exchange)
+                record["request_content"] = _encode_bytes(exchange.request_content)
+                record["content"] = _encode_bytes(exchange.content)
+                f.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str], match_body: bool = True) -> "Recording":
+        """Read a recording written by `save`.
+
+        Raises:
+            ValueError: if the file is not a unihttp recording.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("format") != FORMAT:
+                raise ValueError(f"{path} is not a unihttp recording")
+            if header.get("version") != VERSION:
+                raise ValueError(f"Unsupported recording version {header.get('version')}")
+
+            exchanges = []
+            for line in f:
+                record = json.loads(line)
+                record["request_content"] = _decode_bytes(record["request_content"])
+                record["content"] = _decode_bytes(record["content"])
+                exchanges.append(Exchange(**record))
+        return cls(exchanges, match_body=match_body)
+
+
+class Recorder:
+    """Records the requests a client sends and the responses it receives.
+
+    Example:
+        >>> recorder = Recorder()
+        >>> recorder.attach(client)
+        >>> client.get_user(id=1)
+        >>> recorder.save("traffic.jsonl.gz")
+
+    Args:
+        redact_headers: Request headers whose values are not stored,
+                        compared case-insensitively.
+    """
+
+    def __init__(self, redact_headers: Iterable[str] = DEFAULT_REDACTED_HEADERS):
+        self.redact_headers = frozenset(name.lower() for name in redact_headers)
+        self.exchanges: list[Exchange] = []
+
+    def attach(self, client: BaseSyncClient | BaseAsyncClient) -> None:
+        """Wrap `client.make_request` to record every request it sends.
+
+        Requests are recorded after middleware ran, once per attempt.
+        """
+        make_request: Callable[[HTTPRequest], Any] = client.make_request
+
+        if inspect.iscoroutinefunction(make_request):
+
+            async def record_async(request: HTTPRequest) -> HTTPResponse:
+                request = client.encode_request(request)
+                return await self._record_async(make_request, request)
+
+            client.make_request = record_async  # type: ignore[method-assign]
+        else:
+
+            def record(request: HTTPRequest) -> HTTPResponse:
+                return self._record(make_request, client.encode_request(request))
+
+            client.make_request = record  # type: ignore[method-assign]
+
+    def _record(
+        self,
+        make_request: Callable[[HTTPRequest], HTTPResponse],
+        request: HTTPRequest,
+    ) -> HTTPResponse:
+        start = time.perf_counter_ns()
+        try:
+            response = make_request(request)
+        except Exception as e:
+            self.add(request, None, time.perf_counter_ns() - start, e)
+            raise
+        self.add(request, response, time.perf_counter_ns() - start)
+        return response
+
+    async def _record_async(
+        self,
+        make_request: Callable[[HTTPRequest], Awaitable[HTTPResponse]],
+        request: HTTPRequest,
+    ) -> HTTPResponse:
+        start = time.perf_counter_ns()
+        try:
+            response = await make_request(request)
+        except Exception as e:
+            self.add(request, None, time.perf_counter_ns() - start, e)
+            raise
+        self.add(request, response, time.perf_counter_ns() - start)
+        return response
+
+    def add(
+        self,
+        request: HTTPRequest,
+        response: HTTPResponse | None,
+        latency_ns: int,
+        error: Exception | None = None,
+    ) -> None:
+        """Store one exchange."""
+        self.exchanges.append(
+            Exchange(
+                method=request.method,
+                url=request.url,
+                query=request.query,
+                request_headers={
+                    name: REDACTED if name.lower() in self.redact_headers else value
+                    for name, value in request.header.items()
+                },
+                request_content=request.content,
+                form={key: str(value) for key, value in (request.form or {}).items()},
+                status_code=0 if response is None else response.status_code,
+                headers={} if response is None else dict(response.headers),
+                content=_copy_content(response),
+                latency_ns=latency_ns,
+                method_name=request.method_name,
+                error=None if error is None else type(error).__name__,
+            ),
+        )
+
+    def recording(self, match_body: bool = True) -> Recording:
+        """Return the exchanges recorded so far as a `Recording`."""
+        return Recording(self.exchanges, match_body=match_body)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the exchanges recorded so far to `path`."""
+        self.recording().save(path)
+
+    def clear(self) -> None:
+        self.exchanges.clear()
@@ -0,0 +1,36 @@
+"""Field introspection of record types used as return types."""
+
+import dataclasses
+from typing import Any, get_type_hints, is_typeddict
+
+
+def record_fields(tp: Any) -> list[tuple[str, str, Any]] | None:
+    """Return the fields of a record type, or None if `tp` is not one.
+
+    Dataclasses, ``TypedDict`` types, pydantic models and msgspec structs
+    are records.
+
+    Returns:
+        ``(attribute, key, type)`` for each field, where `key` is the name
+        of the field in response bodies: the pydantic alias or the msgspec
+        encode name when set.
+    """
+    if not isinstance(tp, type):
+        return None
+    if hasattr(tp, "__struct_fields__"):  # msgspec
+        import msgspec  # noqa: PLC0415
+
+        return [(f.name, f.encode_name, f.type) for f in msgspec.structs.fields(tp)]
+    if hasattr(tp, "model_fields"):  # pydantic
+        fields = []
+        for name, field in tp.model_fields.items():
+            alias = field.validation_alias
+            key = alias if isinstance(alias, str) else field.alias or name
+            fields.append((name, key, field.annotation))
+        return fields
+    if dataclasses.is_dataclass(tp):
+        hints = get_type_hints(tp)
+        return [(f.name, f.name, hints.get(f.name, Any)) for f in dataclasses.fields(tp)]
+    if is_typeddict(tp):
+        return [(name, name, hint) for name, hint in get_type_hints(tp).items()]
+    return None
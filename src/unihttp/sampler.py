@@ -0,0 +1,232 @@
+"""Capture of slow and randomly sampled calls.
+
+`SlowCallSampler` keeps the last `capacity` interesting calls in a ring
+buffer: calls slower than `threshold`, plus a random `sample_rate` fraction
+of all calls. Filled by `SlowCallMiddleware`.
+
+Once attached to a client, a `profile_rate` fraction of calls is run under
+`cProfile`, from dumping the request to loading the response. The profile
+is kept when the call ends up recorded, so slow outliers come with evidence
+of where the CPU time went.
+"""
+
+import cProfile
+import inspect
+import io
+import pstats
+import random
+import sys
+import time
+from collections import deque
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Literal, TextIO
+
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+from unihttp.timings import CallTimings
+
+
+@dataclass(frozen=True, slots=True)
+class SlowCall:
+    """A recorded call.
+
+    Attributes:
+        method: Name of the `BaseMethod` subclass.
+        url: Request URL.
+        status: HTTP status code, or the exception class name on failure.
+        reason: Why the call was recorded.
+        started_at: Wall clock start time, `time.time()` seconds.
+        elapsed_ns: Time spent below the middleware, in nanoseconds.
+        attempt: Attempt number set by retry middleware.
+        request_bytes: Encoded request body size.
+        response_bytes: Response body size.
+        timings: Phase timings, if the client has `record_timings` enabled.
+                 Completed by the client after the call returns.
+        profile: `cProfile` data of the call, if it was profiled. Complete
+                 once the call returns.
+    """
+
+    method: str
+    url: str
+    status: int | str
+    reason: Literal["threshold", "sample"]
+    started_at: float
+    elapsed_ns: int
+    attempt: int
+    request_bytes: int
+    response_bytes: int
+    timings: CallTimings | None = None
+    profile: cProfile.Profile | None = None
+
+    def profile_text(self, limit: int = 20, sort: str = "cumulative") -> str:
+        """Return the top `limit` profile entries as text."""
+        if self.profile is None:
+            return ""
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+
+class SlowCallSampler:
+    """Ring buffer of slow and sampled calls.
+
+    Args:
+        threshold: Record calls taking at least this many seconds.
+                   None records sampled calls only.
+        sample_rate: Fraction of calls recorded regardless of duration.
+        profile_rate: Fraction of calls run under `cProfile`, see `attach`.
+                      Calls selected by `sample_rate` are always profiled
+                      when `profile_rate >= sample_rate`.
+        capacity: Number of calls kept; the oldest are dropped first.
+    """
+
+    def __init__(
+        self,
+        threshold: float | None = 1.0,
+        sample_rate: float = 0.0,
+        profile_rate: float = 0.0,
+        capacity: int = 100,
+    ):
+        self.threshold_ns = None if threshold is None else int(threshold * 1e9)
+        self.sample_rate = sample_rate
+        self.profile_rate = profile_rate
+        self._calls: deque[SlowCall] = deque(maxlen=capacity)
+        self._current: ContextVar[tuple[bool, cProfile.Profile | None] | None] = (
+            ContextVar(f"slow_call_{id(self)}", default=None)
+        )
+
+    def attach(self, client: Any) -> None:
+        """Wrap `client.call_method` to profile whole calls.
+
+        The profile then covers the request dump and the response load,
+        which run outside the middleware chain. Without it, no call is
+        profiled.
+        """
+        call_method: Callable[[Any], Any] = client.call_method
+
+        if inspect.iscoroutinefunction(call_method):
+
+            async def call_async(method: Any) -> Any:
+                token = self._current.set(self.start())
+                try:
+                    return await call_method(method)
+                finally:
+                    self._stop(token)
+
+            client.call_method = call_async
+        else:
+
+            def call(method: Any) -> Any:
+                token = self._current.set(self.start())
+                try:
+                    return call_method(method)
+                finally:
+                    self._stop(token)
+
+            client.call_method = call
+
+    def _stop(self, token: Any) -> None:
+        _, profiler = self._current.get() or (False, None)
+        self._current.reset(token)
+        if profiler is not None:
+            profiler.disable()
+
+    def start(self) -> tuple[bool, cProfile.Profile | None]:
+        """Decide up front whether a call is sampled and whether to profile it.
+
+        Returns:
+            The sampling decision and an enabled profiler, if any.
+        """
+        if not self.sample_rate and not self.profile_rate:
+            return False, None
+
+        draw = random.random()
+        profiler = None
+        if draw < self.profile_rate:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:  # another profiler is already active
+                profiler = None
+        return draw < self.sample_rate, profiler
+
+    def current(self) -> tuple[bool, cProfile.Profile | None]:
+        """Return the sampling decision and profiler of the running call.
+
+        Calls made through an attached client share the decision taken when
+        the call started. Other calls are drawn here and never profiled.
+        """
+        current = self._current.get()
+        if current is not None:
+            return current
+        return bool(self.sample_rate) and random.random() < self.sample_rate, None
+
+    def finish(
+        self,
+        request: HTTPRequest,
+        status: int | str,
+        elapsed_ns: int,
+        sampled: bool,
+        profiler: cProfile.Profile | None,
+        response: HTTPResponse | None = None,
+    ) -> None:
+        """Record the call if it was slow or sampled."""
+        if self.threshold_ns is not None and elapsed_ns >= self.threshold_ns:
+            reason: Literal["threshold", "sample"] = "threshold"
+        elif sampled:
+            reason = "sample"
+        else:
+            return
+
+        self._calls.append(
+            SlowCall(
+                method=request.method_name or request.url,
+                url=request.url,
+                status=status,
+                reason=reason,
+                started_at=time.time() - elapsed_ns / 1e9,
+                elapsed_ns=elapsed_ns,
+                attempt=request.attempt,
+                request_bytes=len(request.content) if request.content else 0,
+                response_bytes=(
+                    len(response.content)
+                    if response is not None and response.content
+                    else 0
+                ),
+                timings=request.timings,
+                profile=profiler,
+            ),
+        )
+
+    def records(self) -> list[SlowCall]:
+        """Return the recorded calls, oldest first."""
+        return list(self._calls)
+
+    def clear(self) -> None:
+        self._calls.clear()
+
+    def dump(self, file: TextIO | None = None, profile_limit: int = 20) -> None:
+        """Write a readable report of the recorded calls.
+
+        Args:
+            file: Where to write, `sys.stderr` by default.
+            profile_limit: Profile entries printed per call.
+        """
+        file = file or sys.stderr
+        for call in self.records():
+            file.write(
+                f"{call.method} {call.url} -> {call.status} "
+                f"{call.elapsed_ns / 1e6:.3f} ms ({call.reason}, attempt "
+                f"{call.attempt}, {call.request_bytes} B sent, "
+                f"{call.response_bytes} B received)\n",
+            )
+            if call.timings is not None:
+                phases = ", ".join(
+                    f"{name}={value / 1e6:.3f}"
+                    for name, value in call.timings.as_dict().items()
+                )
+                file.write(f"  phases (ms): {phases}\n")
+            if call.profile is not None:
+                file.write(call.profile_text(profile_limit))
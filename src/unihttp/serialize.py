@@ -1,3 +1,4 @@
+import random
 from typing import Any, Protocol, TypeVar
 
 T = TypeVar("T")
@@ -9,3 +10,43 @@ class RequestDumper(Protocol):
 
 class ResponseLoader(Protocol):
     def load(self, data: Any, tp: type[T]) -> T: ...
+
+
+class TrustingLoader(ResponseLoader):
+    """Base of loaders with a less strict mode for trusted responses.
+
+    Responses from upstreams whose schema is under our control do not need
+    full validation on every call. Trusted loading uses the most lenient
+    load the backend offers, which coerces input the strict load rejects,
+    and fully validates a random `validation_rate` fraction of responses,
+    so schema drift still surfaces as validation errors.
+
+    Trusted loading applies to every call when `trusted` is set, or to the
+    methods whose `__trusted__` is True. Methods with `__trusted__ = False`
+    are always validated.
+
+    Args:
+        trusted: Load every response in trusted mode.
+        validation_rate: Fraction of trusted loads that are fully validated.
+    """
+
+    def __init__(self, *, trusted: bool = False, validation_rate: float = 0.0):
+        self.trusted = trusted
+        self.validation_rate = validation_rate
+
+    def load(self, data: Any, tp: type[T]) -> T:
+        if self.trusted:
+            return self.load_trusted(data, tp)
+        return self.load_validated(data, tp)
+
+    def load_trusted(self, data: Any, tp: type[T]) -> T:
+        """Load leniently, except for a sampled fraction of calls."""
+        if self.validation_rate and random.random() < self.validation_rate:
+            return self.load_validated(data, tp)
+        return self.load_unvalidated(data, tp)
+
+    def load_validated(self, data: Any, tp: type[T]) -> T:
+        raise NotImplementedError
+
+    def load_unvalidated(self, data: Any, tp: type[T]) -> T:
+        raise NotImplementedError
@@ -1,7 +1,12 @@
-from .marker_tools import for_marker
-from .omitted import omitted_provider
-from .provider import method_provider
-from .serialize import DEFAULT_RETORT, AdaptixDumper, AdaptixLoader
+from typing import TYPE_CHECKING
+
+from unihttp.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .marker_tools import for_marker
+    from .omitted import omitted_provider
+    from .provider import method_provider
+    from .serialize import DEFAULT_RETORT, AdaptixDumper, AdaptixLoader
 
 __all__ = [
     "DEFAULT_RETORT",
@@ -11,3 +16,15 @@ __all__ = [
     "method_provider",
     "omitted_provider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DEFAULT_RETORT": ".serialize",
+        "AdaptixDumper": ".serialize",
+        "AdaptixLoader": ".serialize",
+        "for_marker": ".marker_tools",
+        "method_provider": ".provider",
+        "omitted_provider": ".omitted",
+    },
+)
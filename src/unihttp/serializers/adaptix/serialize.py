@@ -1,15 +1,21 @@
+import threading
+from collections.abc import Callable, Iterable
+from functools import cached_property
 from typing import Any, TypeVar
 
 from unihttp.http import UploadFile
+from unihttp.method import BaseMethod
 from unihttp.omitted import Omitted
-from unihttp.serialize import RequestDumper, ResponseLoader
+from unihttp.serialize import RequestDumper, TrustingLoader
 from unihttp.serializers.adaptix.provider import method_provider
 
-from adaptix import Retort, as_sentinel, dumper
+from adaptix import DebugTrail, Retort, as_sentinel, dumper
 from adaptix._internal.morphing.generic_provider import TypeHintTagsUnwrappingProvider
 
 T = TypeVar("T")
 
+_CACHE_LOCK = threading.Lock()
+
 DEFAULT_RETORT = Retort(
     recipe=[
         as_sentinel(Omitted),
@@ -21,16 +27,111 @@ DEFAULT_RETORT = Retort(
 
 
 class AdaptixDumper(RequestDumper):
-    def __init__(self, retort: Retort):
+    """Request dumper using the converters compiled by a retort.
+
+    The converter of each method class is looked up once and cached. When
+    more than `max_types` classes are cached (e.g. with dynamically created
+    method classes), the oldest entry is evicted.
+    """
+
+    def __init__(self, retort: Retort, max_types: int = 1024):
         self.retort = retort
+        self.max_types = max_types
+        self._dumpers: dict[Any, Callable[[Any], Any]] = {}
 
     def dump(self, obj: Any) -> Any:
-        return self.retort.dump(obj)
+        dump = self._dumpers.get(type(obj))
+        if dump is None:
+            dump = self._compile(type(obj))
+        return dump(obj)
+
+    def warmup(self, method_types: Iterable[type[BaseMethod[Any]]]) -> None:
+        """Compile the dumpers of `method_types` ahead of the first call."""
+        for method_type in method_types:
+            self._compile(method_type)
+
+    def _compile(self, tp: Any) -> Callable[[Any], Any]:
+        dump = self.retort.get_dumper(tp)
+        _cache(self._dumpers, tp, dump, self.max_types)
+        return dump
+
+
+class AdaptixLoader(TrustingLoader):
+    """Response loader using the converters compiled by a retort.
+
+    The converter of each return type is looked up once and cached, with
+    the same eviction as `AdaptixDumper`. Trusted loads use converters
+    compiled with lenient coercion, e.g. accepting ``"1"`` for an int, and
+    without the debug trail, so their errors do not locate the failing
+    field. They still check the input and raise on data they cannot load.
 
+    Args:
+        retort: Retort compiling the loaders.
+        max_types: Number of cached converters before the oldest is evicted.
+        trusted: Load every response in trusted mode, see `TrustingLoader`.
+        validation_rate: Fraction of trusted loads that are fully validated.
+    """
 
-class AdaptixLoader(ResponseLoader):
-    def __init__(self, retort: Retort):
+    def __init__(
+        self,
+        retort: Retort,
+        max_types: int = 1024,
+        *,
+        trusted: bool = False,
+        validation_rate: float = 0.0,
+    ):
+        super().__init__(trusted=trusted, validation_rate=validation_rate)
         self.retort = retort
+        self.max_types = max_types
+        self._loaders: dict[Any, Callable[[Any], Any]] = {}
+        self._lenient_loaders: dict[Any, Callable[[Any], Any]] = {}
+
+    @cached_property
+    def _lenient_retort(self) -> Retort:
+        return self.retort.replace(
+            strict_coercion=False,
+            debug_trail=DebugTrail.DISABLE,
+        )
+
+    def load_validated(self, data: Any, tp: type[T]) -> T:
+        load = self._loaders.get(tp)
+        if load is None:
+            load = self._compile(tp)
+        return load(data)
+
+    def load_unvalidated(self, data: Any, tp: type[T]) -> T:
+        load = self._lenient_loaders.get(tp)
+        if load is None:
+            load = self._compile_lenient(tp)
+        return load(data)
+
+    def warmup(self, method_types: Iterable[type[BaseMethod[Any]]]) -> None:
+        """Compile the loaders of the return types of `method_types`."""
+        for method_type in method_types:
+            if hasattr(method_type, "__returning__"):
+                self._compile(method_type.__returning__)
+                if self.trusted or method_type.__trusted__:
+                    self._compile_lenient(method_type.__returning__)
+
+    def _compile(self, tp: Any) -> Callable[[Any], Any]:
+        load = self.retort.get_loader(tp)
+        _cache(self._loaders, tp, load, self.max_types)
+        return load
+
+    def _compile_lenient(self, tp: Any) -> Callable[[Any], Any]:
+        load = self._lenient_retort.get_loader(tp)
+        _cache(self._lenient_loaders, tp, load, self.max_types)
+        return load
+
 
-    def load(self, data: Any, tp: type[T]) -> T:
-        return self.retort.load(data, tp)
+def _cache(
+    cache: dict[Any, Callable[[Any], Any]],
+    tp: Any,
+    converter: Callable[[Any], Any],
+    max_types: int,
+) -> None:
+    # Lookups are lock-free; concurrent misses must not evict the same entry.
+    with _CACHE_LOCK:
+        if tp not in cache and len(cache) >= max_types:
+            del cache[next(iter(cache))]
+        cache[tp] = converter
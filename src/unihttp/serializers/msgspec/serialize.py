@@ -1,16 +1,51 @@
-from typing import Any, TypeVar, get_args, get_origin, get_type_hints
+from collections.abc import Callable, Iterable
+from typing import Any, Literal, TypeVar, get_args, get_origin, get_type_hints
 
 from unihttp.http import UploadFile
-from unihttp.markers import Marker
+from unihttp.markers import BodyMarker, Marker
+from unihttp.method import BaseMethod
 from unihttp.omitted import Omitted
-from unihttp.serialize import RequestDumper, ResponseLoader
+from unihttp.serialize import RequestDumper, TrustingLoader
 
 import msgspec
 
 T = TypeVar("T")
 
+_Decoder = msgspec.json.Decoder[Any] | msgspec.msgpack.Decoder[Any]
+
+# Values of these types are already builtins and are dumped as-is.
+_SCALARS = frozenset({str, int, float, bool})
+
+# (attribute, bucket, converter); a None converter keeps the value unchanged.
+_DumpPlan = tuple[tuple[str, str, Callable[[Any], Any] | None], ...]
+
+
+def _to_builtins(value: Any) -> Any:
+    if isinstance(value, UploadFile):
+        return value.to_tuple()
+    return msgspec.to_builtins(value)
+
 
 class MsgspecDumper(RequestDumper):
+    """Request dumper based on msgspec.
+
+    The fields of each method class are resolved once into a dump plan, so
+    dumping a method does no typing introspection.
+
+    Args:
+        encode_body: Encode the `Body` fields to JSON with a single
+                     `msgspec.json.Encoder` call instead of converting them
+                     to builtins for the client's `json_dumps`. The request
+                     then carries the encoded `content` and its `body` keeps
+                     the original values. Requests with `File` or `Form`
+                     fields are never encoded here.
+    """
+
+    def __init__(self, *, encode_body: bool = False):
+        self.encode_body = encode_body
+        self._encoder = msgspec.json.Encoder()
+        self._plans: dict[type, _DumpPlan] = {}
+
     def dump(self, obj: Any) -> Any:
         data: dict[str, Any] = {
             "path": {},
@@ -22,52 +57,116 @@ class MsgspecDumper(RequestDumper):
         }
 
         cls = type(obj)
+        plan = self._plans.get(cls)
+        if plan is None:
+            plan = self._plans[cls] = self._build_plan(cls)
+
+        values = vars(obj)
+        for field_name, bucket, convert in plan:
+            if field_name not in values:
+                continue
+            field_value = values[field_name]
+            if isinstance(field_value, Omitted):
+                continue
+            data[bucket][field_name] = (
+                field_value if convert is None else convert(field_value)
+            )
+
+        if self.encode_body and data["body"] and not data["file"] and not data["form"]:
+            data["content"] = self._encoder.encode(data["body"])
+            data["content_type"] = "application/json"
+
+        return data
 
+    def warmup(self, method_types: Iterable[type[BaseMethod[Any]]]) -> None:
+        """Build the dump plans of `method_types` ahead of the first call."""
+        for method_type in method_types:
+            self._plans[method_type] = self._build_plan(method_type)
+
+    def _build_plan(self, cls: type) -> _DumpPlan:
         try:
             type_hints = get_type_hints(cls, include_extras=True)
         except Exception:
             type_hints = cls.__annotations__  # Fallback
 
-        for field_name, field_value in vars(obj).items():
-            if field_name.startswith("__"):
+        plan = []
+        for field_name, hint in type_hints.items():
+            if field_name.startswith("__") or get_origin(hint) is None:
                 continue
 
-            hint = type_hints.get(field_name)
-            if hint is None:
+            args = get_args(hint)
+            marker = next((arg for arg in args if isinstance(arg, Marker)), None)
+            if marker is None:
                 continue
 
-            self._process_field(data, field_name, field_value, hint)
-
-        return data
-
-    def _process_field(
+            convert: Callable[[Any], Any] | None = _to_builtins
+            if args[0] in _SCALARS or (
+                self.encode_body and isinstance(marker, BodyMarker)
+            ):
+                convert = None
+            plan.append((field_name, marker.name, convert))
+        return tuple(plan)
+
+
+class MsgspecLoader(TrustingLoader):
+    """Response loader based on msgspec.
+
+    Already parsed data is converted with `msgspec.convert`. With
+    `decodes_content`, the raw bodies (bytes, bytearray or memoryview) the
+    client passes undecoded are decoded straight into the return type by a
+    typed decoder cached per type. Trusted loads use non-strict mode,
+    which accepts more input shapes and skips some strict checks.
+
+    Args:
+        protocol: Encoding of raw bodies, ``"json"`` or ``"msgpack"``.
+        decodes_content: Ask the client to pass response bodies undecoded,
+                         skipping its `json_loads` pass.
+        trusted: Load every response in trusted mode, see `TrustingLoader`.
+        validation_rate: Fraction of trusted loads that are fully validated.
+    """
+
+    def __init__(
         self,
-        data: dict[str, Any],
-        field_name: str,
-        field_value: Any,
-        hint: Any,
-    ) -> None:
-        if isinstance(field_value, Omitted):
-            return
-
-        marker = None
-        if get_origin(hint) is not None:
-            for arg in get_args(hint):
-                if isinstance(arg, Marker):
-                    marker = arg
-                    break
-
-        if marker:
-            if isinstance(field_value, UploadFile):
-                serialized_value = field_value.to_tuple()
-            else:
-                serialized_value = msgspec.to_builtins(field_value)
-
-            target_dict = data.get(marker.name)
-            if target_dict is not None and isinstance(target_dict, dict):
-                target_dict[field_name] = serialized_value
-
-
-class MsgspecLoader(ResponseLoader):
-    def load(self, data: Any, tp: type[T]) -> T:
+        *,
+        protocol: Literal["json", "msgpack"] = "json",
+        decodes_content: bool = False,
+        trusted: bool = False,
+        validation_rate: float = 0.0,
+    ):
+        if protocol not in {"json", "msgpack"}:
+            raise ValueError(f"Unsupported protocol: {protocol!r}")
+        super().__init__(trusted=trusted, validation_rate=validation_rate)
+        self.protocol = protocol
+        self.decodes_content = decodes_content
+        self._decoders: dict[Any, _Decoder] = {}
+        self._lax_decoders: dict[Any, _Decoder] = {}
+
+    def load_validated(self, data: Any, tp: type[T]) -> T:
+        if self.decodes_content and isinstance(data, bytes | bytearray | memoryview):
+            decoder = self._decoders.get(tp)
+            if decoder is None:
+                decoder = self._decoders[tp] = self._make_decoder(tp)
+            return decoder.decode(data)
         return msgspec.convert(data, type=tp)
+
+    def load_unvalidated(self, data: Any, tp: type[T]) -> T:
+        if self.decodes_content and isinstance(data, bytes | bytearray | memoryview):
+            decoder = self._lax_decoders.get(tp)
+            if decoder is None:
+                decoder = self._lax_decoders[tp] = self._make_decoder(tp, strict=False)
+            return decoder.decode(data)
+        return msgspec.convert(data, type=tp, strict=False)
+
+    def warmup(self, method_types: Iterable[type[BaseMethod[Any]]]) -> None:
+        """Build the decoders of the return types of `method_types`."""
+        for method_type in method_types:
+            if hasattr(method_type, "__returning__"):
+                tp = method_type.__returning__
+                self._decoders[tp] = self._make_decoder(tp)
+                if self.trusted or method_type.__trusted__:
+                    self._lax_decoders[tp] = self._make_decoder(tp, strict=False)
+
+    def _make_decoder(self, tp: Any, strict: bool = True) -> _Decoder:
+        if self.protocol == "msgpack":
+            return msgspec.msgpack.Decoder(tp, strict=strict)
+        return msgspec.json.Decoder(tp, strict=strict)
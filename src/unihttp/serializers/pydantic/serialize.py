@@ -1,20 +1,82 @@
-from typing import Any, TypeVar, get_args, get_origin, get_type_hints
+from collections.abc import Iterable
+from dataclasses import dataclass, is_dataclass
+from types import UnionType
+from typing import (
+    Any,
+    TypedDict,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 from unihttp.http import UploadFile
 from unihttp.markers import Marker
+from unihttp.method import BaseMethod
 from unihttp.omitted import Omitted
 from unihttp.serialize import RequestDumper, ResponseLoader
 
-from pydantic import TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 T = TypeVar("T")
 
 
+_BUCKETS = ("path", "query", "header", "body", "file", "form")
+
+
+@dataclass(frozen=True, slots=True)
+class _MethodAdapter:
+    """Compiled dump of one method class in single-adapter mode.
+
+    Attributes:
+        adapter: Adapter of a TypedDict of per-bucket TypedDicts mirroring the
+                 marked fields of the method.
+        fields: Marked fields as (attribute, bucket) pairs.
+    """
+
+    adapter: TypeAdapter[Any]
+    fields: tuple[tuple[str, str], ...]
+
+
+def _without_omitted(tp: Any) -> Any:
+    if get_origin(tp) in {Union, UnionType} and Omitted in (args := get_args(tp)):
+        return Union[tuple(arg for arg in args if arg is not Omitted)]  # noqa: UP007
+    return tp
+
+
 class PydanticDumper(RequestDumper):
-    def __init__(self, type_adapter_config: dict[str, Any] | None = None):
+    """Request dumper based on pydantic.
+
+    By default every field value is dumped by a `TypeAdapter` of its runtime
+    type. With `single_adapter` the marked fields of each method class are
+    compiled once into one adapter, and the whole method is dumped by a
+    single ``dump_python(mode="json")`` call. Values are then serialized
+    according to the declared field types. `Omitted` values are left out and
+    `UploadFile` values are passed as tuples in both modes.
+
+    Args:
+        type_adapter_config: Pydantic config of the adapters, e.g.
+                             ``{"ser_json_timedelta": "float"}``. Models and
+                             dataclasses keep their own config.
+        single_adapter: Dump each method with one compiled adapter.
+    """
+
+    def __init__(
+        self,
+        type_adapter_config: dict[str, Any] | None = None,
+        *,
+        single_adapter: bool = False,
+    ):
         self.type_adapter_config = type_adapter_config or {}
+        self.single_adapter = single_adapter
+        self._method_adapters: dict[type, _MethodAdapter] = {}
 
     def dump(self, obj: Any) -> Any:
+        if self.single_adapter:
+            return self._dump_single(obj)
+
         data: dict[str, Any] = {
             "path": {},
             "query": {},
@@ -64,7 +126,7 @@ class PydanticDumper(RequestDumper):
             if isinstance(field_value, UploadFile):
                 serialized_value = field_value.to_tuple()
             else:
-                serialized_value = TypeAdapter(type(field_value)).dump_python(
+                serialized_value = self._adapter(type(field_value)).dump_python(
                     field_value, mode="json"
                 )
 
@@ -72,8 +134,99 @@ class PydanticDumper(RequestDumper):
             if target_dict is not None and isinstance(target_dict, dict):
                 target_dict[field_name] = serialized_value
 
+    def _adapter(self, tp: type) -> TypeAdapter[Any]:
+        # Models and dataclasses carry their own config.
+        config = self.type_adapter_config
+        if not config or issubclass(tp, BaseModel) or is_dataclass(tp):
+            return TypeAdapter(tp)
+        return TypeAdapter(tp, config=cast(ConfigDict, config))
+
+    def warmup(self, method_types: Iterable[type[BaseMethod[Any]]]) -> None:
+        """Compile the adapters of `method_types` in single-adapter mode."""
+        if self.single_adapter:
+            for method_type in method_types:
+                self._method_adapters[method_type] = self._compile(method_type)
+
+    def _dump_single(self, obj: Any) -> Any:
+        cls = type(obj)
+        method_adapter = self._method_adapters.get(cls)
+        if method_adapter is None:
+            method_adapter = self._method_adapters[cls] = self._compile(cls)
+
+        data: dict[str, dict[str, Any]] = {bucket: {} for bucket in _BUCKETS}
+        files = []
+        values = vars(obj)
+        for field_name, bucket in method_adapter.fields:
+            if field_name not in values:
+                continue
+            field_value = values[field_name]
+            if isinstance(field_value, Omitted):
+                continue
+            if isinstance(field_value, UploadFile):
+                files.append((bucket, field_name, field_value.to_tuple()))
+            else:
+                data[bucket][field_name] = field_value
+
+        dumped = method_adapter.adapter.dump_python(data, mode="json")
+        for bucket, field_name, file_tuple in files:
+            dumped[bucket][field_name] = file_tuple
+        return dumped
+
+    def _compile(self, cls: type) -> _MethodAdapter:
+        try:
+            type_hints = get_type_hints(cls, include_extras=True)
+        except Exception:
+            type_hints = cls.__annotations__  # Fallback
+
+        fields = []
+        bucket_types: dict[str, dict[str, Any]] = {bucket: {} for bucket in _BUCKETS}
+        for field_name, hint in type_hints.items():
+            if field_name.startswith("__") or get_origin(hint) is None:
+                continue
+            args = get_args(hint)
+            marker = next((arg for arg in args if isinstance(arg, Marker)), None)
+            if marker is None or marker.name not in bucket_types:
+                continue
+
+            fields.append((field_name, marker.name))
+            field_type = _without_omitted(args[0])
+            if field_type is not UploadFile:
+                bucket_types[marker.name][field_name] = field_type
+
+        bucket_dicts = {
+            bucket: TypedDict(  # type: ignore[operator]
+                f"{cls.__name__}{bucket.title()}", types, total=False
+            )
+            for bucket, types in bucket_types.items()
+        }
+        request_type: Any = TypedDict(  # type: ignore[misc]
+            f"{cls.__name__}Request", bucket_dicts
+        )
+        adapter: TypeAdapter[Any]
+        if config := self.type_adapter_config:
+            # TypeAdapter rejects a config for a TypedDict but not for a
+            # nullable one, and applies it to the nested types.
+            adapter = TypeAdapter(request_type | None, config=cast(ConfigDict, config))
+        else:
+            adapter = TypeAdapter(request_type)
+        return _MethodAdapter(adapter, tuple(fields))
+
 
 class PydanticLoader(ResponseLoader):
+    """Response loader validating data with a `TypeAdapter` cached per type."""
+
+    def __init__(self) -> None:
+        self._adapters: dict[Any, TypeAdapter[Any]] = {}
+
     def load(self, data: Any, tp: type[T]) -> T:
-        adapter = TypeAdapter(tp)
+        adapter = self._adapters.get(tp)
+        if adapter is None:
+            adapter = self._adapters[tp] = TypeAdapter(tp)
         return adapter.validate_python(data)
+
+    def warmup(self, method_types: Iterable[type[BaseMethod[Any]]]) -> None:
+        """Build the adapters of the return types of `method_types`."""
+        for method_type in method_types:
+            if hasattr(method_type, "__returning__"):
+                tp = method_type.__returning__
+                self._adapters[tp] = TypeAdapter(tp)
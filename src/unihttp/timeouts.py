@@ -0,0 +1,81 @@
+"""Per-call deadlines.
+
+A deadline is an absolute `time.monotonic()` value carried on the
+`HTTPRequest`. It is derived from the method's `__timeout__` and the
+innermost `timeout()` block, whichever expires first, and is translated
+into the native timeout argument of each backend right before sending.
+
+aiohttp and zapros enforce the remaining time as a total timeout. httpx,
+requests and niquests only take per-phase timeouts and apply it to the
+connect and to every socket read separately, so on those backends a slow
+response can run past the deadline: it is only checked between attempts.
+"""
+
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from unihttp.exceptions import RequestTimeoutError
+
+_deadline: ContextVar[float | None] = ContextVar("unihttp_deadline", default=None)
+
+
+@contextmanager
+def timeout(seconds: float) -> Generator[float]:
+    """Limit every call made inside the block to `seconds` in total.
+
+    The budget covers all attempts made by retry middleware. Nested blocks
+    can only shorten the enclosing deadline, never extend it. With httpx,
+    requests and niquests the deadline is not enforced within an attempt,
+    see the module docstring.
+
+    Example:
+        >>> with timeout(2.5):
+        ...     client.get_user(id=1)
+
+    Yields:
+        The absolute deadline in `time.monotonic()` seconds.
+    """
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def get_deadline(seconds: float | None = None) -> float | None:
+    """Return the deadline for a call starting now.
+
+    Args:
+        seconds: Optional timeout of the call itself (e.g. `__timeout__`).
+
+    Returns:
+        The earliest of the active `timeout()` block and `seconds` from now,
+        or None if neither is set.
+    """
+    deadline = _deadline.get()
+    if seconds is not None:
+        own = time.monotonic() + seconds
+        deadline = own if deadline is None else min(deadline, own)
+    return deadline
+
+
+def remaining(deadline: float | None) -> float | None:
+    """Return the seconds left until `deadline`.
+
+    Raises:
+        RequestTimeoutError: if the deadline has already passed.
+    """
+    if deadline is None:
+        return None
+
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise RequestTimeoutError("Deadline exceeded before the request was sent")
+    return left
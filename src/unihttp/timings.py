@@ -0,0 +1,72 @@
+"""Phase-level timing of API calls.
+
+When a client has `record_timings` enabled, `call_method` creates one
+`CallTimings` per call, carries it on the `HTTPRequest` so backends can add
+their own phases, and hands it to `on_timings` once the result is loaded.
+All values are `time.perf_counter_ns()` durations in nanoseconds. Nothing
+is measured or allocated while recording is disabled.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class CallTimings:
+    """Time spent in each phase of one `call_method` invocation.
+
+    Phases repeated by retry middleware are summed over all attempts.
+
+    Attributes:
+        method: Name of the `BaseMethod` subclass.
+        dump_ns: `build_http_request`, i.e. the request dumper.
+        encode_ns: Encoding the request body into bytes.
+        transport_ns: `make_request` calls, including `body_read_ns`
+                      and `decode_ns`.
+        body_read_ns: Reading the response body after the headers arrived.
+                      Only backends that read the body separately (aiohttp,
+                      zapros) report it; others include it in `send_ns`.
+        decode_ns: JSON decoding of the response body.
+        load_ns: `make_response`, i.e. the response loader.
+        total_ns: The whole call.
+    """
+
+    method: str
+    dump_ns: int = 0
+    encode_ns: int = 0
+    transport_ns: int = 0
+    body_read_ns: int = 0
+    decode_ns: int = 0
+    load_ns: int = 0
+    total_ns: int = 0
+
+    @property
+    def send_ns(self) -> int:
+        """Sending the request and waiting for the response.
+
+        Includes the connection pool wait and the time to first byte.
+        """
+        return self.transport_ns - self.body_read_ns - self.decode_ns
+
+    @property
+    def middleware_ns(self) -> int:
+        """Everything else: middleware, response validation and error hooks."""
+        return (
+            self.total_ns
+            - self.dump_ns
+            - self.encode_ns
+            - self.transport_ns
+            - self.load_ns
+        )
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the phases in pipeline order."""
+        return {
+            "dump": self.dump_ns,
+            "encode": self.encode_ns,
+            "middleware": self.middleware_ns,
+            "send": self.send_ns,
+            "body_read": self.body_read_ns,
+            "decode": self.decode_ns,
+            "load": self.load_ns,
+            "total": self.total_ns,
+        }
@@ -0,0 +1,5 @@
+from .tracer import Tracer
+
+__all__ = [
+    "Tracer",
+]
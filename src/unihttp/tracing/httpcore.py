@@ -0,0 +1,39 @@
+from typing import Any
+
+from unihttp.http.request import HTTPRequest
+from unihttp.tracing.tracer import Tracer
+
+
+class HTTPCoreTrace:
+    """`trace` request extension of httpx/httpx2 forwarding events to a `Tracer`.
+
+    httpcore reports `connection.connect_tcp.*` only when it opens a new
+    connection, then `<protocol>.send_request_headers.started` once the
+    connection is assigned to the request.
+    """
+
+    __slots__ = ("_connected", "_request", "_tracer")
+
+    def __init__(self, tracer: Tracer, request: HTTPRequest) -> None:
+        self._tracer = tracer
+        self._request = request
+        self._connected = False
+
+    def __call__(self, event: str, info: dict[str, Any]) -> None:
+        if event == "connection.connect_tcp.started":
+            self._connected = True
+        elif event.endswith(".send_request_headers.started"):
+            self._tracer.on_connection_acquired(self._request, not self._connected)
+        elif event.endswith(".receive_response_headers.complete"):
+            self._tracer.on_headers_received(self._request)
+
+
+class AsyncHTTPCoreTrace(HTTPCoreTrace):
+    """Async variant of `HTTPCoreTrace` for async httpx/httpx2 clients."""
+
+    __slots__ = ()
+
+    async def __call__(  # type: ignore[override]
+        self, event: str, info: dict[str, Any]
+    ) -> None:
+        super().__call__(event, info)
@@ -0,0 +1,92 @@
+"""OpenTelemetry adapter for the `Tracer` hooks.
+
+Requires `opentelemetry-api` (`pip install "unihttp[opentelemetry]"`).
+"""
+
+from dataclasses import replace
+
+from opentelemetry import propagate, trace
+from opentelemetry.trace import Span, SpanKind, Status, StatusCode, TracerProvider
+
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+from unihttp.tracing.tracer import Tracer
+
+
+class OpenTelemetryTracer(Tracer):
+    """Records one CLIENT span per request attempt.
+
+    The span is named after the `BaseMethod` subclass and carries
+    `connection_acquired` and `headers_received` events, so pool wait and
+    server time can be read from the timeline. The trace context is
+    injected into the headers of a copy of the request.
+
+    Args:
+        tracer_provider: Provider to get the tracer from. Defaults to the
+                         global provider.
+        propagate_context: Inject the trace context into request headers.
+    """
+
+    def __init__(
+        self,
+        tracer_provider: TracerProvider | None = None,
+        propagate_context: bool = True,
+    ):
+        self._tracer = trace.get_tracer("unihttp", tracer_provider=tracer_provider)
+        self._propagate_context = propagate_context
+        self._spans: dict[int, Span] = {}
+
+    def on_request_start(self, request: HTTPRequest) -> HTTPRequest:
+        attributes: dict[str, str | int] = {
+            "http.request.method": request.method,
+            "url.full": request.url,
+        }
+        if request.method_name is not None:
+            attributes["unihttp.method"] = request.method_name
+        if request.attempt:
+            attributes["http.request.resend_count"] = request.attempt
+
+        span = self._tracer.start_span(
+            request.method_name or request.method,
+            kind=SpanKind.CLIENT,
+            attributes=attributes,
+        )
+        if self._propagate_context:
+            carrier: dict[str, str] = {}
+            propagate.inject(carrier, context=trace.set_span_in_context(span))
+            request = replace(request, header={**request.header, **carrier})
+
+        self._spans[id(request)] = span
+        return request
+
+    def on_connection_acquired(self, request: HTTPRequest, reused: bool | None) -> None:
+        span = self._spans.get(id(request))
+        if span is not None:
+            attributes = {} if reused is None else {"reused": reused}
+            span.add_event("connection_acquired", attributes)
+
+    def on_headers_received(self, request: HTTPRequest) -> None:
+        span = self._spans.get(id(request))
+        if span is not None:
+            span.add_event("headers_received")
+
+    def on_body_complete(self, request: HTTPRequest, response: HTTPResponse) -> None:
+        span = self._spans.pop(id(request), None)
+        if span is None:
+            return
+
+        span.set_attribute("http.response.status_code", response.status_code)
+        if response.status_code >= 500:
+            span.set_attribute("error.type", str(response.status_code))
+            span.set_status(Status(StatusCode.ERROR))
+        span.end()
+
+    def on_error(self, request: HTTPRequest, error: Exception) -> None:
+        span = self._spans.pop(id(request), None)
+        if span is None:
+            return
+
+        span.record_exception(error)
+        span.set_attribute("error.type", type(error).__qualname__)
+        span.set_status(Status(StatusCode.ERROR, str(error)))
+        span.end()
@@ -0,0 +1,54 @@
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+
+
+class Tracer:
+    """Receives lifecycle events of the requests sent by a client.
+
+    Assign an instance to `client.tracer`. Every method is a no-op, override
+    the ones you need. Events are emitted once per attempt with the same
+    `HTTPRequest` object, which can be used to correlate them. Only
+    `on_request_start` may replace it, by returning a modified copy:
+
+    - `on_request_start`: before the request is handed to the backend.
+    - `on_connection_acquired`: a connection was taken from the pool or
+      opened; the gap since the start is the pool wait plus connect time.
+    - `on_headers_received`: response headers arrived; the gap since the
+      connection was acquired is the server time.
+    - `on_body_complete`: the response body was read and decoded.
+    - `on_error`: the backend raised instead of returning a response.
+
+    Connection and header events come from native backend hooks: the httpx
+    and httpx2 `trace` extension, aiohttp `TraceConfig` and niquests
+    `pre_send`/`response` hooks. requests and zapros expose no connection
+    event, and report headers once the backend returns the response.
+
+    Hooks run inline on the request path and must be cheap; async clients
+    call them synchronously from the event loop.
+    """
+
+    def on_request_start(self, request: HTTPRequest) -> HTTPRequest | None:
+        """Called before the request is sent.
+
+        Returns:
+            A copy of `request` to send instead (e.g. with extra headers),
+            or None to send it as is. Later events receive the request sent.
+        """
+
+    def on_connection_acquired(self, request: HTTPRequest, reused: bool | None) -> None:
+        """Called once a connection is ready to carry the request.
+
+        Args:
+            request: The request being sent.
+            reused: Whether a pooled connection was reused, or None if the
+                    backend does not tell.
+        """
+
+    def on_headers_received(self, request: HTTPRequest) -> None:
+        """Called when the response status line and headers arrived."""
+
+    def on_body_complete(self, request: HTTPRequest, response: HTTPResponse) -> None:
+        """Called when the response is complete."""
+
+    def on_error(self, request: HTTPRequest, error: Exception) -> None:
+        """Called when sending the request raised `error`."""
@@ -52,7 +52,9 @@ async def test_aiohttp_make_request(mock_request_dumper, mock_response_loader, m
         url="http://base/test",
         headers={"Auth": "123", "Content-Type": "application/json"},
         params={"q": "1"},
-        data='{"data": "abc"}',  # AiohttpClient passes body as data
+        data=b'{"data": "abc"}',  # AiohttpClient passes body as data
+        timeout=mock_session.timeout,
+        trace_request_ctx=None,
     )
 
     # Verify response mapping
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from unittest.mock import Mock
 
 import pytest
@@ -6,9 +7,10 @@ from unihttp.http.request import HTTPRequest
 from unihttp.http.response import HTTPResponse
 from unihttp.method import BaseMethod
 from unihttp.middlewares.base import AsyncMiddleware, Middleware
+from unihttp.middlewares.retry import RetryMiddleware
 
 
-class SimpleMethod(BaseMethod[str]):
+class SimpleMethod(BaseMethod[dict]):
     __url__ = "/test"
     __method__ = "GET"
 
@@ -84,6 +86,164 @@ class TestSyncClient:
         # Verify it still proceeded to load response since no exception was raised
         assert result == "proceeded"
 
+    def test_warmup_on_enter(self, mock_request_dumper, mock_response_loader):
+        class WarmClient(self.MockClient):
+            warmup_connections = 4
+
+        client = WarmClient("http://base", mock_request_dumper, mock_response_loader)
+        client.make_request = Mock(return_value=HTTPResponse(200, {}, None, {}, None))
+
+        with client:
+            pass
+
+        assert client.make_request.call_count == 4
+        assert client.make_request.call_args.args[0].url == "http://base"
+
+    def test_body_encoded_once_across_retries(
+        self, mock_request_dumper, mock_response_loader, mocker
+    ):
+        mocker.patch("time.sleep")
+        seen = []
+
+        class RecordingClient(BaseSyncClient):
+            def make_request(self, request):
+                seen.append(request)
+                status = 500 if len(seen) < 3 else 200
+                return HTTPResponse(status, {}, {}, {}, None)
+
+        json_dumps = Mock(return_value='{"a": 1}')
+        client = RecordingClient(
+            "http://base", mock_request_dumper, mock_response_loader,
+            middleware=[RetryMiddleware(retries=3, jitter=False)],
+            json_dumps=json_dumps,
+        )
+        mock_request_dumper.dump.return_value = {"body": {"a": 1}}
+
+        client.call_method(SimpleMethod())
+
+        json_dumps.assert_called_once_with({"a": 1})
+        assert len(seen) == 3
+        assert all(r.content == b'{"a": 1}' for r in seen)
+        assert all(r.content_type == "application/json" for r in seen)
+        assert seen[0].header == {}
+
+    @pytest.mark.parametrize(
+        ("body", "content"),
+        [({"a": 2}, b'{"a": 2}'), (None, None)],
+    )
+    def test_body_rewritten_by_middleware_encoded_again(
+        self, mock_request_dumper, mock_response_loader, body, content
+    ):
+        seen = []
+
+        class RewritingMiddleware(Middleware):
+            def handle(self, request, next_handler):
+                return next_handler(replace(request, body=body))
+
+        class RecordingClient(BaseSyncClient):
+            def make_request(self, request):
+                seen.append(self.encode_request(request))
+                return HTTPResponse(200, {}, {}, {}, None)
+
+        client = RecordingClient(
+            "http://base", mock_request_dumper, mock_response_loader,
+            middleware=[RewritingMiddleware()],
+        )
+        mock_request_dumper.dump.return_value = {"body": {"a": 1}}
+
+        client.call_method(SimpleMethod())
+
+        assert seen[0].content == content
+        assert seen[0].content_type == ("application/json" if body else None)
+
+    def test_encode_request_keeps_content_set_without_body(
+        self, mock_request_dumper, mock_response_loader
+    ):
+        client = self.MockClient("http://base", mock_request_dumper, mock_response_loader)
+        request = HTTPRequest(
+            "/", "POST", {}, {}, {}, {"a": 1}, {}, {}, content=b"raw"
+        )
+
+        assert client.encode_request(request) is request
+
+    def test_encode_request_rejects_body_with_form(
+        self, mock_request_dumper, mock_response_loader
+    ):
+        client = self.MockClient("http://base", mock_request_dumper, mock_response_loader)
+        request = HTTPRequest("/", "POST", {}, {}, {}, {"a": 1}, {}, {"f": "v"})
+
+        with pytest.raises(ValueError, match="Cannot use Body with Form or File"):
+            client.encode_request(request)
+
+    def test_build_headers_keeps_explicit_content_type(
+        self, mock_request_dumper, mock_response_loader
+    ):
+        client = self.MockClient("http://base", mock_request_dumper, mock_response_loader)
+        request = client.encode_request(
+            HTTPRequest("/", "POST", {"Content-Type": "text/json"}, {}, {}, {"a": 1}, {}, {})
+        )
+
+        assert client.build_headers(request) == {"Content-Type": "text/json"}
+
+    def test_record_timings(self, mock_request_dumper, mock_response_loader):
+        seen = []
+        reported = []
+
+        class TimedClient(BaseSyncClient):
+            record_timings = True
+
+            def make_request(self, request):
+                seen.append(request)
+                data = self.decode_content(request, b'{"a": 1}')
+                return HTTPResponse(200, {}, data, {}, None)
+
+            def on_timings(self, method, timings):
+                reported.append((method, timings))
+
+        client = TimedClient("http://base", mock_request_dumper, mock_response_loader)
+        mock_request_dumper.dump.return_value = {"body": {"a": 1}}
+        method = SimpleMethod()
+
+        client.call_method(method)
+
+        [(reported_method, timings)] = reported
+        assert reported_method is method
+        assert seen[0].timings is timings
+        assert timings.method == "SimpleMethod"
+        assert timings.dump_ns > 0
+        assert timings.encode_ns > 0
+        assert timings.decode_ns > 0
+        assert timings.transport_ns >= timings.decode_ns
+        assert timings.total_ns >= (
+            timings.dump_ns + timings.encode_ns + timings.transport_ns + timings.load_ns
+        )
+        assert sum(timings.as_dict().values()) == 2 * timings.total_ns
+
+    def test_timings_disabled_by_default(self, mock_request_dumper, mock_response_loader):
+        seen = []
+
+        class RecordingClient(BaseSyncClient):
+            def make_request(self, request):
+                seen.append(request)
+                return HTTPResponse(200, {}, None, {}, None)
+
+        client = RecordingClient("http://base", mock_request_dumper, mock_response_loader)
+        client.on_timings = Mock()
+        mock_request_dumper.dump.return_value = {}
+
+        client.call_method(SimpleMethod())
+
+        assert seen[0].timings is None
+        client.on_timings.assert_not_called()
+
+    def test_decode_content(self, mock_request_dumper, mock_response_loader):
+        client = self.MockClient("http://base", mock_request_dumper, mock_response_loader)
+        request = HTTPRequest("/", "GET", {}, {}, {}, {}, {}, {})
+
+        assert client.decode_content(request, b'{"a": 1}') == {"a": 1}
+        assert client.decode_content(request, b"plain") == b"plain"
+        assert client.decode_content(request, b"") is None
+
 
 @pytest.mark.asyncio
 class TestAsyncClient:
@@ -130,3 +290,43 @@ class TestAsyncClient:
         await client.call_method(method)
 
         assert order == ["mw1_req", "mw2_req", "mw2_resp", "mw1_resp"]
+
+    async def test_warmup_counts_failures(self, mock_request_dumper, mock_response_loader):
+        calls = []
+
+        class FlakyClient(BaseAsyncClient):
+            async def make_request(self, request):
+                calls.append(request)
+                if len(calls) % 2:
+                    raise ConnectionError("refused")
+                return HTTPResponse(200, {}, None, {}, None)
+
+        client = FlakyClient("http://base", mock_request_dumper, mock_response_loader)
+        result = await client.warmup(connections=2, urls=["/a", "http://other/b"])
+
+        assert (result.established, result.failed) == (2, 2)
+        assert [r.url for r in calls] == ["/a", "/a", "http://other/b", "http://other/b"]
+        assert all(r.method == "HEAD" for r in calls)
+
+    async def test_record_timings(self, mock_request_dumper, mock_response_loader):
+        reported = []
+
+        class TimedClient(BaseAsyncClient):
+            record_timings = True
+
+            async def make_request(self, request):
+                return HTTPResponse(200, {}, None, {}, None)
+
+            def on_timings(self, method, timings):
+                reported.append(timings)
+
+        client = TimedClient("http://base", mock_request_dumper, mock_response_loader)
+        mock_request_dumper.dump.return_value = {}
+
+        await client.call_method(SimpleMethod())
+
+        [timings] = reported
+        assert timings.transport_ns > 0
+        assert timings.load_ns > 0
+        assert timings.send_ns == timings.transport_ns
+        assert timings.middleware_ns >= 0
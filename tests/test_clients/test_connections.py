@@ -0,0 +1,85 @@
+import gc
+from unittest.mock import Mock
+
+from unihttp.clients.connections import ConnectionStats
+from unihttp.clients.httpx import HTTPXSyncClient
+from unihttp.http.request import HTTPRequest
+
+
+class Stream:
+    pass
+
+
+def test_connection_stats():
+    stats = ConnectionStats()
+    h2, first, second = Stream(), Stream(), Stream()
+
+    for _ in range(3):
+        stats.record(h2, "HTTP/2")
+    stats.record(first, "HTTP/1.1")
+    stats.record(second, "HTTP/1.1")
+
+    assert stats.connections == 3
+    assert stats.requests == 5
+    assert stats.streams_per_connection() == [3, 1, 1]
+    assert stats.connections_by_version() == {"HTTP/2": 1, "HTTP/1.1": 2}
+
+    stats.reset()
+    assert stats.connections == 0
+    assert stats.requests == 0
+
+
+def test_closed_connections_are_forgotten():
+    stats = ConnectionStats()
+
+    for _ in range(3):
+        stream = Stream()
+        stats.record(stream, "HTTP/1.1")
+        stats.record(stream, "HTTP/1.1")
+        del stream
+        gc.collect()
+
+    assert stats.connections == 3
+    assert stats.requests == 6
+    assert stats.streams_per_connection() == []
+
+
+def test_untrackable_connection_counts_request_only():
+    stats = ConnectionStats()
+
+    stats.record(object(), "HTTP/1.1")
+
+    assert (stats.requests, stats.connections) == (1, 0)
+
+
+def _client(mock_request_dumper, mock_response_loader, stream):
+    session = Mock()
+    session.request.return_value = Mock(
+        status_code=200,
+        content=b"",
+        http_version="HTTP/2",
+        extensions={"network_stream": stream},
+    )
+    return HTTPXSyncClient(
+        "http://base", mock_request_dumper, mock_response_loader, session=session
+    )
+
+
+def test_httpx_records_network_stream(mock_request_dumper, mock_response_loader):
+    client = _client(mock_request_dumper, mock_response_loader, Stream())
+    client.connection_stats = ConnectionStats()
+    request = HTTPRequest("/", "GET", {}, {}, {}, {}, {}, {})
+
+    client.make_request(request)
+    client.make_request(request)
+
+    assert client.connection_stats.connections == 1
+    assert client.connection_stats.connections_by_version() == {"HTTP/2": 1}
+
+
+def test_httpx_tracking_is_opt_in(mock_request_dumper, mock_response_loader):
+    client = _client(mock_request_dumper, mock_response_loader, Stream())
+
+    client.make_request(HTTPRequest("/", "GET", {}, {}, {}, {}, {}, {}))
+
+    assert client.connection_stats is None
@@ -42,3 +42,23 @@ def test_requests_default_session(mock_request_dumper, mock_response_loader):
     client = RequestsSyncClient("http://base", mock_request_dumper, mock_response_loader)
     client.close()
     assert client._session is not None
+
+
+def test_session_created_on_first_use(mock_request_dumper, mock_response_loader, mocker):
+    mock_client = mocker.patch("unihttp.clients.httpx.Client")
+    client = HTTPXSyncClient("http://base", mock_request_dumper, mock_response_loader)
+
+    mock_client.assert_not_called()
+    assert client._session is client._session
+    mock_client.assert_called_once_with()
+
+
+def test_close_unused_client_creates_no_session(
+    mock_request_dumper, mock_response_loader, mocker
+):
+    mock_session = mocker.patch("unihttp.clients.requests.Session")
+    client = RequestsSyncClient("http://base", mock_request_dumper, mock_response_loader)
+
+    client.close()
+
+    mock_session.assert_not_called()
@@ -53,7 +53,9 @@ async def test_httpx_make_request(mock_request_dumper, mock_response_loader, moc
         params={"q": "1"},
         data={},
         files=None,
-        content='{"data": "abc"}'
+        content=b'{"data": "abc"}',
+        timeout=httpx.USE_CLIENT_DEFAULT,
+        extensions=None,
     )
 
     # Verify response mapping
@@ -101,7 +103,9 @@ async def test_httpx_upload_file(mock_request_dumper, mock_response_loader, mock
         params={},
         data={},
         files=[("doc", ("test.txt", b"content", "application/octet-stream"))],
-        content=None
+        content=None,
+        timeout=httpx.USE_CLIENT_DEFAULT,
+        extensions=None,
     )
 @pytest.mark.asyncio
 async def test_httpx_close(mock_request_dumper, mock_response_loader, mock_client):
@@ -50,7 +50,9 @@ def test_httpx2_sync_make_request(mock_request_dumper, mock_response_loader, moc
         params={"q": "1"},
         data={},
         files=None,
-        content='{"data": "abc"}'
+        content=b'{"data": "abc"}',
+        timeout=httpx2.USE_CLIENT_DEFAULT,
+        extensions=None,
     )
 
     assert response.status_code == 200
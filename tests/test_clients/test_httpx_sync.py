@@ -1,3 +1,4 @@
+import time
 from unittest.mock import MagicMock, Mock
 
 import httpx
@@ -50,7 +51,9 @@ def test_httpx_sync_make_request(mock_request_dumper, mock_response_loader, mock
         params={"q": "1"},
         data={},
         files=None,
-        content='{"data": "abc"}'
+        content=b'{"data": "abc"}',
+        timeout=httpx.USE_CLIENT_DEFAULT,
+        extensions=None,
     )
 
     assert response.status_code == 200
@@ -106,6 +109,27 @@ def test_httpx_sync_timeout_error(mock_request_dumper, mock_response_loader, moc
         client.make_request(request)
 
 
+def test_httpx_sync_deadline_passed_as_timeout(mock_request_dumper, mock_response_loader, mock_httpx_client):
+    client = HTTPXSyncClient("http://base", mock_request_dumper, mock_response_loader, session=mock_httpx_client)
+    mock_httpx_client.request.return_value = Mock(status_code=200, content=b"")
+
+    request = HTTPRequest("/test", "GET", {}, {}, {}, {}, {}, {}, deadline=time.monotonic() + 5)
+    client.make_request(request)
+
+    timeout = mock_httpx_client.request.call_args.kwargs["timeout"]
+    assert 0 < timeout <= 5
+
+
+def test_httpx_sync_expired_deadline(mock_request_dumper, mock_response_loader, mock_httpx_client):
+    client = HTTPXSyncClient("http://base", mock_request_dumper, mock_response_loader, session=mock_httpx_client)
+
+    request = HTTPRequest("/test", "GET", {}, {}, {}, {}, {}, {}, deadline=time.monotonic() - 1)
+
+    with pytest.raises(RequestTimeoutError):
+        client.make_request(request)
+    mock_httpx_client.request.assert_not_called()
+
+
 def test_httpx_sync_body_and_form_error(mock_request_dumper, mock_response_loader, mock_httpx_client):
     client = HTTPXSyncClient(
         base_url="http://base",
@@ -0,0 +1,216 @@
+import asyncio
+import json
+import time
+from urllib.parse import parse_qsl
+
+import pytest
+
+from unihttp.clients.asgi import ASGIAsyncClient
+from unihttp.clients.wsgi import WSGISyncClient
+from unihttp.exceptions import RequestTimeoutError
+from unihttp.http import HTTPRequest, UploadFile
+from unihttp.method import BaseMethod
+
+
+def _echo(method, path, query_string, headers, body):
+    if path == "/boom":
+        raise RuntimeError("boom")
+    payload = {
+        "method": method,
+        "path": path,
+        "query": parse_qsl(query_string, keep_blank_values=True),
+        "headers": headers,
+        "body": body.decode("latin-1"),
+    }
+    return json.dumps(payload).encode(), [
+        ("Content-Type", "application/json"),
+        ("Set-Cookie", "session=abc; Path=/"),
+    ]
+
+
+async def asgi_app(scope, receive, send):
+    body = b""
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if not message.get("more_body"):
+            break
+
+    if scope["path"] == "/sleep":
+        await asyncio.sleep(1)
+
+    content, headers = _echo(
+        scope["method"],
+        scope["path"],
+        scope["query_string"].decode(),
+        {k.decode(): v.decode() for k, v in scope["headers"]},
+        body,
+    )
+    await send({
+        "type": "http.response.start",
+        "status": 201,
+        "headers": [(k.encode(), v.encode()) for k, v in headers],
+    })
+    await send({"type": "http.response.body", "body": content[:10], "more_body": True})
+    await send({"type": "http.response.body", "body": content[10:]})
+
+
+def wsgi_app(environ, start_response):
+    headers = {
+        key[5:].replace("_", "-").lower(): value
+        for key, value in environ.items()
+        if key.startswith("HTTP_")
+    }
+    if "CONTENT_TYPE" in environ:
+        headers["content-type"] = environ["CONTENT_TYPE"]
+    length = int(environ.get("CONTENT_LENGTH") or 0)
+
+    content, response_headers = _echo(
+        environ["REQUEST_METHOD"],
+        environ["PATH_INFO"],
+        environ["QUERY_STRING"],
+        headers,
+        environ["wsgi.input"].read(length),
+    )
+    start_response("201 Created", response_headers)
+    return [content]
+
+
+def make_request(**kwargs) -> HTTPRequest:
+    defaults = {
+        "url": "/items/1",
+        "method": "POST",
+        "header": {},
+        "path": {},
+        "query": {},
+        "body": {},
+        "file": {},
+        "form": {},
+    }
+    return HTTPRequest(**{**defaults, **kwargs})
+
+
+@pytest.fixture
+def wsgi_client(mock_request_dumper, mock_response_loader):
+    return WSGISyncClient(
+        "http://testserver", mock_request_dumper, mock_response_loader, app=wsgi_app
+    )
+
+
+@pytest.fixture
+def asgi_client(mock_request_dumper, mock_response_loader):
+    return ASGIAsyncClient(
+        "http://testserver", mock_request_dumper, mock_response_loader, app=asgi_app
+    )
+
+
+def _check_json_echo(response):
+    assert response.status_code == 201
+    assert response.cookies == {"session": "abc"}
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.data["method"] == "POST"
+    assert response.data["path"] == "/items/1"
+    assert response.data["query"] == [["flag", "true"], ["ids", "1"], ["ids", "2"]]
+    assert response.data["headers"]["host"] == "testserver"
+    assert response.data["headers"]["x-token"] == "t"
+    assert response.data["headers"]["content-type"] == "application/json"
+    assert json.loads(response.data["body"]) == {"name": "x"}
+    assert response.content is not None
+
+
+def _check_multipart_echo(response):
+    content_type = response.data["headers"]["content-type"]
+    assert content_type.startswith("multipart/form-data; boundary=")
+    body = response.data["body"]
+    assert 'name="title"\r\n\r\nhello\r\n' in body
+    assert 'name="doc"; filename="a.txt"\r\nContent-Type: text/plain\r\n\r\ndata' in body
+
+
+JSON_REQUEST = {
+    "query": {"flag": True, "ids": [1, 2]},
+    "header": {"X-Token": "t"},
+    "body": {"name": "x"},
+}
+MULTIPART_REQUEST = {
+    "form": {"title": "hello"},
+    "file": {"doc": UploadFile(b"data", filename="a.txt", content_type="text/plain")},
+}
+
+
+class TestWSGISyncClient:
+    def test_json_request(self, wsgi_client):
+        _check_json_echo(wsgi_client.make_request(make_request(**JSON_REQUEST)))
+
+    def test_multipart_request(self, wsgi_client):
+        _check_multipart_echo(wsgi_client.make_request(make_request(**MULTIPART_REQUEST)))
+
+    def test_form_request(self, wsgi_client):
+        response = wsgi_client.make_request(make_request(form={"a": 1, "b": None}))
+
+        assert response.data["body"] == "a=1&b="
+        assert response.data["headers"]["content-type"] == (
+            "application/x-www-form-urlencoded"
+        )
+
+    def test_app_exception_raised(self, wsgi_client):
+        with pytest.raises(RuntimeError, match="boom"):
+            wsgi_client.make_request(make_request(url="/boom"))
+
+    def test_app_exception_as_500(self, mock_request_dumper, mock_response_loader):
+        client = WSGISyncClient(
+            "http://testserver",
+            mock_request_dumper,
+            mock_response_loader,
+            app=wsgi_app,
+            raise_app_exceptions=False,
+        )
+        response = client.make_request(make_request(url="/boom"))
+
+        assert response.status_code == 500
+        assert response.data is None
+
+    def test_call_method(self, mock_request_dumper, mock_response_loader):
+        class Echo(BaseMethod[dict]):
+            __url__ = "/echo"
+            __method__ = "GET"
+
+        mock_request_dumper.dump.return_value = {"query": {"q": "1"}}
+        mock_response_loader.load.side_effect = lambda data, tp: data
+        client = WSGISyncClient(
+            "http://testserver", mock_request_dumper, mock_response_loader, app=wsgi_app
+        )
+
+        result = client.call_method(Echo())
+
+        assert result["path"] == "/echo"
+        assert result["query"] == [["q", "1"]]
+
+
+class TestASGIAsyncClient:
+    async def test_json_request(self, asgi_client):
+        _check_json_echo(await asgi_client.make_request(make_request(**JSON_REQUEST)))
+
+    async def test_multipart_request(self, asgi_client):
+        response = await asgi_client.make_request(make_request(**MULTIPART_REQUEST))
+        _check_multipart_echo(response)
+
+    async def test_app_exception_raised(self, asgi_client):
+        with pytest.raises(RuntimeError, match="boom"):
+            await asgi_client.make_request(make_request(url="/boom"))
+
+    async def test_app_exception_as_500(self, mock_request_dumper, mock_response_loader):
+        client = ASGIAsyncClient(
+            "http://testserver",
+            mock_request_dumper,
+            mock_response_loader,
+            app=asgi_app,
+            raise_app_exceptions=False,
+        )
+        response = await client.make_request(make_request(url="/boom"))
+
+        assert response.status_code == 500
+
+    async def test_deadline(self, asgi_client):
+        request = make_request(url="/sleep", deadline=time.monotonic() + 0.05)
+        with pytest.raises(RequestTimeoutError):
+            await asgi_client.make_request(request)
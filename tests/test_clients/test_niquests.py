@@ -68,6 +68,8 @@ class TestNiquestsSyncClient:
             params={"q": "search"},
             files=None,
             data=None,
+            timeout=None,
+            hooks=None,
         )
 
     def test_network_error(self, sync_client: BaseSyncClient, mocker):
@@ -94,6 +96,7 @@ class TestNiquestsSyncClient:
 
     def test_close(self, sync_client: BaseSyncClient, mocker):
         mock_close = mocker.patch("niquests.Session.close")
+        sync_client._session  # created on first use
         sync_client.close()
         mock_close.assert_called_once()
 
@@ -156,8 +159,11 @@ class TestNiquestsSyncClient:
         
         client.make_request(request)
         mock_session_request.assert_called_once()
-        assert mock_session_request.call_args[1]["data"] == '{"key": "val"}'
-        assert request.header["Content-Type"] == "application/json"
+        assert mock_session_request.call_args[1]["data"] == b'{"key": "val"}'
+        assert mock_session_request.call_args[1]["headers"] == {
+            "Content-Type": "application/json"
+        }
+        assert request.header == {}
 
     def test_request_with_form(self, sync_client: BaseSyncClient, mocker):
         mock_response = Mock(status_code=200, headers={}, content=b"{}", cookies={})
@@ -227,7 +233,9 @@ class TestNiquestsAsyncClient:
             headers={"User-Agent": "test", "Content-Type": "application/json"},
             params={},
             files=None,
-            data='{"some": "data"}',
+            data=b'{"some": "data"}',
+            timeout=None,
+            hooks=None,
         )
 
     @pytest.mark.asyncio
@@ -257,6 +265,7 @@ class TestNiquestsAsyncClient:
     @pytest.mark.asyncio
     async def test_close(self, async_client: BaseAsyncClient, mocker):
         mock_close = mocker.patch("niquests.AsyncSession.close", new_callable=AsyncMock)
+        async_client._session  # created on first use
         await async_client.close()
         mock_close.assert_awaited_once()
 
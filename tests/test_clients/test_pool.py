@@ -0,0 +1,152 @@
+import time
+
+import httpx
+import pytest
+from unihttp.clients.aiohttp import AiohttpAsyncClient
+from unihttp.clients.httpx import HTTPXAsyncClient, HTTPXSyncClient
+from unihttp.clients.niquests import NiquestsSyncClient
+from unihttp.clients.pool import PoolConfig
+from unihttp.clients.requests import RequestsSyncClient
+from unihttp.clients.zapros import ZaprosSyncClient
+
+POOL = PoolConfig(
+    max_connections=500,
+    max_connections_per_host=50,
+    keepalive_expiry=30.0,
+    http2=True,
+)
+
+
+def test_per_host_limit_falls_back_to_max_connections():
+    assert PoolConfig(max_connections=7).per_host_limit == 7
+    assert POOL.per_host_limit == 50
+
+
+def test_pool_with_session_is_rejected(mock_request_dumper, mock_response_loader):
+    with pytest.raises(ValueError, match="cannot be combined with `session`"):
+        HTTPXSyncClient(
+            "http://base", mock_request_dumper, mock_response_loader,
+            session=httpx.Client(), pool=POOL,
+        )
+
+
+@pytest.mark.parametrize(
+    "client_type",
+    [
+        AiohttpAsyncClient,
+        HTTPXAsyncClient,
+        HTTPXSyncClient,
+        NiquestsSyncClient,
+        RequestsSyncClient,
+        ZaprosSyncClient,
+    ],
+)
+def test_json_functions_still_positional(
+    client_type, mock_request_dumper, mock_response_loader
+):
+    def json_dumps(obj):
+        return "{}"
+
+    client = client_type(
+        "http://base", mock_request_dumper, mock_response_loader, None, None, json_dumps
+    )
+
+    assert client.json_dumps is json_dumps
+    assert client._pool is None
+
+
+def test_httpx_sync_pool(mock_request_dumper, mock_response_loader, mocker):
+    mock_client = mocker.patch("unihttp.clients.httpx.Client")
+
+    client = HTTPXSyncClient(
+        "http://base", mock_request_dumper, mock_response_loader, pool=POOL
+    )
+    client._session
+
+    kwargs = mock_client.call_args.kwargs
+    assert kwargs["http2"] is True
+    assert kwargs["limits"] == httpx.Limits(
+        max_connections=500, max_keepalive_connections=500, keepalive_expiry=30.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_httpx_async_pool(mock_request_dumper, mock_response_loader, mocker):
+    mock_client = mocker.patch("unihttp.clients.httpx.AsyncClient")
+
+    client = HTTPXAsyncClient(
+        "http://base", mock_request_dumper, mock_response_loader, pool=POOL
+    )
+    client._session
+
+    assert mock_client.call_args.kwargs["limits"].max_connections == 500
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_pool(mock_request_dumper, mock_response_loader):
+    client = AiohttpAsyncClient(
+        "http://base", mock_request_dumper, mock_response_loader, pool=POOL
+    )
+    connector = client._session.connector
+
+    assert connector.limit == 500
+    assert connector.limit_per_host == 50
+    await client.close()
+
+
+def test_requests_pool(mock_request_dumper, mock_response_loader):
+    client = RequestsSyncClient(
+        "http://base", mock_request_dumper, mock_response_loader, pool=POOL
+    )
+
+    assert client._session.get_adapter("https://example.com")._pool_maxsize == 50
+    client.close()
+
+
+def test_niquests_pool(mock_request_dumper, mock_response_loader, mocker):
+    mock_session = mocker.patch("unihttp.clients.niquests.Session")
+
+    client = NiquestsSyncClient(
+        "http://base", mock_request_dumper, mock_response_loader, pool=POOL
+    )
+    client._session
+
+    mock_session.assert_called_once_with(pool_maxsize=50, disable_http2=False)
+
+
+def test_zapros_pool(mock_request_dumper, mock_response_loader, mocker):
+    mock_handler = mocker.patch("unihttp.clients.zapros.StdNetworkHandler")
+    mocker.patch("unihttp.clients.zapros.Client")
+
+    client = ZaprosSyncClient(
+        "http://base", mock_request_dumper, mock_response_loader, pool=POOL
+    )
+    client._session
+
+    mock_handler.assert_called_once_with(
+        max_connections_per_host=50, max_idle_seconds=30.0, http2=True
+    )
+
+
+def test_session_created_once_by_concurrent_warmup(
+    mock_request_dumper, mock_response_loader, mocker
+):
+    created = []
+
+    def slow_session():
+        time.sleep(0.001)
+        session = mocker.MagicMock()
+        session.request.return_value = mocker.Mock(
+            status_code=200, headers={}, cookies={}, content=b""
+        )
+        created.append(session)
+        return session
+
+    mocker.patch("unihttp.clients.requests.Session", side_effect=slow_session)
+    client = RequestsSyncClient("http://base", mock_request_dumper, mock_response_loader)
+
+    result = client.warmup(connections=8)
+
+    assert result.established == 8
+    assert len(created) == 1
+    assert created[0].request.call_count == 8
@@ -48,8 +48,10 @@ def test_requests_make_request(mock_request_dumper, mock_response_loader, mock_s
         url="http://base/test",
         headers={"Auth": "123", "Content-Type": "application/json"},
         params={"q": "1"},
-        data='{"data": "abc"}',
-        files={}
+        data=b'{"data": "abc"}',
+        files={},
+        timeout=None,
+        hooks=None,
     )
 
     # Verify response mapping
@@ -1,4 +1,5 @@
 import io
+import time
 from collections.abc import AsyncGenerator, Generator
 from pathlib import Path
 from typing import cast
@@ -147,6 +148,7 @@ class TestZaprosSyncClient:
             form=None,
             body=None,
             multipart=None,
+            context=None,
         )
 
     def test_request_with_body(self, sync_client: BaseSyncClient, mocker):
@@ -163,7 +165,8 @@ class TestZaprosSyncClient:
         assert kwargs["body"] == b'{"key": "val"}'
         assert kwargs["form"] is None
         assert kwargs["multipart"] is None
-        assert request.header["Content-Type"] == "application/json"
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
+        assert request.header == {}
 
     def test_request_with_form(self, sync_client: BaseSyncClient, mocker):
         mock_request = mocker.patch("zapros.Client.request", return_value=_mock_response())
@@ -180,6 +183,19 @@ class TestZaprosSyncClient:
         assert kwargs["body"] is None
         assert kwargs["multipart"] is None
 
+    def test_deadline_passed_as_total_timeout(self, sync_client: BaseSyncClient, mocker):
+        mock_request = mocker.patch("zapros.Client.request", return_value=_mock_response())
+
+        client = cast(ZaprosSyncClient, sync_client)
+        request = HTTPRequest(
+            url="/path", method="GET", header={}, path={}, query={},
+            body=None, file={}, form=None, deadline=time.monotonic() + 5,
+        )
+
+        client.make_request(request)
+        total = mock_request.call_args[1]["context"]["timeouts"]["total"]
+        assert 0 < total <= 5
+
     def test_form_coerces_non_string_values(self, sync_client: BaseSyncClient, mocker):
         """Form values get the same coercion as query (bool/int/None/list)."""
         mock_request = mocker.patch("zapros.Client.request", return_value=_mock_response())
@@ -358,6 +374,7 @@ class TestZaprosSyncClient:
 
     def test_close(self, sync_client: BaseSyncClient, mocker):
         mock_close = mocker.patch("zapros.Client.close")
+        sync_client._session  # created on first use
         sync_client.close()
         mock_close.assert_called_once()
 
@@ -510,6 +527,7 @@ class TestZaprosAsyncClient:
     @pytest.mark.asyncio
     async def test_close(self, async_client: BaseAsyncClient, mocker):
         mock_close = mocker.patch("zapros.AsyncClient.aclose", new_callable=AsyncMock)
+        async_client._session  # created on first use
         await async_client.close()
         mock_close.assert_awaited_once()
 
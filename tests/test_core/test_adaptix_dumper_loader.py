@@ -6,21 +6,96 @@ from unihttp.serializers.adaptix.serialize import AdaptixDumper, AdaptixLoader
 
 def test_adaptix_dumper():
     mock_retort = Mock(spec=Retort)
-    mock_retort.dump.return_value = "dumped"
+    mock_retort.get_dumper.return_value = Mock(return_value="dumped")
     
     dumper = AdaptixDumper(mock_retort)
     result = dumper.dump("obj")
     
     assert result == "dumped"
-    mock_retort.dump.assert_called_once_with("obj")
+    mock_retort.get_dumper.assert_called_once_with(str)
+    mock_retort.get_dumper.return_value.assert_called_once_with("obj")
 
 
 def test_adaptix_loader():
     mock_retort = Mock(spec=Retort)
-    mock_retort.load.return_value = "loaded"
+    mock_retort.get_loader.return_value = Mock(return_value="loaded")
     
     loader = AdaptixLoader(mock_retort)
     result = loader.load("data", str)
     
     assert result == "loaded"
-    mock_retort.load.assert_called_once_with("data", str)
+    mock_retort.get_loader.assert_called_once_with(str)
+    mock_retort.get_loader.return_value.assert_called_once_with("data")
+
+
+def test_converters_cached_per_type():
+    mock_retort = Mock(spec=Retort)
+    mock_retort.get_dumper.side_effect = lambda tp: tp
+    mock_retort.get_loader.side_effect = lambda tp: tp
+    dumper = AdaptixDumper(mock_retort)
+    loader = AdaptixLoader(mock_retort)
+
+    assert [dumper.dump(x) for x in (1, 2, "3")] == [1, 2, "3"]
+    assert [loader.load(x, str) for x in (1, 2)] == ["1", "2"]
+
+    assert mock_retort.get_dumper.call_count == 2
+    assert mock_retort.get_loader.call_count == 1
+
+
+def test_oldest_type_evicted():
+    mock_retort = Mock(spec=Retort)
+    mock_retort.get_loader.side_effect = lambda tp: tp
+    loader = AdaptixLoader(mock_retort, max_types=2)
+
+    for tp in (int, str, float, str):
+        loader.load("1", tp)
+
+    assert list(loader._loaders) == [str, float]
+    assert mock_retort.get_loader.call_count == 3
+
+
+def test_concurrent_eviction():
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+
+    mock_retort = Mock(spec=Retort)
+    mock_retort.get_loader.side_effect = lambda tp: str
+    loader = AdaptixLoader(mock_retort, max_types=2)
+    types = [type(f"T{i}", (), {}) for i in range(2000)]
+
+    # Switch threads often so that misses interleave.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(lambda tp: loader.load(1, tp), types))
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert len(loader._loaders) == 2
+
+
+def test_warmup():
+    from dataclasses import dataclass
+
+    from unihttp.markers import Query
+    from unihttp.method import BaseMethod
+    from unihttp.serializers.adaptix import DEFAULT_RETORT
+
+    @dataclass
+    class GetItems(BaseMethod[list[int]]):
+        __url__ = "/items"
+        __method__ = "GET"
+
+        limit: Query[int] = 10
+
+    dumper = AdaptixDumper(DEFAULT_RETORT)
+    loader = AdaptixLoader(DEFAULT_RETORT)
+
+    dumper.warmup([GetItems])
+    loader.warmup([GetItems])
+
+    assert list(dumper._dumpers) == [GetItems]
+    assert list(loader._loaders) == [list[int]]
+    assert dumper.dump(GetItems())["query"] == {"limit": 10}
+    assert loader.load([1, 2], list[int]) == [1, 2]
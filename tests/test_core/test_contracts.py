@@ -23,11 +23,11 @@ def test_response_type_extraction():
 
 
 def test_make_response_contract():
-    class StrMethod(BaseMethod[str]):
+    class IntMethod(BaseMethod[int]):
         __url__ = "/"
         __method__ = "GET"
 
-    method = StrMethod()
+    method = IntMethod()
     response = HTTPResponse(200, {}, {"key": "val"}, {}, None)
     loader = Mock()
     loader.load.return_value = "parsed"
@@ -35,7 +35,7 @@ def test_make_response_contract():
     result = method.make_response(response, loader)
 
     assert result == "parsed"
-    loader.load.assert_called_once_with({"key": "val"}, str)
+    loader.load.assert_called_once_with({"key": "val"}, int)
 
 
 def test_make_response_contract_complex():
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+import pytest
+import unihttp
+import unihttp.middlewares
+import unihttp.serializers.adaptix
+
+
+def imported_after(statement: str) -> set[str]:
+    code = f"import sys\n{statement}\nprint('\\n'.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.split())
+
+
+@pytest.mark.parametrize(
+    "module", ["unihttp", "unihttp.middlewares", "unihttp.serializers.adaptix"]
+)
+def test_package_import_is_lazy(module):
+    modules = imported_after(f"import {module}")
+
+    assert "adaptix" not in modules
+    assert "asyncio" not in modules
+    assert "unihttp.method" not in modules
+    assert "unihttp.middlewares.retry" not in modules
+
+
+def test_sync_client_does_not_import_asyncio():
+    assert "asyncio" not in imported_after("import unihttp.clients.base")
+
+
+def test_exports_resolve():
+    from unihttp.bind_method import bind_method
+    from unihttp.markers import Path
+    from unihttp.method import BaseMethod
+    from unihttp.middlewares.retry import RetryMiddleware
+    from unihttp.serializers.adaptix.serialize import DEFAULT_RETORT
+
+    assert unihttp.BaseMethod is BaseMethod
+    assert unihttp.Path is Path
+    assert unihttp.bind_method is bind_method
+    assert unihttp.middlewares.RetryMiddleware is RetryMiddleware
+    assert unihttp.serializers.adaptix.DEFAULT_RETORT is DEFAULT_RETORT
+
+
+@pytest.mark.parametrize(
+    "package", [unihttp, unihttp.middlewares, unihttp.serializers.adaptix]
+)
+def test_all_and_dir(package):
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+    assert set(package.__all__) <= set(dir(package))
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        unihttp.missing  # noqa: B018
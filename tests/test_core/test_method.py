@@ -3,7 +3,7 @@ from unihttp.http.response import HTTPResponse
 from unihttp.method import BaseMethod
 
 
-class SimpleMethod(BaseMethod[str]):
+class SimpleMethod(BaseMethod[dict]):
     __url__ = "/users/{id}"
     __method__ = "GET"
 
@@ -47,7 +47,7 @@ def test_make_response(mock_response_loader):
     result = method.make_response(response, mock_response_loader)
 
     assert result == "loaded_data"
-    mock_response_loader.load.assert_called_once_with({"key": "value"}, str)
+    mock_response_loader.load.assert_called_once_with({"key": "value"}, dict)
 
 
 def test_validate_response_default():
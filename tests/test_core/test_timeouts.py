@@ -0,0 +1,51 @@
+import time
+
+import pytest
+from unihttp.exceptions import RequestTimeoutError
+from unihttp.method import BaseMethod
+from unihttp.timeouts import get_deadline, remaining, timeout
+
+
+class SimpleMethod(BaseMethod[str]):
+    __url__ = "/test"
+    __method__ = "GET"
+
+
+class TimedMethod(BaseMethod[str]):
+    __url__ = "/test"
+    __method__ = "GET"
+    __timeout__ = 5.0
+
+
+def test_no_deadline_by_default(mock_request_dumper):
+    assert get_deadline() is None
+    assert SimpleMethod().build_http_request(mock_request_dumper).deadline is None
+
+
+def test_method_timeout_sets_deadline(mock_request_dumper):
+    before = time.monotonic()
+    request = TimedMethod().build_http_request(mock_request_dumper)
+
+    assert before + 5.0 <= request.deadline <= time.monotonic() + 5.0
+
+
+def test_context_timeout_overrides_longer_method_timeout(mock_request_dumper):
+    with timeout(1.0) as deadline:
+        request = TimedMethod().build_http_request(mock_request_dumper)
+
+    assert request.deadline == deadline
+
+
+def test_nested_timeout_cannot_extend():
+    with timeout(1.0) as outer, timeout(10.0) as inner:
+        assert inner == outer
+        assert get_deadline() == outer
+    assert get_deadline() is None
+
+
+def test_remaining():
+    assert remaining(None) is None
+    assert 0 < remaining(time.monotonic() + 1.0) <= 1.0
+
+    with pytest.raises(RequestTimeoutError):
+        remaining(time.monotonic() - 1.0)
@@ -0,0 +1,245 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, Mock
+
+import msgspec
+import niquests
+import pytest
+import requests
+from unihttp.clients.niquests import NiquestsSyncClient
+from unihttp.clients.requests import RequestsSyncClient
+from unihttp.exceptions import NetworkError
+from unihttp.http.buffer import BodyBuffer, content_length
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+from unihttp.method import BaseMethod
+from unihttp.recording import Recorder
+from urllib3.exceptions import ProtocolError
+
+
+def _reader(content, chunk_size=7):
+    stream = io.BytesIO(content)
+    return lambda view: stream.readinto(view[:chunk_size])
+
+
+class TestBodyBuffer:
+    def test_reads_until_eof(self):
+        body = BodyBuffer().read(_reader(b'{"a": 1}'))
+
+        assert isinstance(body, memoryview)
+        assert body == b'{"a": 1}'
+
+    def test_grows_past_initial_size(self):
+        content = bytes(range(256)) * 1000
+
+        assert BodyBuffer().read(_reader(content, 4096)) == content
+
+    def test_buffer_reused(self):
+        buffer = BodyBuffer()
+
+        first = buffer.read(_reader(b"first"))
+        second = buffer.read(_reader(b"later"))
+
+        assert second.obj is first.obj
+        assert first == b"later"
+
+    def test_size_hint_allocates_once(self):
+        calls = []
+        reader = _reader(b"x" * 100_000, 100_000)
+
+        def readinto(view):
+            calls.append(len(view))
+            return reader(view)
+
+        assert len(BodyBuffer().read(readinto, size_hint=100_000)) == 100_000
+        assert calls == [100_001, 1]
+
+    def test_large_bodies_not_retained(self):
+        buffer = BodyBuffer(max_retained=1024)
+
+        first = buffer.read(_reader(b"x" * 100_000, 4096))
+        second = buffer.read(_reader(b"y" * 10))
+
+        assert first == b"x" * 100_000
+        assert second.obj is not first.obj
+
+    def test_one_buffer_per_thread(self):
+        buffer = BodyBuffer()
+        body = buffer.read(_reader(b"main"))
+
+        with ThreadPoolExecutor(1) as executor:
+            executor.submit(buffer.read, _reader(b"pool")).result()
+
+        assert body == b"main"
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            ({"Content-Length": "12"}, 12),
+            ({"Content-Length": "12", "Content-Encoding": "gzip"}, None),
+            ({"Content-Length": "-1"}, None),
+            ({}, None),
+        ],
+    )
+    def test_content_length(self, headers, expected):
+        assert content_length(headers) == expected
+
+
+class FakeRaw(io.BytesIO):
+    decode_content = False
+
+
+def _streamed_response(content, raw=None):
+    response = Mock(status_code=200, cookies={})
+    response.headers = {"Content-Length": str(len(content))}
+    response.raw = raw or FakeRaw(content)
+    type(response).content = property(Mock(side_effect=AssertionError("read")))
+    return response
+
+
+REQUEST = HTTPRequest(
+    url="/items",
+    method="GET",
+    header={},
+    path={},
+    query={},
+    body=None,
+    file={},
+    form={},
+)
+
+
+@pytest.mark.parametrize(
+    ("client_type", "session_type"),
+    [
+        (RequestsSyncClient, requests.Session),
+        (NiquestsSyncClient, niquests.Session),
+    ],
+)
+class TestClients:
+    def test_body_read_into_buffer(self, client_type, session_type):
+        session = MagicMock(spec=session_type)
+        session.request.return_value = _streamed_response(b'{"a": 1}')
+        client = client_type(
+            "http://api",
+            Mock(),
+            Mock(decodes_content=False),
+            session=session,
+            json_loads=msgspec.json.decode,
+            body_buffer=BodyBuffer(),
+        )
+
+        response = client.make_request(REQUEST)
+
+        assert session.request.call_args.kwargs["stream"] is True
+        assert session.request.return_value.raw.decode_content is True
+        assert isinstance(response.content, memoryview)
+        assert response.content == b'{"a": 1}'
+        assert response.data == {"a": 1}
+
+    def test_read_errors_raise_network_error(self, client_type, session_type):
+        raw = Mock(decode_content=False)
+        raw.readinto.side_effect = ProtocolError("connection broken")
+        session = MagicMock(spec=session_type)
+        session.request.return_value = _streamed_response(b"", raw)
+        client = client_type(
+            "http://api", Mock(), Mock(), session=session, body_buffer=BodyBuffer()
+        )
+
+        with pytest.raises(NetworkError):
+            client.make_request(REQUEST)
+
+
+class BufferClient(RequestsSyncClient):
+    def __init__(self, content, status_code=200):
+        self.loader = Mock(decodes_content=False)
+        super().__init__("http://api", Mock(), self.loader, body_buffer=BodyBuffer())
+        self.request_dumper.dump.return_value = {}
+        self.content = content
+        self.status_code = status_code
+
+    def make_request(self, request):
+        body = self._body_buffer.read(_reader(self.content))
+        data = self.decode_content(request, body)
+        return HTTPResponse(self.status_code, {}, data, {}, None, content=body)
+
+
+class GetBytes(BaseMethod[bytes]):
+    __url__ = "/items"
+    __method__ = "GET"
+
+
+def test_json_loads_without_buffer_support():
+    class GetItems(BaseMethod[dict]):
+        __url__ = "/items"
+        __method__ = "GET"
+
+    client = BufferClient(b'{"a": 1}')
+    client.loader.load.side_effect = lambda data, tp: data
+
+    assert client.call_method(GetItems()) == {"a": 1}
+
+
+def test_raw_results_outlive_the_buffer():
+    class GetResponse(BaseMethod[HTTPResponse]):
+        __url__ = "/items"
+        __method__ = "GET"
+
+    client = BufferClient(b"first")
+    content = client.call_method(GetBytes())
+    response = client.call_method(GetResponse())
+    client.content = b"later"
+    client.call_method(GetBytes())
+
+    assert content == b"first"
+    assert response.content == b"first"
+    assert type(response.content) is bytes
+
+
+def test_responses_in_exceptions_outlive_the_buffer():
+    class StrictGetBytes(GetBytes):
+        def on_error(self, response):
+            raise LookupError(response)
+
+    client = BufferClient(b"first", status_code=404)
+    with pytest.raises(LookupError) as exc_info:
+        client.call_method(StrictGetBytes())
+    client.content = b"later"
+    with pytest.raises(LookupError):
+        client.call_method(StrictGetBytes())
+
+    response = exc_info.value.args[0]
+    assert response.content == b"first"
+    assert type(response.content) is bytes
+
+
+def test_undecoded_responses_kept_by_middleware_outlive_the_buffer():
+    kept = []
+
+    class KeepingMiddleware:
+        reads_response_data = False
+
+        def handle(self, request, next_handler):
+            response = next_handler(request)
+            kept.append(response)
+            return response
+
+    client = BufferClient(b"first")
+    client.middleware = [KeepingMiddleware()]
+    client.call_method(GetBytes())
+    client.content = b"later"
+    client.call_method(GetBytes())
+
+    assert kept[0].content == b"first"
+    assert kept[0].data == b"first"
+    assert type(kept[0].content) is bytes
+
+
+def test_recorder_copies_buffered_bodies():
+    recorder = Recorder()
+    body = memoryview(bytearray(b"first"))
+
+    recorder.add(REQUEST, HTTPResponse(200, {}, None, {}, None, content=body), 0)
+    body[:] = b"later"
+
+    assert recorder.exchanges[0].content == b"first"
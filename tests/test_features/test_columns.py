@@ -0,0 +1,144 @@
+import json
+from array import array
+from dataclasses import dataclass
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel, Field
+from unihttp.clients.base import BaseSyncClient
+from unihttp.columns import Columns, load_columns
+from unihttp.http.response import HTTPResponse
+from unihttp.method import BaseMethod
+from unihttp.projection import projection_decoder
+
+ROWS = [
+    {"ts": 1, "value": 0.5, "ok": True, "host": "a", "extra": "x"},
+    {"ts": 2, "value": 1, "ok": False, "host": "b", "extra": "y"},
+]
+
+
+@dataclass
+class Sample:
+    ts: int
+    value: float
+    ok: bool
+    host: str
+
+
+class AliasedSample(BaseModel):
+    timestamp: int = Field(alias="ts")
+
+
+@dataclass
+class GetSamples(BaseMethod[Columns[Sample]]):
+    __url__ = "/samples"
+    __method__ = "GET"
+
+
+def test_load_columns_into_arrays():
+    columns = load_columns(ROWS, Sample, use_numpy=False)
+
+    assert columns["ts"] == array("q", [1, 2])
+    assert columns["value"] == array("d", [0.5, 1.0])
+    assert columns["ok"] == array("b", [1, 0])
+    assert columns["host"] == ["a", "b"]
+    assert list(columns) == ["ts", "value", "ok", "host"]
+    assert (len(columns), columns.row_count) == (4, 2)
+
+
+def test_load_columns_into_numpy_arrays():
+    numpy = pytest.importorskip("numpy")
+
+    columns = load_columns(ROWS, Sample)
+
+    assert columns["ts"].dtype == numpy.int64
+    assert columns["value"].tolist() == [0.5, 1.0]
+    assert columns["ok"].dtype == numpy.bool_
+    assert columns["host"] == ["a", "b"]
+
+
+def test_columns_named_by_attribute():
+    columns = load_columns([{"ts": 5}], AliasedSample, use_numpy=False)
+
+    assert columns["timestamp"] == array("q", [5])
+
+
+@pytest.fixture(params=[False, True], ids=["array", "numpy"])
+def use_numpy(request):
+    if request.param:
+        pytest.importorskip("numpy")
+    return request.param
+
+
+@pytest.mark.parametrize(
+    ("data", "match"),
+    [
+        ([{"ts": "1", "value": 1.0, "ok": True, "host": "a"}], "column 'ts'"),
+        ([{"ts": 1.5, "value": 1.0, "ok": True, "host": "a"}], "column 'ts'"),
+        ([{"ts": 1, "ok": True, "host": "a"}], "column 'value'"),
+    ],
+)
+def test_invalid_rows(data, match, use_numpy):
+    with pytest.raises(ValueError, match=match):
+        load_columns(data, Sample, use_numpy=use_numpy)
+
+
+def test_empty_rows(use_numpy):
+    columns = load_columns([], Sample, use_numpy=use_numpy)
+
+    assert columns.row_count == 0
+    assert len(columns["ts"]) == 0
+
+
+def test_data_must_be_list():
+    with pytest.raises(TypeError, match="Expected a list of records"):
+        load_columns({"ts": 1}, Sample)
+
+
+def test_row_type_must_be_record():
+    with pytest.raises(TypeError, match="record type"):
+        load_columns([], int)
+
+
+def test_method_loads_columns_without_loader():
+    content = json.dumps(ROWS).encode()
+
+    class Client(BaseSyncClient):
+        def make_request(self, request):
+            data = self.decode_content(request, content)
+            return HTTPResponse(200, {}, data, {}, None, content=content)
+
+    loader = Mock(spec=["load"])
+    client = Client("http://api", Mock(dump=Mock(return_value={})), loader)
+
+    columns = client.call_method(GetSamples())
+
+    assert GetSamples.__columns__ is Sample
+    assert list(columns["ts"]) == [1, 2]
+    loader.load.assert_not_called()
+
+
+def test_columns_with_loader_decoding_content():
+    content = json.dumps(ROWS).encode()
+
+    class Client(BaseSyncClient):
+        def make_request(self, request):
+            data = self.decode_content(request, content)
+            return HTTPResponse(200, {}, data, {}, None, content=content)
+
+    loader = Mock(spec=["load", "decodes_content"], decodes_content=True)
+    client = Client("http://api", Mock(dump=Mock(return_value={})), loader)
+
+    columns = client.call_method(GetSamples())
+
+    assert list(columns["host"]) == ["a", "b"]
+    loader.load.assert_not_called()
+
+
+def test_projection_of_columns():
+    content = json.dumps(ROWS).encode()
+
+    assert projection_decoder(Columns[Sample])(content) == [
+        {"ts": 1, "value": 0.5, "ok": True, "host": "a"},
+        {"ts": 2, "value": 1, "ok": False, "host": "b"},
+    ]
@@ -48,7 +48,7 @@ async def test_httpx_json_body_custom_dumps(mock_request_dumper, mock_response_l
     # Verify httpx called with content string and content-type header
     mock_client.request.assert_called_once()
     call_kwargs = mock_client.request.call_args.kwargs
-    assert call_kwargs["content"] == '{"custom": "json"}'
+    assert call_kwargs["content"] == b'{"custom": "json"}'
     assert call_kwargs["headers"]["Content-Type"] == "application/json"
     assert call_kwargs["data"] == {}
 
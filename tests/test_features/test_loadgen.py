@@ -0,0 +1,122 @@
+import json
+import sys
+import textwrap
+
+import pytest
+from unihttp.clients.base import BaseAsyncClient, BaseSyncClient
+from unihttp.exceptions import NetworkError
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+from unihttp.loadgen import load_factory, main, run_async, run_sync
+from unihttp.method import BaseMethod
+
+
+class Ping(BaseMethod[int]):
+    __url__ = "/ping"
+    __method__ = "GET"
+
+
+class PassThroughLoader:
+    def load(self, data, tp):
+        return data
+
+
+class Dumper:
+    def dump(self, method):
+        return {}
+
+
+class FlakySyncClient(BaseSyncClient):
+    def __init__(self):
+        super().__init__("http://test", Dumper(), PassThroughLoader())
+        self.calls = 0
+
+    def make_request(self, request: HTTPRequest) -> HTTPResponse:
+        self.calls += 1
+        if self.calls % 4 == 0:
+            raise NetworkError("reset")
+        return HTTPResponse(200, {}, self.calls, {}, None)
+
+
+class FlakyAsyncClient(BaseAsyncClient):
+    def __init__(self):
+        super().__init__("http://test", Dumper(), PassThroughLoader())
+        self.calls = 0
+
+    async def make_request(self, request: HTTPRequest) -> HTTPResponse:
+        self.calls += 1
+        if self.calls % 4 == 0:
+            raise NetworkError("reset")
+        return HTTPResponse(200, {}, self.calls, {}, None)
+
+
+async def test_async_open_loop():
+    client = FlakyAsyncClient()
+
+    result = await run_async(client, Ping, duration=0.2, rps=100)
+
+    assert 15 <= result.requests <= 20
+    assert result.errors == {"NetworkError": result.requests // 4}
+    assert result.target_rps == 100
+    assert result.throughput > 0
+    assert result.latency.max > 0
+
+
+async def test_async_closed_loop():
+    client = FlakyAsyncClient()
+
+    result = await run_async(client, Ping, duration=0.05, concurrency=4)
+
+    assert result.requests == client.calls
+    assert result.concurrency == 4
+
+
+def test_sync_open_loop():
+    client = FlakySyncClient()
+
+    result = run_sync(client, Ping, duration=0.2, rps=50, max_in_flight=4)
+
+    assert 8 <= result.requests <= 10
+    assert result.requests == client.calls
+
+
+def test_sync_closed_loop():
+    client = FlakySyncClient()
+
+    result = run_sync(client, Ping, duration=0.05, concurrency=2)
+
+    assert result.requests == client.calls
+    assert result.errors["NetworkError"] == client.calls // 4
+
+
+def test_load_factory_requires_attribute():
+    with pytest.raises(ValueError, match="module:attribute"):
+        load_factory("json")
+    assert load_factory("json:dumps") is json.dumps
+
+
+def test_main(tmp_path, monkeypatch, capsys):
+    (tmp_path / "loadgen_target.py").write_text(
+        textwrap.dedent(
+            """
+            from test_loadgen import FlakyAsyncClient, Ping
+
+            async def target():
+                return FlakyAsyncClient(), Ping
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setitem(sys.modules, "test_loadgen", sys.modules[__name__])
+    output = tmp_path / "result.json"
+
+    main([
+        "loadgen_target:target", "--rps", "50", "--duration", "0.1", "--json", str(output)
+    ])
+
+    report = capsys.readouterr().out
+    assert "open loop at 50 rps" in report
+    assert "NetworkError=1" in report
+    data = json.loads(output.read_text())
+    assert data["requests"] == 5
+    assert set(data["latency_ms"]) == {"p50", "p90", "p99", "p99.9", "max"}
@@ -0,0 +1,183 @@
+from unittest.mock import Mock
+
+import pytest
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+from unihttp.metrics import Histogram, MetricsRegistry
+from unihttp.middlewares.metrics import AsyncMetricsMiddleware, MetricsMiddleware
+from unihttp.middlewares.retry import RetryMiddleware
+
+
+def make_request(content: bytes | None = None) -> HTTPRequest:
+    return HTTPRequest(
+        "/users", "POST", {}, {}, {}, {}, {}, {},
+        content=content, method_name="CreateUser",
+    )
+
+
+class TestHistogram:
+    def test_small_values_are_exact(self):
+        histogram = Histogram(precision=4)
+        for value in range(16):
+            histogram.record(value)
+
+        assert histogram.buckets() == [(value + 1, 1) for value in range(16)]
+
+    @pytest.mark.parametrize("value", [17, 100, 1_000, 123_456, 10**9, 60 * 10**9])
+    def test_bucket_relative_error(self, value):
+        histogram = Histogram(precision=4)
+        histogram.record(value)
+
+        [(upper, count)] = histogram.buckets()
+        assert count == 1
+        assert value < upper <= value * (1 + 1 / 16) + 1
+
+    def test_percentiles(self):
+        histogram = Histogram()
+        for value in range(1, 1001):
+            histogram.record(value * 1000)
+
+        assert histogram.count == 1000
+        assert histogram.total == sum(value * 1000 for value in range(1, 1001))
+        assert histogram.max == 1_000_000
+        assert 500_000 <= histogram.percentile(50) <= 500_000 * 1.07
+        assert 990_000 <= histogram.percentile(99) <= 1_000_000
+        assert histogram.percentile(100) == 1_000_000
+
+    def test_empty_percentile(self):
+        assert Histogram().percentile(99) == 0
+
+    def test_merge(self):
+        first, second = Histogram(), Histogram()
+        first.record(10)
+        second.record(10)
+        second.record(5000)
+        first.merge(second)
+
+        assert first.count == 3
+        assert first.max == 5000
+        assert first.buckets()[0] == (11, 2)
+
+    def test_counts_are_read_only(self):
+        histogram = Histogram(5)
+        histogram.record(3)
+
+        assert histogram.precision == 5
+        assert dict(histogram.counts) == {3: 1}
+        with pytest.raises(TypeError):
+            histogram.counts[3] = 2  # type: ignore[index]
+
+    def test_merge_different_precision(self):
+        with pytest.raises(ValueError):
+            Histogram(4).merge(Histogram(5))
+
+
+class TestMetricsMiddleware:
+    def test_records_success(self):
+        registry = MetricsRegistry()
+        middleware = MetricsMiddleware(registry)
+        handler = Mock(
+            return_value=HTTPResponse(201, {}, {}, {}, None, content=b'{"id": 1}'),
+        )
+
+        middleware.handle(make_request(b'{"name": "x"}'), handler)
+
+        [series] = registry.snapshot().series
+        assert series.method == "CreateUser"
+        assert series.status == 201
+        assert series.count == 1
+        assert series.request_bytes == 13
+        assert series.response_bytes == 9
+        assert series.max_ns > 0
+
+    def test_records_error_and_reraises(self):
+        registry = MetricsRegistry()
+        middleware = MetricsMiddleware(registry)
+        handler = Mock(side_effect=ConnectionError("boom"))
+
+        with pytest.raises(ConnectionError):
+            middleware.handle(make_request(), handler)
+
+        snapshot = registry.snapshot()
+        assert snapshot.errors == {("CreateUser", "ConnectionError"): 1}
+        assert snapshot.series[0].status == "ConnectionError"
+
+    def test_counts_retries_when_placed_after_retry(self, mocker):
+        mocker.patch("time.sleep")
+        registry = MetricsRegistry()
+        handler = Mock(side_effect=[
+            HTTPResponse(503, {}, {}, {}, None),
+            HTTPResponse(503, {}, {}, {}, None),
+            HTTPResponse(200, {}, {}, {}, None),
+        ])
+        retry = RetryMiddleware(retries=3, backoff=0.1, jitter=False)
+        metrics = MetricsMiddleware(registry)
+
+        retry.handle(
+            make_request(),
+            lambda request: metrics.handle(request, handler),
+        )
+
+        snapshot = registry.snapshot()
+        counts = {series.status: series.count for series in snapshot.series}
+        assert counts == {503: 2, 200: 1}
+        assert snapshot.retries == {"CreateUser": 2}
+
+    @pytest.mark.asyncio
+    async def test_async(self):
+        registry = MetricsRegistry()
+        middleware = AsyncMetricsMiddleware(registry)
+
+        async def handler(request):
+            return HTTPResponse(200, {}, {}, {}, None, content=b"ok")
+
+        await middleware.handle(make_request(), handler)
+
+        [series] = registry.snapshot().series
+        assert (series.status, series.count, series.response_bytes) == (200, 1, 2)
+
+
+class TestOpenMetrics:
+    def test_export(self):
+        registry = MetricsRegistry()
+        registry.record("GetUser", 200, 1_000_000, response_bytes=10)
+        registry.record("GetUser", 200, 3_000_000, response_bytes=20)
+        registry.record("GetUser", "ReadTimeout", 5_000_000, attempt=1)
+
+        text = registry.to_openmetrics()
+        lines = text.splitlines()
+
+        assert lines[0] == "# TYPE unihttp_request_duration_seconds histogram"
+        assert lines[-1] == "# EOF"
+        assert (
+            'unihttp_request_duration_seconds_bucket{method="GetUser",status="200",'
+            'le="+Inf"} 2'
+        ) in lines
+        labels = 'method="GetUser",status="200"'
+        assert f"unihttp_request_duration_seconds_count{{{labels}}} 2" in lines
+        assert f"unihttp_response_size_bytes_total{{{labels}}} 30" in lines
+        assert 'unihttp_errors_total{method="GetUser",error="ReadTimeout"} 1' in lines
+        assert 'unihttp_retries_total{method="GetUser"} 1' in lines
+
+        buckets = [
+            int(line.rsplit(" ", 1)[1])
+            for line in lines
+            if line.startswith("unihttp_request_duration_seconds_bucket")
+            and 'status="200"' in line
+        ]
+        assert buckets == sorted(buckets)
+
+    def test_label_escaping(self):
+        registry = MetricsRegistry()
+        registry.record('Odd"Name', 200, 1)
+
+        assert 'method="Odd\\"Name"' in registry.to_openmetrics()
+
+    def test_reset(self):
+        registry = MetricsRegistry()
+        registry.record("GetUser", 200, 1, attempt=1)
+        registry.reset()
+
+        snapshot = registry.snapshot()
+        assert snapshot.series == []
+        assert snapshot.retries == {}
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
+from typing import Any
 from uuid import UUID
 
 import msgspec
@@ -224,3 +225,176 @@ def test_msgspec_dumper_bytes_base64():
 
     # msgspec.to_builtins encodes bytes as base64 (backend-specific behavior)
     assert result["body"]["payload"] == "aGVsbG8="
+
+
+def test_msgspec_dumper_caches_plan():
+    from unittest.mock import patch
+
+    from unihttp.serializers.msgspec import serialize
+
+    dumper = MsgspecDumper()
+    method = CreateUser(token="abc", user_id=1, user=User(id=1, name="a"))
+
+    with patch.object(
+        serialize, "get_type_hints", wraps=serialize.get_type_hints
+    ) as get_type_hints:
+        first = dumper.dump(method)
+        second = dumper.dump(method)
+
+    assert first == second
+    get_type_hints.assert_called_once()
+
+
+def test_msgspec_dumper_skips_omitted():
+    from unihttp.omitted import Omittable, Omitted
+
+    @dataclass
+    class Search(BaseMethod[None]):
+        __url__ = "/search"
+        __method__ = "GET"
+
+        q: Query[Omittable[str]] = Omitted()
+        page: Query[int] = 1
+
+    assert MsgspecDumper().dump(Search())["query"] == {"page": 1}
+
+
+def test_msgspec_dumper_encode_body():
+    dumper = MsgspecDumper(encode_body=True)
+    user = User(id=1, name="John")
+    method = CreateUser(token="abc", user_id=123, user=user)
+
+    request = method.build_http_request(dumper)
+
+    assert request.body == {"user": user}
+    assert request.content == b'{"user":{"id":1,"name":"John"}}'
+    assert request.content_type == "application/json"
+    assert request.query == {"q": "default"}
+
+
+def test_msgspec_dumper_encode_body_skips_multipart():
+    dumper = MsgspecDumper(encode_body=True)
+    uf = UploadFile(file=b"test", filename="test.txt", content_type="text/plain")
+
+    request = FileUpload(file=uf, description="desc").build_http_request(dumper)
+
+    assert request.content is None
+    assert request.form == {"description": "desc"}
+
+
+def test_msgspec_loader_decodes_raw_content():
+    loader = MsgspecLoader(decodes_content=True)
+
+    assert loader.load(b'{"id": 1, "name": "Alice"}', User) == User(1, "Alice")
+    assert loader.load(memoryview(b'[{"id": 2, "name": "Bob"}]'), list[User]) == [
+        User(2, "Bob")
+    ]
+    assert loader.load(b'{"id": 3, "name": "C"}', User) == User(3, "C")
+    assert set(loader._decoders) == {User, list[User]}
+
+
+def test_msgspec_loader_raw_validation_error():
+    with pytest.raises(msgspec.ValidationError):
+        MsgspecLoader(decodes_content=True).load(b'{"id": "x", "name": "Alice"}', User)
+
+
+def test_msgspec_loader_msgpack():
+    loader = MsgspecLoader(protocol="msgpack", decodes_content=True)
+    content = msgspec.msgpack.encode({"id": 1, "name": "Alice"})
+
+    assert loader.load(content, User) == User(1, "Alice")
+
+
+def test_msgspec_loader_converts_decoded_bytes():
+    loader = MsgspecLoader()
+
+    assert loader.load(b"not json", bytes) == b"not json"
+    assert loader.load(b"not json", Any) == b"not json"
+    assert loader._decoders == {}
+
+
+def test_msgspec_loader_unknown_protocol():
+    with pytest.raises(ValueError, match="Unsupported protocol"):
+        MsgspecLoader(protocol="yaml")
+
+
+class TestDecodesContent:
+    @dataclass
+    class GetUser(BaseMethod[User]):
+        __url__ = "/user"
+        __method__ = "GET"
+
+    def make_client(self, status_code, content):
+        from unihttp.clients.base import BaseSyncClient
+        from unihttp.http.response import HTTPResponse
+
+        class Client(BaseSyncClient):
+            def make_request(self, request):
+                data = self.decode_content(request, content)
+                self.seen = data
+                return HTTPResponse(status_code, {}, data, {}, None, content=content)
+
+        return Client("http://api", MsgspecDumper(), MsgspecLoader(decodes_content=True))
+
+    def test_body_decoded_by_loader(self):
+        client = self.make_client(200, b'{"id": 1, "name": "Alice"}')
+
+        assert client.call_method(self.GetUser()) == User(1, "Alice")
+        assert client.seen == b'{"id": 1, "name": "Alice"}'
+
+    def test_error_handlers_see_parsed_data(self):
+        @dataclass
+        class Strict(self.GetUser):
+            def on_error(self, response):
+                raise LookupError(response.data)
+
+        client = self.make_client(404, b'{"detail": "missing"}')
+
+        with pytest.raises(LookupError) as exc_info:
+            client.call_method(Strict())
+
+        assert exc_info.value.args == ({"detail": "missing"},)
+
+    def test_http_response_return_has_parsed_data(self):
+        from unihttp.http.response import HTTPResponse
+
+        @dataclass
+        class GetResponse(BaseMethod[HTTPResponse]):
+            __url__ = "/user"
+            __method__ = "GET"
+
+        client = self.make_client(200, b'{"id": 1, "name": "Alice"}')
+
+        assert client.call_method(GetResponse()).data == {"id": 1, "name": "Alice"}
+
+    def test_validate_response_sees_parsed_data(self):
+        seen = []
+
+        @dataclass
+        class Validated(self.GetUser):
+            def validate_response(self, response):
+                seen.append(response.data)
+
+        client = self.make_client(200, b'{"id": 1, "name": "Alice"}')
+
+        assert client.call_method(Validated()) == User(1, "Alice")
+        assert seen == [{"id": 1, "name": "Alice"}]
+
+
+def test_msgspec_loader_receives_non_json_fallback():
+    from unihttp.clients.base import BaseSyncClient
+    from unihttp.http.response import HTTPResponse
+
+    @dataclass
+    class GetAny(BaseMethod[Any]):
+        __url__ = "/any"
+        __method__ = "GET"
+
+    class Client(BaseSyncClient):
+        def make_request(self, request):
+            data = self.decode_content(request, b"OK")
+            return HTTPResponse(200, {}, data, {}, None, content=b"OK")
+
+    client = Client("http://api", MsgspecDumper(), MsgspecLoader())
+
+    assert client.call_method(GetAny()) == b"OK"
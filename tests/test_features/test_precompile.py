@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+from unittest.mock import Mock
+
+import msgspec
+import pytest
+from unihttp.bind_method import bind_method
+from unihttp.clients.base import BaseAsyncClient, BaseSyncClient, bound_method_types
+from unihttp.markers import Body, Path
+from unihttp.method import BaseMethod
+from unihttp.serializers.adaptix import DEFAULT_RETORT, AdaptixDumper, AdaptixLoader
+from unihttp.serializers.msgspec import MsgspecDumper, MsgspecLoader
+from unihttp.serializers.pydantic import PydanticDumper, PydanticLoader
+
+
+class User(msgspec.Struct):
+    id: int
+    name: str
+
+
+@dataclass
+class GetUser(BaseMethod[User]):
+    __url__ = "/users/{id}"
+    __method__ = "GET"
+
+    id: Path[int]
+
+
+@dataclass
+class CreateUser(BaseMethod[User]):
+    __url__ = "/users"
+    __method__ = "POST"
+
+    name: Body[str]
+
+
+@dataclass
+class DeleteUser(BaseMethod[None]):
+    __url__ = "/users/{id}"
+    __method__ = "DELETE"
+
+    id: Path[int]
+
+
+class UserClient(BaseSyncClient):
+    get_user = bind_method(GetUser)
+    create_user = bind_method(CreateUser)
+    create_named = bind_method(lambda name: CreateUser(name=name))
+
+
+class AdminClient(UserClient):
+    delete_user = bind_method(DeleteUser)
+    get_user_again = bind_method(GetUser)
+
+
+def test_bound_method_types():
+    assert bound_method_types(UserClient) == [GetUser, CreateUser]
+    assert bound_method_types(AdminClient) == [GetUser, CreateUser, DeleteUser]
+
+
+def test_precompile_adaptix():
+    dumper = AdaptixDumper(DEFAULT_RETORT)
+    loader = AdaptixLoader(DEFAULT_RETORT)
+    client = AdminClient("http://api", dumper, loader)
+
+    result = client.precompile()
+
+    assert set(result.timings) == {GetUser, CreateUser, DeleteUser}
+    assert list(result.timings.values()) == sorted(result.timings.values(), reverse=True)
+    assert result.elapsed >= sum(result.timings.values())
+    assert set(dumper._dumpers) == {GetUser, CreateUser, DeleteUser}
+    assert set(loader._loaders) == {User, type(None)}
+
+
+def test_precompile_msgspec():
+    dumper = MsgspecDumper()
+    loader = MsgspecLoader()
+    client = UserClient("http://api", dumper, loader)
+
+    client.precompile()
+
+    assert set(dumper._plans) == {GetUser, CreateUser}
+    assert set(loader._decoders) == {User}
+
+
+def test_precompile_pydantic():
+    loader = PydanticLoader()
+    client = UserClient("http://api", PydanticDumper(), loader)
+
+    client.precompile([DeleteUser])
+
+    assert set(loader._adapters) == {type(None)}
+
+
+def test_precompile_bare_retort(mocker):
+    get_dumper = mocker.spy(DEFAULT_RETORT, "get_dumper")
+    get_loader = mocker.spy(DEFAULT_RETORT, "get_loader")
+
+    UserClient("http://api", DEFAULT_RETORT, DEFAULT_RETORT).precompile()
+
+    assert [c.args for c in get_dumper.call_args_list] == [(GetUser,), (CreateUser,)]
+    assert [c.args for c in get_loader.call_args_list] == [(User,), (User,)]
+
+
+async def test_precompile_async_client():
+    class AsyncUserClient(BaseAsyncClient):
+        get_user = bind_method(GetUser)
+
+    loader = Mock(spec=["load", "warmup"])
+    client = AsyncUserClient("http://api", Mock(spec=["dump"]), loader)
+
+    result = client.precompile()
+
+    assert list(result.timings) == [GetUser]
+    loader.warmup.assert_called_once_with([GetUser])
+
+
+def test_precompile_surfaces_compile_errors():
+    class Broken:
+        pass
+
+    @dataclass
+    class GetBroken(BaseMethod[Broken]):
+        __url__ = "/broken"
+        __method__ = "GET"
+
+    loader = Mock(spec=["load", "warmup"])
+    loader.warmup.side_effect = TypeError("cannot compile")
+    client = UserClient("http://api", MsgspecDumper(), loader)
+
+    with pytest.raises(TypeError, match="cannot compile"):
+        client.precompile([GetBroken])
@@ -0,0 +1,193 @@
+from dataclasses import dataclass
+from typing import TypedDict
+
+import msgspec
+import pytest
+from pydantic import BaseModel, Field
+from unihttp.clients.base import BaseSyncClient
+from unihttp.http.response import HTTPResponse
+from unihttp.method import BaseMethod
+from unihttp.projection import projection_decoder
+from unihttp.serializers.adaptix import DEFAULT_RETORT
+
+WIDE = (
+    b'{"id": 1, "name": "a", "bio": "long", "extra": {"deep": [1, 2]},'
+    b' "owner": {"id": 2, "name": "b", "email": "b@x"},'
+    b' "tags": [{"label": "t", "color": "red"}]}'
+)
+
+
+@dataclass
+class Owner:
+    id: int
+    name: str
+
+
+@dataclass
+class Tag:
+    label: str
+
+
+@dataclass
+class Repo:
+    id: int
+    name: str
+    owner: Owner | None
+    tags: list[Tag]
+
+
+class PydanticRepo(BaseModel):
+    id: int
+    title: str = Field(alias="name")
+
+
+class StructRepo(msgspec.Struct, rename={"repo_id": "id"}):
+    repo_id: int
+
+
+class RepoDict(TypedDict):
+    id: int
+    owner: Owner
+
+
+@dataclass
+class Node:
+    id: int
+    children: list["Node"]
+
+
+@pytest.mark.parametrize(
+    ("tp", "expected"),
+    [
+        (
+            Repo,
+            {
+                "id": 1,
+                "name": "a",
+                "owner": {"id": 2, "name": "b"},
+                "tags": [{"label": "t"}],
+            },
+        ),
+        (PydanticRepo, {"id": 1, "name": "a"}),
+        (StructRepo, {"id": 1}),
+        (RepoDict, {"id": 1, "owner": {"id": 2, "name": "b"}}),
+    ],
+)
+def test_projection_decoder(tp, expected):
+    assert projection_decoder(tp)(WIDE) == expected
+
+
+def test_projection_of_collections_and_scalars():
+    assert projection_decoder(list[StructRepo])(b"[" + WIDE + b"]") == [{"id": 1}]
+    assert projection_decoder(dict[str, StructRepo])(b'{"a": ' + WIDE + b"}") == {
+        "a": {"id": 1}
+    }
+    assert projection_decoder(int)(b"7") == 7
+
+
+def test_projection_missing_and_null_keys():
+    assert projection_decoder(Repo)(b'{"id": 1, "owner": null}') == {
+        "id": 1,
+        "owner": None,
+    }
+
+
+def test_recursive_model():
+    content = b'{"id": 1, "x": 0, "children": [{"id": 2, "children": [], "y": 1}]}'
+
+    assert projection_decoder(Node)(content) == {
+        "id": 1,
+        "children": [{"id": 2, "children": [], "y": 1}],
+    }
+
+
+def test_mismatched_shape_raises_value_error():
+    with pytest.raises(ValueError):
+        projection_decoder(Repo)(b"[1, 2]")
+    with pytest.raises(ValueError):
+        projection_decoder(Repo)(b"not json")
+
+
+@dataclass
+class GetRepo(BaseMethod[Repo]):
+    __url__ = "/repo"
+    __method__ = "GET"
+    __projection__ = True
+
+
+@dataclass
+class GetRepoIds(BaseMethod[dict[str, int]]):
+    __url__ = "/repo"
+    __method__ = "GET"
+    __projection__ = TypedDict("RepoIds", {"id": int})
+
+
+class FakeClient(BaseSyncClient):
+    def __init__(self, status_code, content):
+        super().__init__("http://api", DEFAULT_RETORT, DEFAULT_RETORT)
+        self.status_code = status_code
+        self.content = content
+        self.json_calls = 0
+
+        def json_loads(content):
+            self.json_calls += 1
+            return msgspec.json.decode(content)
+
+        self.json_loads = json_loads
+
+    def make_request(self, request):
+        data = self.decode_content(request, self.content)
+        return HTTPResponse(self.status_code, {}, data, {}, None, content=self.content)
+
+
+class TestClientProjection:
+    def test_projected_body_loaded(self):
+        client = FakeClient(200, WIDE)
+
+        assert client.call_method(GetRepo()) == Repo(
+            1, "a", Owner(2, "b"), [Tag("t")]
+        )
+        assert client.json_calls == 0
+
+    def test_explicit_projection(self):
+        client = FakeClient(200, WIDE)
+
+        assert client.call_method(GetRepoIds()) == {"id": 1}
+
+    def test_error_responses_fully_decoded(self):
+        @dataclass
+        class StrictGetRepo(GetRepo):
+            def on_error(self, response):
+                raise LookupError(response.data)
+
+        client = FakeClient(404, b'{"detail": "missing"}')
+
+        with pytest.raises(LookupError) as exc_info:
+            client.call_method(StrictGetRepo())
+
+        assert exc_info.value.args == ({"detail": "missing"},)
+
+    def test_middleware_sees_decoded_data(self):
+        seen = []
+
+        class Spy:
+            def handle(self, request, next_handler):
+                response = next_handler(request)
+                seen.append(response.data)
+                return response
+
+        client = FakeClient(200, WIDE)
+        client.middleware = [Spy()]
+
+        assert client.call_method(GetRepo()) == Repo(1, "a", Owner(2, "b"), [Tag("t")])
+        assert seen == [msgspec.json.decode(WIDE)]
+
+    def test_decoder_cached_per_class(self):
+        assert GetRepo.response_decoder() is GetRepo.response_decoder()
+        assert BaseMethod.response_decoder() is None
+
+        @dataclass
+        class GetOwner(GetRepo):
+            pass
+
+        assert GetOwner.response_decoder() is not GetRepo.response_decoder()
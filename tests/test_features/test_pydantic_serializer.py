@@ -223,3 +223,84 @@ def test_pydantic_dumper_skips_dunder_and_untyped():
     assert "dynamic_attr" not in result["body"]
     # Check that it didn't crash
     assert result["header"]["token"] == "abc"
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        CreateUser(token="abc", user_id=123, user=User(id=1, name="John"), q="s"),
+        FileUpload(
+            file=UploadFile(file=b"test", filename="test.txt", content_type="text/plain"),
+            description="desc",
+        ),
+        ComplexParams(
+            status=Status.ACTIVE,
+            since=datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            tracking_id=UUID("12345678-1234-5678-1234-567812345678"),
+        ),
+        NestedBody(users=[User(id=1, name="A"), User(id=2, name="B")]),
+        OptionalParams(),
+    ],
+)
+def test_single_adapter_matches_per_field_dump(method):
+    assert PydanticDumper(single_adapter=True).dump(method) == PydanticDumper().dump(
+        method
+    )
+
+
+def test_single_adapter_excludes_omitted():
+    from unihttp.omitted import Omittable, Omitted
+
+    @dataclass
+    class Search(BaseMethod[None]):
+        __url__ = "/search"
+        __method__ = "GET"
+
+        q: Query[Omittable[str]] = Omitted()
+        since: Query[Omittable[datetime]] = Omitted()
+
+    dumper = PydanticDumper(single_adapter=True)
+    since = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+    assert dumper.dump(Search())["query"] == {}
+    assert dumper.dump(Search(q="x", since=since))["query"] == {
+        "q": "x",
+        "since": "2023-01-01T00:00:00Z",
+    }
+
+
+def test_single_adapter_compiled_once():
+    from unittest.mock import patch
+
+    from unihttp.serializers.pydantic import serialize
+
+    dumper = PydanticDumper(single_adapter=True)
+    method = CreateUser(token="abc", user_id=1, user=User(id=1, name="a"))
+
+    with patch.object(serialize, "TypeAdapter", wraps=serialize.TypeAdapter) as adapter:
+        dumper.warmup([CreateUser])
+        dumper.dump(method)
+        dumper.dump(method)
+
+    adapter.assert_called_once()
+
+
+@pytest.mark.parametrize("single_adapter", [False, True])
+def test_type_adapter_config(single_adapter):
+    from datetime import timedelta
+
+    @dataclass
+    class Wait(BaseMethod[None]):
+        __url__ = "/wait"
+        __method__ = "POST"
+
+        delay: Body[timedelta]
+        user: Body[User]
+
+    dumper = PydanticDumper(
+        {"ser_json_timedelta": "float"}, single_adapter=single_adapter
+    )
+
+    body = dumper.dump(Wait(delay=timedelta(seconds=2), user=User(id=1, name="a")))["body"]
+
+    assert body == {"delay": 2.0, "user": {"id": 1, "name": "a"}}
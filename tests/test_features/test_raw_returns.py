@@ -0,0 +1,175 @@
+from dataclasses import dataclass
+from unittest.mock import Mock
+
+import msgspec
+import pytest
+from unihttp.clients.base import BaseSyncClient
+from unihttp.http.response import HTTPResponse
+from unihttp.method import BaseMethod
+from unihttp.middlewares import LoggingMiddleware
+
+
+@dataclass
+class GetBytes(BaseMethod[bytes]):
+    __url__ = "/raw"
+    __method__ = "GET"
+
+
+@dataclass
+class GetText(BaseMethod[str]):
+    __url__ = "/raw"
+    __method__ = "GET"
+
+
+@dataclass
+class Delete(BaseMethod[None]):
+    __url__ = "/raw"
+    __method__ = "DELETE"
+
+
+@dataclass
+class GetResponse(BaseMethod[HTTPResponse]):
+    __url__ = "/raw"
+    __method__ = "GET"
+
+
+class FakeClient(BaseSyncClient):
+    def __init__(self, status_code, content, headers=None):
+        self.loader = Mock(decodes_content=False)
+        super().__init__("http://api", Mock(), self.loader)
+        self.request_dumper.dump.return_value = {}
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.json_calls = 0
+
+        def json_loads(content):
+            self.json_calls += 1
+            return msgspec.json.decode(content)
+
+        self.json_loads = json_loads
+
+    def make_request(self, request):
+        data = self.decode_content(request, self.content)
+        return HTTPResponse(
+            self.status_code, self.headers, data, {}, None, content=self.content
+        )
+
+
+class TestRawReturns:
+    def test_bytes(self):
+        client = FakeClient(200, b'{"a": 1}')
+
+        assert client.call_method(GetBytes()) == b'{"a": 1}'
+        assert client.json_calls == 0
+        client.loader.load.assert_not_called()
+
+    def test_str_uses_response_charset(self):
+        content = "café".encode("latin-1")
+        client = FakeClient(
+            200, content, {"Content-Type": 'text/plain; charset="latin-1"'}
+        )
+
+        assert client.call_method(GetText()) == "café"
+        assert client.json_calls == 0
+
+    def test_str_defaults_to_utf8(self):
+        client = FakeClient(200, "café".encode())
+
+        assert client.call_method(GetText()) == "café"
+
+    def test_str_unknown_charset_falls_back_to_utf8(self):
+        client = FakeClient(
+            200, "café".encode(), {"Content-Type": "text/plain; charset=no-such"}
+        )
+
+        assert client.call_method(GetText()) == "café"
+
+    def test_none(self):
+        client = FakeClient(204, b"")
+
+        assert client.call_method(Delete()) is None
+        client.loader.load.assert_not_called()
+
+    def test_http_response_keeps_decoded_data(self):
+        client = FakeClient(200, b'{"a": 1}')
+
+        response = client.call_method(GetResponse())
+
+        assert isinstance(response, HTTPResponse)
+        assert response.data == {"a": 1}
+        client.loader.load.assert_not_called()
+
+    def test_error_responses_fully_decoded(self):
+        @dataclass
+        class StrictGetText(GetText):
+            def on_error(self, response):
+                raise LookupError(response.data)
+
+        client = FakeClient(404, b'{"detail": "missing"}')
+
+        with pytest.raises(LookupError) as exc_info:
+            client.call_method(StrictGetText())
+
+        assert exc_info.value.args == ({"detail": "missing"},)
+
+    def test_middleware_sees_decoded_data(self):
+        seen = []
+
+        class Spy:
+            def handle(self, request, next_handler):
+                response = next_handler(request)
+                seen.append(response.data)
+                return response
+
+        client = FakeClient(200, b'{"a": 1}')
+        client.middleware = [Spy()]
+
+        assert client.call_method(GetBytes()) == b'{"a": 1}'
+        assert seen == [{"a": 1}]
+
+    def test_middleware_not_reading_data_keeps_body_undecoded(self):
+        client = FakeClient(200, b'{"a": 1}')
+        client.middleware = [LoggingMiddleware()]
+
+        assert client.call_method(GetBytes()) == b'{"a": 1}'
+        assert client.json_calls == 0
+
+    def test_subclass_changing_return_type_uses_loader(self):
+        @dataclass
+        class GetItems(GetText, BaseMethod[list[int]]):
+            pass
+
+        client = FakeClient(200, b"[1, 2]")
+        client.loader.load.return_value = [1, 2]
+
+        assert client.call_method(GetItems()) == [1, 2]
+        client.loader.load.assert_called_once_with([1, 2], list[int])
+
+
+class DataOnlyClient(BaseSyncClient):
+    """Custom client passing the body as `data` without `content`."""
+
+    def __init__(self, data):
+        super().__init__("http://api", Mock(), Mock(decodes_content=False))
+        self.request_dumper.dump.return_value = {}
+        self.data = data
+
+    def make_request(self, request):
+        return HTTPResponse(200, {}, self.data, {}, None)
+
+
+class TestResponsesWithoutContent:
+    def test_bytes_from_data(self):
+        assert DataOnlyClient(b"blob").call_method(GetBytes()) == b"blob"
+
+    def test_str_from_data(self):
+        assert DataOnlyClient("text").call_method(GetText()) == "text"
+        assert DataOnlyClient("café".encode()).call_method(GetText()) == "café"
+
+    def test_empty_body(self):
+        assert DataOnlyClient(None).call_method(GetBytes()) == b""
+
+    def test_decoded_data_rejected(self):
+        with pytest.raises(TypeError):
+            DataOnlyClient({"a": 1}).call_method(GetBytes())
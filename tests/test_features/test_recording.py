@@ -0,0 +1,165 @@
+import gzip
+import json
+from dataclasses import dataclass
+
+import pytest
+from unihttp.clients.base import BaseAsyncClient, BaseSyncClient
+from unihttp.clients.replay import ReplayAsyncClient, ReplaySyncClient
+from unihttp.exceptions import ReplayMissError, RequestTimeoutError
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+from unihttp.markers import Body, Header, Query
+from unihttp.method import BaseMethod
+from unihttp.recording import Recorder, Recording
+from unihttp.serializers.adaptix import DEFAULT_RETORT
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+
+
+@dataclass
+class CreateItem(BaseMethod[Item]):
+    __url__ = "/items"
+    __method__ = "POST"
+
+    name: Body[str]
+    token: Header[str] = "secret"
+    dry_run: Query[bool] = False
+
+
+class FakeSyncClient(BaseSyncClient):
+    def __init__(self):
+        super().__init__("http://api", DEFAULT_RETORT, DEFAULT_RETORT)
+        self.calls = 0
+
+    def make_request(self, request: HTTPRequest) -> HTTPResponse:
+        self.calls += 1
+        body = json.loads(request.content)
+        content = json.dumps({"id": self.calls, "name": body["name"]}).encode()
+        data = self.decode_content(request, content)
+        return HTTPResponse(
+            201, {"Content-Type": "application/json"}, data, {}, None, content=content
+        )
+
+
+class FailingAsyncClient(BaseAsyncClient):
+    def __init__(self):
+        super().__init__("http://api", DEFAULT_RETORT, DEFAULT_RETORT)
+
+    async def make_request(self, request: HTTPRequest) -> HTTPResponse:
+        raise RequestTimeoutError("slow")
+
+
+def record_items(*names: str) -> Recorder:
+    client = FakeSyncClient()
+    recorder = Recorder(redact_headers=["Token"])
+    recorder.attach(client)
+    for name in names:
+        client.call_method(CreateItem(name=name))
+    return recorder
+
+
+class TestRecorder:
+    def test_records_exchanges(self):
+        recorder = record_items("a")
+
+        [exchange] = recorder.exchanges
+        assert exchange.method == "POST"
+        assert exchange.url == "/items"
+        assert exchange.query == {"dry_run": False}
+        assert exchange.request_headers == {"token": "[redacted]"}
+        assert json.loads(exchange.request_content) == {"name": "a"}
+        assert exchange.status_code == 201
+        assert json.loads(exchange.content) == {"id": 1, "name": "a"}
+        assert exchange.method_name == "CreateItem"
+        assert exchange.latency_ns > 0
+
+    async def test_records_errors(self):
+        client = FailingAsyncClient()
+        recorder = Recorder()
+        recorder.attach(client)
+
+        with pytest.raises(RequestTimeoutError):
+            await client.call_method(CreateItem(name="a"))
+
+        [exchange] = recorder.exchanges
+        assert exchange.error == "RequestTimeoutError"
+        assert exchange.status_code == 0
+
+    def test_save_and_load(self, tmp_path):
+        path = tmp_path / "traffic.jsonl.gz"
+        recorder = record_items("a", "b")
+
+        recorder.save(path)
+        loaded = Recording.load(path)
+
+        assert list(loaded) == recorder.exchanges
+
+    def test_load_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.gz"
+        with gzip.open(path, "wt") as f:
+            f.write("{}\n")
+
+        with pytest.raises(ValueError, match="not a unihttp recording"):
+            Recording.load(path)
+
+
+class TestReplay:
+    def test_sync_replay(self):
+        recording = record_items("a", "b", "a").recording()
+        client = ReplaySyncClient(
+            "http://api", DEFAULT_RETORT, DEFAULT_RETORT, recording=recording
+        )
+
+        assert client.call_method(CreateItem(name="a")) == Item(1, "a")
+        assert client.call_method(CreateItem(name="b")) == Item(2, "b")
+        assert client.call_method(CreateItem(name="a")) == Item(3, "a")
+        # recorded responses are served again once exhausted
+        assert client.call_method(CreateItem(name="a")) == Item(1, "a")
+
+    def test_match_without_body(self):
+        recording = record_items("a", "b").recording(match_body=False)
+        client = ReplaySyncClient(
+            "http://api", DEFAULT_RETORT, DEFAULT_RETORT, recording=recording
+        )
+
+        assert client.call_method(CreateItem(name="z")) == Item(1, "a")
+
+    def test_miss(self):
+        client = ReplaySyncClient(
+            "http://api", DEFAULT_RETORT, DEFAULT_RETORT, recording=Recording()
+        )
+
+        with pytest.raises(ReplayMissError, match="POST /items"):
+            client.call_method(CreateItem(name="a"))
+
+    async def test_async_replay_with_latency(self, mocker):
+        sleep = mocker.patch("asyncio.sleep")
+        recording = record_items("a").recording()
+        client = ReplayAsyncClient(
+            "http://api",
+            DEFAULT_RETORT,
+            DEFAULT_RETORT,
+            recording=recording,
+            latency=2.0,
+        )
+
+        assert await client.call_method(CreateItem(name="a")) == Item(1, "a")
+        sleep.assert_awaited_once_with(recording.exchanges[0].latency_ns * 2.0 / 1e9)
+
+    async def test_replays_errors(self):
+        client = FailingAsyncClient()
+        recorder = Recorder()
+        recorder.attach(client)
+        with pytest.raises(RequestTimeoutError):
+            await client.call_method(CreateItem(name="a"))
+
+        replay = ReplayAsyncClient(
+            "http://api", DEFAULT_RETORT, DEFAULT_RETORT, recording=recorder.recording()
+        )
+
+        with pytest.raises(RequestTimeoutError):
+            await replay.call_method(CreateItem(name="a"))
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from unittest.mock import Mock, call
 
 import pytest
@@ -83,6 +84,37 @@ class TestRetryMiddleware:
         mock_sleep.assert_called_once_with(1.5)
 
 
+    def test_stops_retrying_at_deadline(self, mocker):
+        mock_sleep = mocker.patch("time.sleep")
+
+        handler = Mock(return_value=HTTPResponse(503, {}, {}, {}, None))
+        middleware = RetryMiddleware(retries=5, backoff=1.0, jitter=False)
+        request = HTTPRequest("/", "GET", {}, {}, {}, {}, {}, {})
+        request.deadline = time.monotonic() + 1.5
+
+        response = middleware.handle(request, handler)
+
+        # 1s fits into the budget, the following 2s backoff would overrun it
+        assert response.status_code == 503
+        assert handler.call_count == 2
+        mock_sleep.assert_called_once_with(1.0)
+
+    def test_reraises_when_backoff_exceeds_deadline(self, mocker):
+        mock_sleep = mocker.patch("time.sleep")
+
+        handler = Mock(side_effect=ValueError("fail"))
+        middleware = RetryMiddleware(
+            retries=3, backoff=1.0, exceptions=[ValueError], jitter=False
+        )
+        request = HTTPRequest("/", "GET", {}, {}, {}, {}, {}, {})
+        request.deadline = time.monotonic() + 0.5
+
+        with pytest.raises(ValueError, match="fail"):
+            middleware.handle(request, handler)
+
+        assert handler.call_count == 1
+        mock_sleep.assert_not_called()
+
 @pytest.mark.asyncio
 class TestAsyncRetryMiddleware:
     async def test_retry_on_status_code(self, mocker):
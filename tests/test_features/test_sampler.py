@@ -0,0 +1,191 @@
+import io
+from unittest.mock import Mock
+
+import pytest
+from unihttp.clients.base import BaseAsyncClient, BaseSyncClient
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+from unihttp.method import BaseMethod
+from unihttp.middlewares.sampler import AsyncSlowCallMiddleware, SlowCallMiddleware
+from unihttp.sampler import SlowCallSampler
+from unihttp.timings import CallTimings
+
+
+def make_request(**kwargs) -> HTTPRequest:
+    return HTTPRequest(
+        "/users", "GET", {}, {}, {}, {}, {}, {}, method_name="GetUser", **kwargs
+    )
+
+
+def ok_handler(request):
+    return HTTPResponse(200, {}, None, {}, None, content=b"[1, 2]")
+
+
+class TestSlowCallMiddleware:
+    def test_records_slow_call(self, mocker):
+        mocker.patch(
+            "unihttp.middlewares.sampler.perf_counter_ns",
+            side_effect=[0, 2_000_000_000],
+        )
+        sampler = SlowCallSampler(threshold=1.0)
+
+        SlowCallMiddleware(sampler).handle(make_request(content=b"{}"), ok_handler)
+
+        [call] = sampler.records()
+        assert call.method == "GetUser"
+        assert call.status == 200
+        assert call.reason == "threshold"
+        assert call.elapsed_ns == 2_000_000_000
+        assert (call.request_bytes, call.response_bytes) == (2, 6)
+        assert call.profile is None
+
+    def test_skips_fast_call(self):
+        sampler = SlowCallSampler(threshold=10.0)
+
+        SlowCallMiddleware(sampler).handle(make_request(), ok_handler)
+
+        assert sampler.records() == []
+
+    def test_random_sample_without_attached_client(self, mocker):
+        mocker.patch("random.random", return_value=0.05)
+        sampler = SlowCallSampler(threshold=None, sample_rate=0.1, profile_rate=0.1)
+
+        SlowCallMiddleware(sampler).handle(make_request(), ok_handler)
+
+        [call] = sampler.records()
+        assert call.reason == "sample"
+        assert call.profile is None
+
+    def test_not_sampled(self, mocker):
+        mocker.patch("random.random", return_value=0.5)
+        sampler = SlowCallSampler(threshold=None, sample_rate=0.1, profile_rate=0.1)
+
+        SlowCallMiddleware(sampler).handle(make_request(), ok_handler)
+
+        assert sampler.records() == []
+
+    def test_records_error(self):
+        sampler = SlowCallSampler(threshold=0)
+        handler = Mock(side_effect=TimeoutError())
+
+        with pytest.raises(TimeoutError):
+            SlowCallMiddleware(sampler).handle(make_request(), handler)
+
+        assert sampler.records()[0].status == "TimeoutError"
+
+    def test_ring_buffer(self):
+        sampler = SlowCallSampler(threshold=0, capacity=2)
+        middleware = SlowCallMiddleware(sampler)
+
+        for attempt in range(3):
+            middleware.handle(make_request(attempt=attempt), ok_handler)
+
+        assert [call.attempt for call in sampler.records()] == [1, 2]
+        sampler.clear()
+        assert sampler.records() == []
+
+    def test_dump(self):
+        sampler = SlowCallSampler(threshold=0)
+        timings = CallTimings("GetUser", dump_ns=1_000_000, total_ns=5_000_000)
+
+        SlowCallMiddleware(sampler).handle(make_request(timings=timings), ok_handler)
+        out = io.StringIO()
+        sampler.dump(out)
+
+        report = out.getvalue()
+        assert report.startswith("GetUser /users -> 200")
+        assert "dump=1.000" in report
+        assert "total=5.000" in report
+
+    @pytest.mark.asyncio
+    async def test_async(self):
+        sampler = SlowCallSampler(threshold=0)
+
+        async def handler(request):
+            return ok_handler(request)
+
+        await AsyncSlowCallMiddleware(sampler).handle(make_request(), handler)
+
+        assert len(sampler.records()) == 1
+
+
+class Dumper:
+    def dump(self, method):
+        return {}
+
+
+class Loader:
+    def load(self, data, response_type):
+        return data
+
+
+class GetUsers(BaseMethod[dict]):
+    __url__ = "/users"
+    __method__ = "GET"
+
+
+def decoded_response(client, request):
+    response = ok_handler(request)
+    response.data = client.decode_content(request, response.content)
+    return response
+
+
+class TestAttachedSampler:
+    def test_profile_covers_dump_and_load(self, mocker):
+        mocker.patch("random.random", return_value=0.05)
+        sampler = SlowCallSampler(threshold=None, sample_rate=0.1, profile_rate=0.1)
+
+        class Client(BaseSyncClient):
+            def make_request(self, request):
+                return decoded_response(self, request)
+
+        client = Client(
+            "http://api", Dumper(), Loader(), middleware=[SlowCallMiddleware(sampler)]
+        )
+        sampler.attach(client)
+
+        assert client.call_method(GetUsers()) == [1, 2]
+
+        [call] = sampler.records()
+        profile = call.profile_text(limit=100)
+        assert "decoded_response" in profile
+        assert "(dump)" in profile
+        assert "(load)" in profile
+
+    def test_not_sampled(self, mocker):
+        mocker.patch("random.random", return_value=0.5)
+        sampler = SlowCallSampler(threshold=None, sample_rate=0.1, profile_rate=0.1)
+
+        class Client(BaseSyncClient):
+            def make_request(self, request):
+                return decoded_response(self, request)
+
+        client = Client(
+            "http://api", Dumper(), Loader(), middleware=[SlowCallMiddleware(sampler)]
+        )
+        sampler.attach(client)
+        client.call_method(GetUsers())
+
+        assert sampler.records() == []
+
+    @pytest.mark.asyncio
+    async def test_async(self, mocker):
+        mocker.patch("random.random", return_value=0.05)
+        sampler = SlowCallSampler(threshold=None, sample_rate=0.1, profile_rate=0.1)
+
+        class Client(BaseAsyncClient):
+            async def make_request(self, request):
+                return decoded_response(self, request)
+
+        client = Client(
+            "http://api",
+            Dumper(),
+            Loader(),
+            middleware=[AsyncSlowCallMiddleware(sampler)],
+        )
+        sampler.attach(client)
+
+        assert await client.call_method(GetUsers()) == [1, 2]
+
+        [call] = sampler.records()
+        assert "(load)" in call.profile_text(limit=100)
@@ -0,0 +1,167 @@
+from dataclasses import replace
+
+import pytest
+from unihttp.clients.base import BaseAsyncClient, BaseSyncClient
+from unihttp.http.request import HTTPRequest
+from unihttp.http.response import HTTPResponse
+from unihttp.method import BaseMethod
+from unihttp.tracing import Tracer
+from unihttp.tracing.httpcore import AsyncHTTPCoreTrace, HTTPCoreTrace
+
+
+class RecordingTracer(Tracer):
+    def __init__(self):
+        self.events = []
+
+    def on_request_start(self, request):
+        self.events.append(("start", request.method_name))
+
+    def on_connection_acquired(self, request, reused):
+        self.events.append(("connection", reused))
+
+    def on_headers_received(self, request):
+        self.events.append(("headers",))
+
+    def on_body_complete(self, request, response):
+        self.events.append(("complete", response.status_code))
+
+    def on_error(self, request, error):
+        self.events.append(("error", type(error).__name__))
+
+
+class Ping(BaseMethod[dict]):
+    __url__ = "/ping"
+    __method__ = "GET"
+
+
+def make_request() -> HTTPRequest:
+    return HTTPRequest("/ping", "GET", {}, {}, {}, {}, {}, {}, method_name="Ping")
+
+
+class TestClientTracer:
+    def test_success(self, mock_request_dumper, mock_response_loader):
+        class Client(BaseSyncClient):
+            def make_request(self, request):
+                self.tracer.on_headers_received(request)
+                return HTTPResponse(201, {}, None, {}, None)
+
+        tracer = RecordingTracer()
+        client = Client("http://base", mock_request_dumper, mock_response_loader)
+        client.tracer = tracer
+
+        client.call_method(Ping())
+
+        assert tracer.events == [("start", "Ping"), ("headers",), ("complete", 201)]
+
+    def test_replaced_request_sent(self, mock_request_dumper, mock_response_loader):
+        sent, seen = [], []
+
+        class HeaderTracer(RecordingTracer):
+            def on_request_start(self, request):
+                return replace(request, header={**request.header, "X-Trace": "1"})
+
+            def on_body_complete(self, request, response):
+                seen.append(request)
+
+        class Client(BaseSyncClient):
+            def make_request(self, request):
+                sent.append(request)
+                return HTTPResponse(200, {}, None, {}, None)
+
+        client = Client("http://base", mock_request_dumper, mock_response_loader)
+        client.tracer = HeaderTracer()
+        request = make_request()
+
+        client._send_request(request)
+
+        assert sent[0].header == {"X-Trace": "1"}
+        assert seen == sent
+        assert request.header == {}
+
+    def test_error(self, mock_request_dumper, mock_response_loader):
+        class Client(BaseSyncClient):
+            def make_request(self, request):
+                raise ConnectionError("refused")
+
+        tracer = RecordingTracer()
+        client = Client("http://base", mock_request_dumper, mock_response_loader)
+        client.tracer = tracer
+
+        with pytest.raises(ConnectionError):
+            client.call_method(Ping())
+
+        assert tracer.events == [("start", "Ping"), ("error", "ConnectionError")]
+
+    @pytest.mark.asyncio
+    async def test_async(self, mock_request_dumper, mock_response_loader):
+        class Client(BaseAsyncClient):
+            tracer = RecordingTracer()
+
+            async def make_request(self, request):
+                return HTTPResponse(200, {}, None, {}, None)
+
+        client = Client("http://base", mock_request_dumper, mock_response_loader)
+
+        await client.call_method(Ping())
+
+        assert client.tracer.events == [("start", "Ping"), ("complete", 200)]
+
+
+class TestHTTPCoreTrace:
+    def test_new_connection(self):
+        tracer = RecordingTracer()
+        trace = HTTPCoreTrace(tracer, make_request())
+
+        for event in (
+            "connection.connect_tcp.started",
+            "connection.connect_tcp.complete",
+            "http11.send_request_headers.started",
+            "http11.send_request_headers.complete",
+            "http11.receive_response_headers.started",
+            "http11.receive_response_headers.complete",
+        ):
+            trace(event, {})
+
+        assert tracer.events == [("connection", False), ("headers",)]
+
+    @pytest.mark.asyncio
+    async def test_reused_connection(self):
+        tracer = RecordingTracer()
+        trace = AsyncHTTPCoreTrace(tracer, make_request())
+
+        await trace("http2.send_request_headers.started", {})
+        await trace("http2.receive_response_headers.complete", {})
+
+        assert tracer.events == [("connection", True), ("headers",)]
+
+
+class TestOpenTelemetryTracer:
+    def test_span(self):
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+        from unihttp.tracing.opentelemetry import OpenTelemetryTracer
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        tracer = OpenTelemetryTracer(tracer_provider=provider)
+        request = make_request()
+
+        sent = tracer.on_request_start(request)
+        tracer.on_connection_acquired(sent, True)
+        tracer.on_headers_received(sent)
+        tracer.on_body_complete(sent, HTTPResponse(200, {}, None, {}, None))
+
+        [span] = exporter.get_finished_spans()
+        assert span.name == "Ping"
+        assert span.attributes["http.response.status_code"] == 200
+        assert [event.name for event in span.events] == [
+            "connection_acquired",
+            "headers_received",
+        ]
+        assert "traceparent" in sent.header
+        assert "traceparent" not in request.header
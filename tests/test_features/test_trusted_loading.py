@@ -0,0 +1,122 @@
+from dataclasses import dataclass
+
+import msgspec
+import pytest
+from adaptix.load_error import LoadError
+from unihttp.http.response import HTTPResponse
+from unihttp.method import BaseMethod
+from unihttp.serialize import TrustingLoader
+from unihttp.serializers.adaptix import DEFAULT_RETORT, AdaptixLoader
+from unihttp.serializers.msgspec import MsgspecLoader
+
+
+class Item(msgspec.Struct):
+    id: int
+    name: str
+
+
+@dataclass
+class ItemRow:
+    id: int
+    name: str
+
+
+class RecordingLoader(TrustingLoader):
+    def load_validated(self, data, tp):
+        return "validated"
+
+    def load_unvalidated(self, data, tp):
+        return "unvalidated"
+
+
+@dataclass
+class GetItem(BaseMethod[Item]):
+    __url__ = "/item"
+    __method__ = "GET"
+
+
+@dataclass
+class TrustedGetItem(GetItem):
+    __trusted__ = True
+
+
+@dataclass
+class CheckedGetItem(GetItem):
+    __trusted__ = False
+
+
+def make_response(data):
+    return HTTPResponse(200, {}, data, {}, None)
+
+
+class TestTrustingLoader:
+    def test_validates_by_default(self):
+        assert RecordingLoader().load({}, Item) == "validated"
+
+    def test_trusted(self):
+        assert RecordingLoader(trusted=True).load({}, Item) == "unvalidated"
+
+    def test_sampled_validation(self, mocker):
+        mocker.patch("random.random", side_effect=[0.05, 0.5])
+        loader = RecordingLoader(trusted=True, validation_rate=0.1)
+
+        assert loader.load({}, Item) == "validated"
+        assert loader.load({}, Item) == "unvalidated"
+
+    @pytest.mark.parametrize(
+        ("method", "trusted_loader", "expected"),
+        [
+            (GetItem(), False, "validated"),
+            (GetItem(), True, "unvalidated"),
+            (TrustedGetItem(), False, "unvalidated"),
+            (CheckedGetItem(), True, "validated"),
+        ],
+    )
+    def test_method_override(self, method, trusted_loader, expected):
+        loader = RecordingLoader(trusted=trusted_loader)
+
+        assert method.make_response(make_response({}), loader) == expected
+
+
+class TestMsgspec:
+    def test_trusted_is_lax(self):
+        data = {"id": "1", "name": "a"}
+
+        with pytest.raises(msgspec.ValidationError):
+            MsgspecLoader().load(data, Item)
+        assert MsgspecLoader(trusted=True).load(data, Item) == Item(1, "a")
+        loader = MsgspecLoader(decodes_content=True, trusted=True)
+        assert loader.load(b'{"id": "2", "name": "b"}', Item) == Item(2, "b")
+
+    def test_sampled_validation_surfaces_drift(self, mocker):
+        mocker.patch("random.random", return_value=0.0)
+        loader = MsgspecLoader(trusted=True, validation_rate=0.5)
+
+        with pytest.raises(msgspec.ValidationError):
+            loader.load({"id": "1", "name": "a"}, Item)
+
+    def test_warmup_builds_lax_decoders_for_trusted_methods(self):
+        loader = MsgspecLoader()
+
+        loader.warmup([GetItem, TrustedGetItem])
+
+        assert set(loader._lax_decoders) == {Item}
+
+
+class TestAdaptix:
+    def test_trusted_coerces_leniently(self):
+        data = {"id": "1", "name": "a"}
+
+        with pytest.raises(LoadError):
+            AdaptixLoader(DEFAULT_RETORT).load(data, ItemRow)
+        assert AdaptixLoader(DEFAULT_RETORT, trusted=True).load(data, ItemRow) == ItemRow(
+            1, "a"
+        )
+
+    def test_validated_and_trusted_loaders_cached_separately(self):
+        loader = AdaptixLoader(DEFAULT_RETORT)
+        loader.load_validated({"id": 1, "name": "a"}, ItemRow)
+        loader.load_trusted({"id": 1, "name": "a"}, ItemRow)
+
+        assert list(loader._loaders) == [ItemRow]
+        assert list(loader._lenient_loaders) == [ItemRow]
@@ -35,7 +35,7 @@ async def test_async_client_error_handling(mock_request_dumper, mock_response_lo
 
         def handle_error(self, resp, method): pass
 
-    class Method(BaseMethod[str]):
+    class Method(BaseMethod[dict]):
         __url__ = "/"
         __method__ = "GET"
 
@@ -87,7 +87,7 @@ def test_base_client_default_handle_error():
     mock_dumper.dump.return_value = {"path": {}, "header": {}, "query": {}, "body": {}, "file": {}}
     client = SimpleC("http://b", mock_dumper, Mock())
 
-    class Method(BaseMethod[str]):
+    class Method(BaseMethod[dict]):
         __url__ = "/"
         __method__ = "GET"
 
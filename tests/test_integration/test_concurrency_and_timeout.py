@@ -133,3 +133,31 @@ async def test_timeout_success(integration_server, dumper, loader):
         async with AiohttpAsyncClient(base_url, dumper, loader, session=session) as client:
             method = SleepMethod(0.1)
             await client.call_method(method)
+
+
+@pytest.mark.asyncio
+async def test_warmup_aiohttp(integration_server, dumper, loader):
+    base_url = str(integration_server.make_url("/"))
+
+    async with AiohttpAsyncClient(base_url, dumper, loader) as client:
+        result = await client.warmup(connections=5, urls=["/echo"])
+
+        assert result.established == 5
+        assert result.failed == 0
+        assert result.elapsed > 0
+        assert await client.call_method(EchoMethod())
+
+
+@pytest.mark.asyncio
+async def test_warmup_on_enter_httpx(integration_server, dumper, loader, mocker):
+    base_url = str(integration_server.make_url("/"))
+
+    class WarmClient(HTTPXAsyncClient):
+        warmup_connections = 3
+
+    warmup = mocker.spy(WarmClient, "warmup")
+    async with WarmClient(base_url, dumper, loader):
+        pass
+
+    warmup.assert_called_once()
+    assert warmup.spy_return.established == 3
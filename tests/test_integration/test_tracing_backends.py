@@ -0,0 +1,64 @@
+import pytest
+from unihttp.clients.aiohttp import AiohttpAsyncClient
+from unihttp.clients.httpx import HTTPXAsyncClient
+from unihttp.clients.niquests import NiquestsAsyncClient
+from unihttp.method import BaseMethod
+from unihttp.serialize import RequestDumper, ResponseLoader
+from unihttp.tracing import Tracer
+
+
+class SimpleDumper(RequestDumper):
+    def dump(self, method):
+        return {"path": {}, "query": {}, "header": {}, "body": {}, "file": {}}
+
+
+class SimpleLoader(ResponseLoader):
+    def load(self, data, response_type):
+        return data
+
+
+class EchoMethod(BaseMethod[dict]):
+    __url__ = "/echo"
+    __method__ = "GET"
+
+
+class RecordingTracer(Tracer):
+    def __init__(self):
+        self.events = []
+
+    def on_request_start(self, request):
+        self.events.append("start")
+
+    def on_connection_acquired(self, request, reused):
+        self.events.append(("connection", reused))
+
+    def on_headers_received(self, request):
+        self.events.append("headers")
+
+    def on_body_complete(self, request, response):
+        self.events.append("complete")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("client_cls", "reuse"),
+    [
+        (HTTPXAsyncClient, [False, True]),
+        (AiohttpAsyncClient, [False, True]),
+        (NiquestsAsyncClient, [None, None]),
+    ],
+)
+async def test_tracer_events(integration_server, client_cls, reuse):
+    base_url = str(integration_server.make_url("/"))
+    tracer = RecordingTracer()
+
+    async with client_cls(base_url, SimpleDumper(), SimpleLoader()) as client:
+        client.tracer = tracer
+        await client.call_method(EchoMethod())
+        await client.call_method(EchoMethod())
+
+    first, second = reuse
+    assert tracer.events == [
+        "start", ("connection", first), "headers", "complete",
+        "start", ("connection", second), "headers", "complete",
+    ]